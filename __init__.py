@@ -28,59 +28,63 @@ __author__ = "Jit Roy"
 __email__ = "team@newsextractor.com"
 __description__ = "Professional news article extraction with advanced NLP"
 
-# Import core components
-try:
-    from .core.news_extractor import NewsExtractor
-    from .models.article import Article
-    from .utils.validators import URLValidator
-    from .utils.helpers import TextProcessor
-
-    # Try to import optional components
-    NewsSearcher = None
-    Translator = None
-    TrendingTopics = None
-
-    try:
-        from .core.trending import NewsSearcher
-
-        # Create backward compatibility alias
-        TrendingTopics = NewsSearcher
-    except ImportError:
-        pass
-
-    try:
-        from .core.translator import Translator
-    except ImportError:
-        pass
-
-    # Define what's available for import
-    __all__ = [
-        "NewsExtractor",
-        "Article",
-        "URLValidator",
-        "TextProcessor",
-        "extract_article",
-        "extract_keywords",
-        "__version__",
-        "__author__",
-        "__email__",
-        "__description__",
-    ]
-
-    # Add optional components if available
-    if NewsSearcher:
-        __all__.extend(["NewsSearcher", "TrendingTopics"])
-    if Translator:
-        __all__.append("Translator")
-
-except ImportError as e:
-    # Fallback for development/testing
-    import warnings
-
-    warnings.warn(f"Could not import all modules: {e}")
-
-    # Minimal fallback
-    __all__ = ["__version__", "__author__", "__email__", "__description__"]
+# Public names are resolved lazily on first access (PEP 562), so importing
+# the package does not pull in requests, lxml or the NLP stacks up front
+_LAZY_IMPORTS = {
+    "NewsExtractor": (".core.news_extractor", "NewsExtractor"),
+    "Article": (".models.article", "Article"),
+    "URLValidator": (".utils.validators", "URLValidator"),
+    "TextProcessor": (".utils.helpers", "TextProcessor"),
+}
+
+# Optional components resolve to None when their dependencies are missing
+_OPTIONAL_IMPORTS = {
+    "NewsSearcher": (".core.trending", "NewsSearcher"),
+    # Backward compatibility alias
+    "TrendingTopics": (".core.trending", "NewsSearcher"),
+    "Translator": (".core.translator", "Translator"),
+}
+
+# Define what's available for import
+__all__ = [
+    "NewsExtractor",
+    "Article",
+    "URLValidator",
+    "TextProcessor",
+    "NewsSearcher",
+    "TrendingTopics",
+    "Translator",
+    "extract_article",
+    "extract_keywords",
+    "__version__",
+    "__author__",
+    "__email__",
+    "__description__",
+]
+
+
+def __getattr__(name: str):
+    """Import public components on first access and cache them"""
+    import importlib
+
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    elif name in _OPTIONAL_IMPORTS:
+        module_name, attr = _OPTIONAL_IMPORTS[name]
+        try:
+            value = getattr(importlib.import_module(module_name, __name__), attr)
+        except ImportError:
+            value = None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 # Quick access functions for convenience
@@ -88,6 +92,10 @@ def extract_article(url: str, enable_nlp: bool = True):
     """
     Quick article extraction function for simple use cases
 
+    Extracts a single URL. For batches, create one NewsExtractor and call
+    its extract_many method so fetches run concurrently and the HTTP
+    session is reused.
+
     Args:
         url (str): Article URL to extract
         enable_nlp (bool): Whether to enable NLP processing
@@ -99,6 +107,8 @@ def extract_article(url: str, enable_nlp: bool = True):
         >>> article = extract_article("https://example.com/news/article")
         >>> print(article.title)
     """
+    from .core.news_extractor import NewsExtractor
+
     extractor = NewsExtractor(enable_nlp=enable_nlp)
     return extractor.extract_from_url(url)
 
@@ -118,4 +128,6 @@ def extract_keywords(text: str, max_keywords: int = 10):
         >>> keywords = extract_keywords("Your text content here")
         >>> print(keywords)
     """
+    from .utils.helpers import TextProcessor
+
     return TextProcessor.extract_keywords(text, max_keywords=max_keywords)
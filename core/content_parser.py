@@ -8,20 +8,16 @@ Supports multiple extraction methods including advanced text cleaning tools
 
 import logging
 import re
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+import threading
+from functools import lru_cache
+from typing import List, Dict, Optional, Union
+from lxml import etree  # Hard dependency: readability summaries are parsed with lxml
+from lxml import html as lxml_html
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urlparse
 
 from utils.selectors import ContentSelectors
 
-# Try to import lxml for better parsing performance
-try:
-    import lxml
-
-    LXML_AVAILABLE = True
-except ImportError:
-    LXML_AVAILABLE = False
-
 # Try to import advanced text extraction tools
 try:
     from boilerpy3 import extractors
@@ -44,6 +40,63 @@ try:
 except ImportError:
     TRAFILATURA_AVAILABLE = False
 
+# Advanced extraction backends, resolved once at import time
+_AVAILABLE_METHODS = tuple(
+    name
+    for name, available in (
+        ("boilerpy3", BOILERPY3_AVAILABLE),
+        ("readability", READABILITY_AVAILABLE),
+        ("trafilatura", TRAFILATURA_AVAILABLE),
+    )
+    if available
+)
+
+# Lines that look like navigation or boilerplate, matched in a single scan
+_SKIP_LINE_RE = re.compile(
+    r"click here|read more|share this|subscribe|newsletter|follow us|contact us"
+    r"|privacy policy|terms of service|cookies|advertisement",
+    re.IGNORECASE,
+)
+# Class/id fragments of elements that are not main content
+_SKIP_ATTR_RE = re.compile(
+    r"advertisement|ad-|sidebar|footer|header|navigation|menu|social|share|comment"
+    r"|related|recommended|trending|popular|newsletter|subscribe|privacy|cookie",
+    re.IGNORECASE,
+)
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+
+# bytes.translate deletion table that keeps only ASCII letters
+_ASCII_NON_ALPHA = bytes(
+    c for c in range(256) if not (0x41 <= c <= 0x5A or 0x61 <= c <= 0x7A)
+)
+
+
+def _count_alpha(text: str) -> int:
+    """Count alphabetic characters, with a C-level fast path for ASCII text"""
+    if text.isascii():
+        return len(text.encode("ascii").translate(None, _ASCII_NON_ALPHA))
+    return sum(map(str.isalpha, text))
+
+
+# lxml parser objects must not be shared between threads; each worker
+# thread keeps its own, without the id index readability output never needs
+_thread_local = threading.local()
+
+
+def _get_lxml_parser() -> lxml_html.HTMLParser:
+    """Return this thread's reusable lxml HTML parser"""
+    parser = getattr(_thread_local, "lxml_parser", None)
+    if parser is None:
+        parser = _thread_local.lxml_parser = lxml_html.HTMLParser(collect_ids=False)
+    return parser
+
+
+@lru_cache(maxsize=1024)
+def _get_domain(url: str) -> str:
+    """Return the network location of a URL, cached across articles"""
+    return urlparse(url).netloc
+
 
 class ContentParser:
     """
@@ -51,9 +104,29 @@ class ContentParser:
     Supports multiple extraction methods: custom, boilerpy3, readability, trafilatura
     """
 
+    # Meta tags come first: their content attribute is read without walking text
+    _TITLE_SELECTORS = (
+        'meta[property="og:title"]',
+        'meta[name="twitter:title"]',
+        "h1",
+        "title",
+        ".article-title",
+        ".post-title",
+        ".entry-title",
+    )
+
+    _SUMMARY_SELECTORS = (
+        'meta[property="og:description"]',
+        'meta[name="description"]',
+        ".article-summary",
+        ".excerpt",
+    )
+
+    # Set once the available backends have been logged for this process
+    _methods_logged = False
+
     def __init__(
         self,
-        use_lxml: bool = True,
         extraction_method: str = "auto",
         fallback_methods: bool = True,
     ):
@@ -61,7 +134,6 @@ class ContentParser:
         Initialize the content parser
 
         Args:
-            use_lxml (bool): Whether to use lxml parser if available
             extraction_method (str): Preferred extraction method
                                    ('auto', 'custom', 'boilerpy3', 'readability', 'trafilatura')
             fallback_methods (bool): Whether to try fallback methods if primary fails
@@ -71,85 +143,88 @@ class ContentParser:
         self.extraction_method = extraction_method
         self.fallback_methods = fallback_methods
 
-        # Determine which parser to use
-        if use_lxml and LXML_AVAILABLE:
-            self.parser = "lxml"
-            self.logger.debug("Using lxml parser for better performance")
-        else:
-            self.parser = "html.parser"
-            self.logger.debug("Using html.parser (lxml not available or disabled)")
+        # Build the boilerpy3 extractor once; it is opt-in and not used by 'auto'
+        self._boilerpy3_extractor = (
+            extractors.ArticleExtractor() if BOILERPY3_AVAILABLE else None
+        )
+
+        # The method order depends only on the flags above, so resolve it once
+        self._extraction_methods = tuple(self._build_extraction_methods())
 
         # Log available extraction methods
         self._log_available_methods()
 
     def _log_available_methods(self):
-        """Log which advanced extraction methods are available"""
-        methods = []
-        if BOILERPY3_AVAILABLE:
-            methods.append("boilerpy3")
-        if READABILITY_AVAILABLE:
-            methods.append("readability")
-        if TRAFILATURA_AVAILABLE:
-            methods.append("trafilatura")
-
-        if methods:
+        """Log which advanced extraction methods are available, once per process"""
+        if ContentParser._methods_logged:
+            return
+        ContentParser._methods_logged = True
+
+        if _AVAILABLE_METHODS:
             self.logger.debug(
-                f"Advanced extraction methods available: {', '.join(methods)}"
+                f"Advanced extraction methods available: {', '.join(_AVAILABLE_METHODS)}"
             )
         else:
             self.logger.debug(
                 "No advanced extraction methods available, using custom parser"
             )
 
-    def parse_article_data(self, html_content: str, url: str) -> Dict:
+    def parse_article_data(
+        self,
+        html_content: Union[str, bytes],
+        url: str,
+        tree: Optional[LexborHTMLParser] = None,
+    ) -> Dict:
         """
         Parse HTML content and extract article data with advanced text cleaning
 
         Args:
-            html_content (str): Raw HTML content
+            html_content (Union[str, bytes]): Raw HTML content; bytes are
+                decoded by the parsers from a BOM or <meta charset> only, so
+                fetched pages should go through http_client.decode_html to
+                honour a charset sent in the Content-Type header
             url (str): Original URL for context
+            tree (LexborHTMLParser, optional): Already parsed html_content, so
+                callers sharing one tree with MetadataExtractor parse the page
+                once. The tree stays owned by the caller and is not mutated.
 
         Returns:
             Dict: Extracted article data containing title, content, and metadata
         """
-        try:
-            soup = BeautifulSoup(html_content, self.parser)
-        except Exception as e:
-            # Fallback to html.parser if lxml fails
-            self.logger.warning(
-                f"Parser {self.parser} failed, falling back to html.parser: {e}"
-            )
-            soup = BeautifulSoup(html_content, "html.parser")
+        # Lexbor (C) parser - much faster than building a BeautifulSoup tree
+        if tree is None:
+            tree = LexborHTMLParser(html_content, encoding=True)
+
+        # Parse the URL once; the custom extractor hits the same cache entry
+        domain = _get_domain(url)
 
         # Extract content using the specified method
-        content = self._extract_content_advanced(html_content, url, soup)
+        content = self._extract_content_advanced(html_content, url, tree)
 
         return {
-            "title": self._extract_title(soup),
+            "title": self._extract_title(tree),
             "content": content,
-            "metadata": self._extract_basic_metadata(soup, url),
+            "metadata": self._extract_basic_metadata(tree, domain),
         }
 
     def _extract_content_advanced(
-        self, html_content: str, url: str, soup: BeautifulSoup
+        self, html_content: Union[str, bytes], url: str, tree: LexborHTMLParser
     ) -> str:
         """
         Extract content using advanced methods with fallbacks
 
         Args:
-            html_content (str): Raw HTML content
+            html_content (Union[str, bytes]): Raw HTML content
             url (str): Original URL
-            soup (BeautifulSoup): Parsed HTML
+            tree (LexborHTMLParser): Parsed HTML
 
         Returns:
             str: Extracted and cleaned content
         """
-        extraction_methods = self._get_extraction_methods()
-
-        for method_name, method_func in extraction_methods:
+        for method_name, method_func in self._extraction_methods:
             try:
                 self.logger.debug(f"Trying extraction method: {method_name}")
-                content = method_func(html_content, url, soup)
+                content = method_func(html_content, url, tree)
 
                 if content and len(content.strip()) > 100:  # Minimum content threshold
                     self.logger.debug(
@@ -167,18 +242,17 @@ class ContentParser:
         self.logger.warning("All extraction methods failed")
         return ""
 
-    def _get_extraction_methods(self) -> List[tuple]:
+    def _build_extraction_methods(self) -> List[tuple]:
         """Get list of extraction methods to try based on preferences"""
         methods = []
 
         if self.extraction_method == "auto":
             # Auto mode: try advanced methods first, then custom
+            # (boilerpy3 is opt-in via extraction_method="boilerpy3")
             if TRAFILATURA_AVAILABLE:
                 methods.append(("trafilatura", self._extract_with_trafilatura))
             if READABILITY_AVAILABLE:
                 methods.append(("readability", self._extract_with_readability))
-            if BOILERPY3_AVAILABLE:
-                methods.append(("boilerpy3", self._extract_with_boilerpy3))
             methods.append(("custom", self._extract_with_custom))
 
         elif self.extraction_method == "trafilatura" and TRAFILATURA_AVAILABLE:
@@ -201,58 +275,48 @@ class ContentParser:
 
         return methods
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree: LexborHTMLParser) -> str:
         """
         Extract article title using multiple selectors
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            tree (LexborHTMLParser): Parsed HTML content
 
         Returns:
             str: Extracted title
         """
-        title_selectors = [
-            "h1",
-            "title",
-            '[property="og:title"]',
-            '[name="twitter:title"]',
-            ".article-title",
-            ".post-title",
-            ".entry-title",
-        ]
-
-        for selector in title_selectors:
-            element = soup.select_one(selector)
+        for selector in self._TITLE_SELECTORS:
+            element = tree.css_first(selector)
             if element:
-                title = element.get_text(strip=True)
+                if element.tag == "meta":
+                    title = (element.attributes.get("content") or "").strip()
+                else:
+                    title = element.text(strip=True)
                 if title and len(title) > 10:  # Reasonable title length
                     return title
 
         return "Unknown Title"
 
-    def _extract_content(self, soup: BeautifulSoup, url: str = None) -> str:
+    def _extract_content(self, tree: LexborHTMLParser, url: str = None) -> str:
         """
         Extract main content from HTML
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            tree (LexborHTMLParser): Parsed HTML content
             url (str, optional): Original URL for domain-specific selectors
 
         Returns:
             str: Extracted and cleaned content
         """
         # Get domain for site-specific selectors
-        domain = None
-        if url:
-            parsed_url = urlparse(url)
-            domain = parsed_url.netloc
+        domain = _get_domain(url) if url else None
 
         # Get appropriate selectors for this domain
         selectors = self.content_selectors.get_selectors(domain)
 
         # Try each selector group until we find content
         for selector_group in selectors:
-            elements = soup.select(selector_group)
+            elements = tree.css(selector_group)
             if elements:
                 self.logger.debug(f"Found content using selector: {selector_group}")
                 return self._process_content_elements(elements)
@@ -264,7 +328,7 @@ class ContentParser:
         Process content elements into clean text
 
         Args:
-            elements (List): List of BeautifulSoup elements
+            elements (List): List of selectolax nodes
 
         Returns:
             str: Processed and cleaned content
@@ -272,108 +336,81 @@ class ContentParser:
         content_parts = []
 
         for element in elements:
-            # Skip if element is likely not main content
-            if self._should_skip_element(element):
+            # Walk the subtree once and apply the cheapest check first
+            text = element.text(strip=True)
+            if len(text) <= 20:  # Minimum content length
                 continue
 
-            text = element.get_text(strip=True)
-
-            # Use enhanced exclusion logic from selectors
-            if self.content_selectors.should_exclude_content(text):
+            # Skip if element is likely not main content
+            if self._should_skip_element(element, text):
                 continue
 
-            if text and len(text) > 20:  # Minimum content length
-                # Add header formatting for headings
-                if self.content_selectors.is_likely_header(element.name):
-                    text = f"[{element.name.upper()}] {text}"
+            # Add header formatting for headings
+            if self.content_selectors.is_likely_header(element.tag):
+                text = f"[{element.tag.upper()}] {text}"
 
-                content_parts.append(text)
+            content_parts.append(text)
 
         return "\n\n".join(content_parts)
 
-    def _extract_basic_metadata(self, soup: BeautifulSoup, url: str) -> Dict:
+    def _extract_basic_metadata(self, tree: LexborHTMLParser, domain: str) -> Dict:
         """
         Extract basic metadata that doesn't require specialized handling
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
-            url (str): Original URL
+            tree (LexborHTMLParser): Parsed HTML content
+            domain (str): Network location of the original URL
 
         Returns:
             Dict: Basic metadata
         """
         metadata = {}
 
-        # Extract source from URL
-        parsed_url = urlparse(url)
-        metadata["source"] = parsed_url.netloc
+        # Source is the site the article came from
+        metadata["source"] = domain
 
         # Extract summary/description
-        summary_selectors = [
-            '[property="og:description"]',
-            '[name="description"]',
-            ".article-summary",
-            ".excerpt",
-        ]
-
-        for selector in summary_selectors:
-            element = soup.select_one(selector)
+        for selector in self._SUMMARY_SELECTORS:
+            element = tree.css_first(selector)
             if element:
-                summary = element.get("content") or element.get_text(strip=True)
+                if element.tag == "meta":
+                    summary = element.attributes.get("content")
+                else:
+                    summary = element.text(strip=True)
                 if summary:
                     metadata["summary"] = summary
                     break
 
         return metadata
 
-    def _should_skip_element(self, element) -> bool:
+    def _should_skip_element(self, element, text: Optional[str] = None) -> bool:
         """
         Check if element should be skipped based on HTML attributes and content
 
         Args:
-            element: BeautifulSoup element
+            element: selectolax node
+            text (str, optional): Element text if the caller already extracted it
 
         Returns:
             bool: True if element should be skipped
         """
-        # Skip elements with certain classes or IDs
-        skip_patterns = [
-            "advertisement",
-            "ad-",
-            "sidebar",
-            "footer",
-            "header",
-            "navigation",
-            "menu",
-            "social",
-            "share",
-            "comment",
-            "related",
-            "recommended",
-            "trending",
-            "popular",
-            "newsletter",
-            "subscribe",
-            "privacy",
-            "cookie",
-        ]
-
-        element_classes = " ".join(element.get("class", []))
-        element_id = element.get("id", "")
-
-        for pattern in skip_patterns:
-            if pattern in element_classes.lower() or pattern in element_id.lower():
-                return True
+        # Skip elements with certain classes or IDs (no pattern contains a
+        # space, so joining the two attributes cannot create false matches)
+        attributes = element.attributes
+        attr_text = f"{attributes.get('class') or ''} {attributes.get('id') or ''}"
+        if _SKIP_ATTR_RE.search(attr_text):
+            return True
 
         # Skip if element text content suggests it's not main content
-        text = element.get_text(strip=True)
+        if text is None:
+            text = element.text(strip=True)
         if self.content_selectors.should_exclude_content(text):
             return True
 
         return False
 
     def _extract_with_trafilatura(
-        self, html_content: str, url: str, soup: BeautifulSoup
+        self, html_content: Union[str, bytes], url: str, tree: LexborHTMLParser
     ) -> str:
         """Extract content using trafilatura"""
         if not TRAFILATURA_AVAILABLE:
@@ -390,7 +427,7 @@ class ContentParser:
         return content or ""
 
     def _extract_with_readability(
-        self, html_content: str, url: str, soup: BeautifulSoup
+        self, html_content: Union[str, bytes], url: str, tree: LexborHTMLParser
     ) -> str:
         """Extract content using readability-lxml"""
         if not READABILITY_AVAILABLE:
@@ -400,43 +437,35 @@ class ContentParser:
         doc = Document(html_content)
         content_html = doc.summary()
 
-        # Parse the cleaned HTML to extract text
-        content_soup = BeautifulSoup(content_html, self.parser)
-        return content_soup.get_text(separator="\n\n", strip=True)
+        # The summary is a small fragment; parse it straight into lxml
+        # rather than building a BeautifulSoup tree on top of it
+        try:
+            root = lxml_html.fromstring(content_html, parser=_get_lxml_parser())
+        except etree.ParserError:
+            return ""  # Empty summary
+        return "\n\n".join(
+            text for text in (node.strip() for node in root.itertext()) if text
+        )
 
     def _extract_with_boilerpy3(
-        self, html_content: str, url: str, soup: BeautifulSoup
+        self, html_content: Union[str, bytes], url: str, tree: LexborHTMLParser
     ) -> str:
         """Extract content using boilerpy3"""
         if not BOILERPY3_AVAILABLE:
             raise ImportError("boilerpy3 not available")
 
-        # Try different boilerpy3 extractors
-        extractors_to_try = [
-            extractors.ArticleExtractor(),
-            extractors.DefaultExtractor(),
-            extractors.LargestContentExtractor(),
-            extractors.CanolaExtractor(),
-        ]
+        # boilerpy3 only accepts text; reuse the decoded document from the tree
+        if isinstance(html_content, bytes):
+            html_content = tree.html
 
-        for extractor in extractors_to_try:
-            try:
-                content = extractor.get_content(html_content)
-                if content and len(content.strip()) > 100:
-                    return content
-            except Exception as e:
-                self.logger.debug(
-                    f"Boilerpy3 extractor {extractor.__class__.__name__} failed: {e}"
-                )
-                continue
-
-        return ""
+        content = self._boilerpy3_extractor.get_content(html_content)
+        return content or ""
 
     def _extract_with_custom(
-        self, html_content: str, url: str, soup: BeautifulSoup
+        self, html_content: Union[str, bytes], url: str, tree: LexborHTMLParser
     ) -> str:
         """Extract content using custom method (original implementation)"""
-        return self._extract_content(soup, url)
+        return self._extract_content(tree, url)
 
     def _clean_extracted_content(self, content: str) -> str:
         """
@@ -467,26 +496,11 @@ class ContentParser:
                 continue
 
             # Skip lines that look like navigation or boilerplate
-            skip_patterns = [
-                "click here",
-                "read more",
-                "share this",
-                "subscribe",
-                "newsletter",
-                "follow us",
-                "contact us",
-                "privacy policy",
-                "terms of service",
-                "cookies",
-                "advertisement",
-            ]
-
-            line_lower = line.lower()
-            if any(pattern in line_lower for pattern in skip_patterns):
+            if _SKIP_LINE_RE.search(line):
                 continue
 
             # Skip lines that are mostly punctuation or numbers
-            alpha_chars = sum(1 for c in line if c.isalpha())
+            alpha_chars = _count_alpha(line)
             if alpha_chars < len(line) * 0.5:  # Less than 50% alphabetic characters
                 continue
 
@@ -496,7 +510,7 @@ class ContentParser:
         cleaned_content = "\n\n".join(cleaned_lines)
 
         # Remove excessive whitespace
-        cleaned_content = re.sub(r"\n{3,}", "\n\n", cleaned_content)
-        cleaned_content = re.sub(r" {2,}", " ", cleaned_content)
+        cleaned_content = _MULTI_NEWLINE_RE.sub("\n\n", cleaned_content)
+        cleaned_content = _MULTI_SPACE_RE.sub(" ", cleaned_content)
 
         return cleaned_content.strip()
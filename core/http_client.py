@@ -6,10 +6,20 @@ Handles all HTTP requests with retry logic and error handling
 Supports both requests and httpx libraries
 """
 
+import asyncio
+import codecs
+import random
 import requests
 import time
 import logging
-from typing import Dict, Optional, Union
+from collections import defaultdict
+from contextlib import nullcontext
+from email.message import Message
+from types import MappingProxyType
+from typing import Dict, List, Optional, Union
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from utils.exceptions import ExtractionError
 
 # Try to import httpx for additional HTTP client support
@@ -20,6 +30,50 @@ try:
 except ImportError:
     HTTPX_AVAILABLE = False
 
+# HTTP/2 support in httpx needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Byte order marks take precedence over any declared charset
+_BOMS = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+
+def decode_html(
+    response: Union[requests.Response, "httpx.Response"],
+) -> Union[str, bytes]:
+    """
+    Decode a page body with the charset from its Content-Type header
+
+    The HTML parsers only see a BOM or <meta charset>, so a charset sent
+    only in the HTTP header is applied here. Without a header charset (or
+    with a BOM) the raw bytes are returned for the parser to sniff.
+
+    Args:
+        response (Union[requests.Response, httpx.Response]): Fetched page
+
+    Returns:
+        Union[str, bytes]: Decoded HTML, or the raw body
+    """
+    body = response.content
+    content_type = response.headers.get("content-type")
+    if not content_type or body.startswith(_BOMS):
+        return body
+
+    header = Message()
+    header["content-type"] = content_type
+    charset = header.get_content_charset()
+    if not charset:
+        return body
+
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        return body
+
 
 class HTTPClient:
     """
@@ -27,6 +81,12 @@ class HTTPClient:
     Supports both requests and httpx libraries
     """
 
+    # Upper bound in seconds for a single retry backoff sleep
+    MAX_BACKOFF = 10
+
+    # Connections kept alive per host by the requests session
+    DEFAULT_POOL_SIZE = 32
+
     def __init__(
         self,
         request_timeout: int = 30,
@@ -48,7 +108,7 @@ class HTTPClient:
         self.use_httpx = use_httpx and HTTPX_AVAILABLE
 
         # Setup default headers
-        self.headers = {
+        headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
@@ -58,10 +118,75 @@ class HTTPClient:
         }
 
         if custom_headers:
-            self.headers.update(custom_headers)
+            headers.update(custom_headers)
+
+        # Read-only view: headers are installed on the clients once below
+        self.headers = MappingProxyType(headers)
 
         self.logger = logging.getLogger(__name__)
 
+        # Persistent session so keep-alive connections are reused across
+        # requests; urllib3 handles retries and jittered, capped backoff
+        self._retry = Retry(
+            total=max(self.max_retries - 1, 0),
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            backoff_max=self.MAX_BACKOFF,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        )
+        self._pool_size = 0
+        self._session = requests.Session()
+        self.ensure_pool_size(self.DEFAULT_POOL_SIZE)
+        self._session.headers.update(self.headers)
+
+        # Long-lived httpx client; HTTP/2 multiplexes same-host requests
+        # over one connection when h2 is installed
+        self._httpx_client = self._create_httpx_client() if self.use_httpx else None
+
+    def _create_httpx_client(self) -> "httpx.Client":
+        """Create the shared httpx client with pooled connections"""
+        return httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            timeout=self.request_timeout,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        )
+
+    def ensure_pool_size(self, size: int):
+        """
+        Grow the session's per-host connection pool to at least size
+
+        Callers fanning out over a thread pool should pass their worker
+        count so no thread has to open (and then discard) an extra
+        connection. The pool never shrinks.
+
+        Args:
+            size (int): Minimum number of pooled connections per host
+        """
+        if size <= self._pool_size:
+            return
+
+        previous = self._session.adapters.get("https://")
+        adapter = HTTPAdapter(
+            pool_connections=size, pool_maxsize=size, max_retries=self._retry
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._pool_size = size
+
+        # Release the old pool's idle sockets now rather than at garbage
+        # collection; connections still in use are closed when returned
+        if previous is not None:
+            previous.close()
+
+    def close(self):
+        """Close pooled connections held by the underlying clients"""
+        self._session.close()
+        if self._httpx_client is not None:
+            self._httpx_client.close()
+            self._httpx_client = None
+
     def fetch_url(self, url: str) -> Union[requests.Response, "httpx.Response"]:
         """
         Fetch URL with retry logic and exponential backoff
@@ -81,49 +206,126 @@ class HTTPClient:
             return self._fetch_with_requests(url)
 
     def _fetch_with_requests(self, url: str) -> requests.Response:
-        """Fetch URL using requests library"""
+        """Fetch URL using the pooled requests session"""
+        try:
+            response = self._session.get(
+                url, timeout=self.request_timeout, allow_redirects=True
+            )
+            response.raise_for_status()
+            return response
+
+        except requests.exceptions.RequestException as e:
+            raise ExtractionError(
+                f"Failed to fetch URL after {self.max_retries} attempts: {str(e)}"
+            )
+
+    def _fetch_with_httpx(self, url: str) -> "httpx.Response":
+        """Fetch URL using httpx library"""
+        if not HTTPX_AVAILABLE:
+            raise ExtractionError("httpx library is not available")
+
+        if self._httpx_client is None:
+            self._httpx_client = self._create_httpx_client()
+
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(
-                    url,
-                    headers=self.headers,
-                    timeout=self.request_timeout,
-                    allow_redirects=True,
-                )
+                response = self._httpx_client.get(url, follow_redirects=True)
                 response.raise_for_status()
                 return response
 
-            except requests.exceptions.RequestException as e:
+            except httpx.RequestError as e:
                 if attempt == self.max_retries - 1:
                     raise ExtractionError(
                         f"Failed to fetch URL after {self.max_retries} attempts: {str(e)}"
                     )
 
                 self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {str(e)}")
-                time.sleep(2**attempt)  # Exponential backoff
+                # Full-jitter exponential backoff, capped
+                time.sleep(min(self.MAX_BACKOFF, (2**attempt) * random.random()))
 
-    def _fetch_with_httpx(self, url: str) -> "httpx.Response":
-        """Fetch URL using httpx library"""
+    async def fetch_many(
+        self, urls: List[str], concurrency: int = 20, per_host: Optional[int] = None
+    ) -> List[Union["httpx.Response", Exception]]:
+        """
+        Fetch many URLs concurrently with bounded concurrency
+
+        Args:
+            urls (List[str]): URLs to fetch
+            concurrency (int): Maximum number of requests in flight
+            per_host (int, optional): Maximum number of requests in flight to
+                any single host; unlimited when None
+
+        Returns:
+            List[Union[httpx.Response, Exception]]: One entry per URL, in input
+                order; failed fetches are returned as exceptions
+
+        Raises:
+            ExtractionError: If httpx is not available
+        """
         if not HTTPX_AVAILABLE:
-            raise ExtractionError("httpx library is not available")
+            raise ExtractionError("httpx library is required for fetch_many")
 
-        for attempt in range(self.max_retries):
-            try:
-                with httpx.Client(timeout=self.request_timeout) as client:
-                    response = client.get(
-                        url, headers=self.headers, follow_redirects=True
-                    )
+        semaphore = asyncio.Semaphore(concurrency)
+        host_semaphores = (
+            defaultdict(lambda: asyncio.Semaphore(per_host)) if per_host else None
+        )
+
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=self.request_timeout,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=concurrency),
+        ) as client:
+
+            async def fetch_one(url: str) -> "httpx.Response":
+                # Wait for the host slot first so a busy host does not hold
+                # global slots other hosts could use
+                host_slot = (
+                    host_semaphores[urlparse(url).netloc]
+                    if host_semaphores is not None
+                    else nullcontext()
+                )
+                async with host_slot, semaphore:
+                    response = await client.get(url, follow_redirects=True)
                     response.raise_for_status()
                     return response
 
-            except httpx.RequestError as e:
-                if attempt == self.max_retries - 1:
-                    raise ExtractionError(
-                        f"Failed to fetch URL after {self.max_retries} attempts: {str(e)}"
-                    )
+            return await asyncio.gather(
+                *(fetch_one(url) for url in urls), return_exceptions=True
+            )
 
-                self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {str(e)}")
-                time.sleep(2**attempt)  # Exponential backoff
+    def fetch_stream(self, url: str) -> requests.Response:
+        """
+        Open a streaming GET request on the pooled session
+
+        The body is not read; callers consume response.raw incrementally and
+        must close the response (it is a context manager) to release the
+        connection.
+
+        Args:
+            url (str): URL to fetch
+
+        Returns:
+            requests.Response: Response with an unread, decompressing body
+
+        Raises:
+            ExtractionError: If the request fails
+        """
+        try:
+            response = self._session.get(
+                url, timeout=self.request_timeout, allow_redirects=True, stream=True
+            )
+        except requests.exceptions.RequestException as e:
+            raise ExtractionError(f"Failed to fetch URL: {str(e)}")
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            response.close()
+            raise ExtractionError(f"Failed to fetch URL: {str(e)}")
+
+        response.raw.decode_content = True
+        return response
 
     def fetch_head(self, url: str, timeout: int = 10) -> requests.Response:
         """
@@ -137,7 +339,7 @@ class HTTPClient:
             requests.Response: HTTP response with headers only
         """
         try:
-            return requests.head(url, headers=self.headers, timeout=timeout)
+            return self._session.head(url, timeout=timeout)
         except requests.exceptions.RequestException as e:
             self.logger.debug(f"HEAD request failed for {url}: {e}")
             raise
@@ -5,24 +5,46 @@ Language Processing Module
 Handles language detection and translation for extracted content
 """
 
+import asyncio
 import logging
-from typing import Dict, Optional
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional
 from core.translator import Translator
 
 
+def _normalize_lang(code: str) -> str:
+    """Reduce a language tag such as 'en-US' or 'en_GB' to its base code"""
+    return code.split("-")[0].split("_")[0].lower()
+
+
+# Sentence boundaries used when a single paragraph exceeds the request limit
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
 class LanguageProcessor:
     """
     Professional language processing with detection and translation capabilities
     """
 
-    def __init__(self, target_language: Optional[str] = None):
+    # Longer texts are split into chunks of at most this many characters
+    _MAX_CHUNK_CHARS = 4500
+
+    def __init__(self, target_language: Optional[str] = None, detect_only: bool = True):
         """
         Initialize the language processor
 
         Args:
             target_language (str, optional): Target language for translation
+            detect_only (bool): Whether to detect the language even when no
+                target language is set; disable to skip detection entirely
+                for extraction-only workloads
         """
         self.target_language = target_language
+        self._target_norm = (
+            _normalize_lang(target_language) if target_language else None
+        )
+        self.detect_only = detect_only
         self.translator = Translator()  # Always initialize for detection
         self.logger = logging.getLogger(__name__)
 
@@ -36,7 +58,12 @@ class LanguageProcessor:
         Returns:
             Dict: Processed article data with language info and translations
         """
-        # Always detect language
+        # Nothing downstream needs the language if we neither translate nor report it
+        if self.target_language is None and not self.detect_only:
+            article_data["language"] = "unknown"
+            article_data["translated"] = False
+            return article_data
+
         detected_language = self._detect_language(article_data)
         article_data["language"] = detected_language
 
@@ -44,7 +71,7 @@ class LanguageProcessor:
         if (
             self.target_language
             and detected_language != "unknown"
-            and detected_language != self.target_language
+            and _normalize_lang(detected_language) != self._target_norm
         ):
             article_data = self._translate_content(article_data, detected_language)
         else:
@@ -52,6 +79,75 @@ class LanguageProcessor:
 
         return article_data
 
+    def process_contents(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Process several articles, translating them together
+
+        Languages are detected per article; every field that needs
+        translation from the same source language goes to the translator in
+        one batched call, which packs the fields into as few provider
+        requests as the payload limit allows.
+
+        Args:
+            articles (List[Dict]): Article data dictionaries
+
+        Returns:
+            List[Dict]: Processed article data, in input order
+        """
+        if self.target_language is None and not self.detect_only:
+            return [self.process_content(article_data) for article_data in articles]
+
+        by_source = defaultdict(list)
+        for article_data in articles:
+            detected_language = self._detect_language(article_data)
+            article_data["language"] = detected_language
+            article_data["translated"] = False
+
+            if (
+                self.target_language
+                and detected_language != "unknown"
+                and _normalize_lang(detected_language) != self._target_norm
+            ):
+                by_source[detected_language].append(article_data)
+
+        for source_language, group in by_source.items():
+            self._translate_contents(group, source_language)
+
+        return articles
+
+    async def process_content_async(self, article_data: Dict) -> Dict:
+        """
+        Process article content without blocking the event loop
+
+        Args:
+            article_data (Dict): Article data dictionary
+
+        Returns:
+            Dict: Processed article data with language info and translations
+        """
+        return await asyncio.to_thread(self.process_content, article_data)
+
+    async def process_batch(
+        self, articles: List[Dict], concurrency: int = 16
+    ) -> List[Dict]:
+        """
+        Process many articles with overlapping translation requests
+
+        Args:
+            articles (List[Dict]): Article data dictionaries
+            concurrency (int): Maximum number of articles processed at once
+
+        Returns:
+            List[Dict]: Processed article data, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process_one(article_data: Dict) -> Dict:
+            async with semaphore:
+                return await self.process_content_async(article_data)
+
+        return await asyncio.gather(*(process_one(a) for a in articles))
+
     def _detect_language(self, article_data: Dict) -> str:
         """
         Detect the language of the article content
@@ -82,6 +178,105 @@ class LanguageProcessor:
             self.logger.warning(f"Language detection failed: {e}")
             return "unknown"
 
+    def _translate_fields(self, texts: List[str], source_language: str) -> List[str]:
+        """
+        Translate several article fields, in as few requests as they fit
+
+        Args:
+            texts (List[str]): Non-empty texts to translate
+            source_language (str): Source language code
+
+        Returns:
+            List[str]: Translated texts, one per input
+        """
+        results = [None] * len(texts)
+
+        # Texts over the per-request limit are chunked and translated alone
+        short = []
+        for index, text in enumerate(texts):
+            if len(text) > self._MAX_CHUNK_CHARS:
+                results[index] = self._translate_long(text, source_language)
+            else:
+                short.append(index)
+
+        # The translator packs the rest into as few requests as fit
+        if short:
+            translated = self.translator.translate_batch(
+                [texts[index] for index in short],
+                target_lang=self.target_language,
+                source_lang=source_language,
+            )
+            for index, text in zip(short, translated):
+                results[index] = text
+
+        return results
+
+    def _translate_long(self, text: str, source_language: str) -> str:
+        """
+        Translate text over the request limit in concurrent chunks
+
+        Args:
+            text (str): Text to translate
+            source_language (str): Source language code
+
+        Returns:
+            str: Translated text with paragraph breaks preserved
+        """
+        chunks = self._chunk_text(text, self._MAX_CHUNK_CHARS)
+        self.logger.debug(
+            f"Content is long ({len(text)} chars), translating in {len(chunks)} chunks"
+        )
+
+        # Chunks are translated concurrently, and repeats hit the cache
+        translated = self.translator.translate_batch(
+            chunks, target_lang=self.target_language, source_lang=source_language
+        )
+        return "\n\n".join(translated)
+
+    @staticmethod
+    def _chunk_text(text: str, max_chars: int) -> List[str]:
+        """
+        Greedily pack paragraphs into chunks of at most max_chars
+
+        Paragraphs are never split unless a single paragraph is too long,
+        in which case it is split between sentences (and, for a runaway
+        sentence, at max_chars).
+
+        Args:
+            text (str): Text to split
+            max_chars (int): Maximum chunk length
+
+        Returns:
+            List[str]: Chunks that join back with blank lines
+        """
+        pieces = []
+        for paragraph in text.split("\n\n"):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if len(paragraph) <= max_chars:
+                pieces.append((paragraph, "\n\n"))
+                continue
+            for sentence in _SENTENCE_SPLIT_RE.split(paragraph):
+                for start in range(0, len(sentence), max_chars):
+                    pieces.append((sentence[start : start + max_chars], " "))
+            # The paragraph's last piece is followed by a paragraph break
+            pieces[-1] = (pieces[-1][0], "\n\n")
+
+        chunks = []
+        current = ""
+        joiner = ""
+        for piece, next_joiner in pieces:
+            if current and len(current) + len(joiner) + len(piece) > max_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current}{joiner}{piece}" if current else piece
+            joiner = next_joiner
+        if current:
+            chunks.append(current)
+
+        return chunks
+
     def _translate_content(self, article_data: Dict, source_language: str) -> Dict:
         """
         Translate article content to target language
@@ -93,65 +288,54 @@ class LanguageProcessor:
         Returns:
             Dict: Article data with translated content
         """
+        self._translate_contents([article_data], source_language)
+        return article_data
+
+    def _translate_contents(self, articles: List[Dict], source_language: str):
+        """
+        Translate the title, content and summary of articles in one batch
+
+        Args:
+            articles (List[Dict]): Article data dictionaries, updated in place
+            source_language (str): Source language code shared by the articles
+        """
         try:
             self.logger.info(
-                f"Translating content from {source_language} to {self.target_language}"
+                f"Translating {len(articles)} article(s) from {source_language} to {self.target_language}"
             )
 
-            translated = False
+            fields = [
+                (article_data, key, article_data[key])
+                for article_data in articles
+                for key in ("title", "content", "summary")
+                if article_data.get(key, "")
+            ]
 
-            # Translate title
-            title = article_data.get("title", "")
-            if title:
-                translated_title = self.translator.translate(
-                    title, target_lang=self.target_language
-                )
-                if translated_title and translated_title != title:
-                    article_data["title"] = translated_title
-                    translated = True
-                    self.logger.debug("Title translated successfully")
-
-            # Translate content
-            content = article_data.get("content", "")
-            if content:
-                # Check content length - some translation services have limits
-                if len(content) > 5000:
-                    self.logger.warning(
-                        f"Content is long ({len(content)} chars), translation may fail"
-                    )
-
-                translated_content = self.translator.translate(
-                    content, target_lang=self.target_language
-                )
-                if translated_content and translated_content != content:
-                    article_data["content"] = translated_content
-                    translated = True
-                    self.logger.debug("Content translated successfully")
-
-            # Translate summary if available
-            summary = article_data.get("summary", "")
-            if summary:
-                translated_summary = self.translator.translate(
-                    summary, target_lang=self.target_language
-                )
-                if translated_summary and translated_summary != summary:
-                    article_data["summary"] = translated_summary
-                    translated = True
+            translations = self._translate_fields(
+                [text for _, _, text in fields], source_language
+            )
 
-            article_data["translated"] = translated
+            for article_data in articles:
+                article_data["translated"] = False
+            for (article_data, key, original), translated_text in zip(
+                fields, translations
+            ):
+                if translated_text and translated_text.strip() != original.strip():
+                    article_data[key] = translated_text
+                    article_data["translated"] = True
+                    self.logger.debug(f"{key.capitalize()} translated successfully")
 
+            translated = sum(article_data["translated"] for article_data in articles)
             if translated:
                 self.logger.info(
-                    f"Successfully translated content from {source_language} to {self.target_language}"
+                    f"Successfully translated {translated} article(s) from {source_language} to {self.target_language}"
                 )
             else:
                 self.logger.warning("Translation did not modify any content")
 
-            return article_data
-
         except Exception as e:
             self.logger.error(f"Translation failed: {type(e).__name__}: {e}")
             self.logger.debug("Translation error details", exc_info=True)
-            # Return original content if translation fails
-            article_data["translated"] = False
-            return article_data
+            # Keep original content if translation fails
+            for article_data in articles:
+                article_data["translated"] = False
@@ -5,10 +5,39 @@ Metadata Extractor Module
 Specialized module for extracting metadata from HTML content
 """
 
+import json
 import logging
-from typing import Dict, List
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from bs4 import BeautifulSoup
-from urllib.parse import urlparse
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from urllib.parse import urljoin, urlparse
+
+# Try to import orjson for faster JSON-LD decoding
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except covers both
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Substrings of src/alt that mark non-content images (logos, trackers, ads)
+_IMAGE_SKIP_RE = re.compile(
+    r"logo|icon|avatar|profile|social|share|advertisement|ad-|banner|placeholder"
+    r"|spacer|tracking|pixel|1x1|transparent",
+    re.IGNORECASE,
+)
+
+
+def _extract_metadata_worker(job: Tuple[str, str, bool]) -> Dict:
+    """Process-pool entry point: extract metadata for one (html, url) pair"""
+    html_content, url, extract_all_images = job
+    return MetadataExtractor(extract_all_images).extract_metadata(html_content, url)
 
 
 class MetadataExtractor:
@@ -16,258 +45,434 @@ class MetadataExtractor:
     Professional metadata extractor for news articles
     """
 
-    def __init__(self):
-        """Initialize the metadata extractor"""
+    # Priority-ordered selectors; the first selector with a usable match wins
+    _AUTHOR_SELECTORS = (
+        '[rel="author"]',
+        '[property="article:author"]',
+        '[name="author"]',
+        ".author",
+        ".byline",
+        ".writer-name",
+        ".article-author",
+        ".post-author",
+    )
+
+    _DATE_SELECTORS = (
+        '[property="article:published_time"]',
+        '[property="og:published_time"]',
+        '[name="article:published_time"]',
+        "time[datetime]",
+        ".publish-date",
+        ".date",
+        ".published-date",
+        ".article-date",
+    )
+
+    _SUMMARY_SELECTORS = (
+        '[property="og:description"]',
+        '[name="description"]',
+        '[name="twitter:description"]',
+        ".article-summary",
+        ".excerpt",
+        ".article-excerpt",
+        ".post-excerpt",
+    )
+
+    # Featured image selectors (CMS-specific)
+    _FEATURED_IMAGE_SELECTORS = (
+        ".featured-image img",
+        ".post-thumbnail img",
+        ".article-image img",
+        ".hero-image img",
+        ".wp-post-image",
+        ".entry-featured-image img",
+        ".article-featured-image img",
+    )
+
+    _TAG_SELECTORS = (
+        ".tags a",
+        ".post-tags a",
+        ".article-tags a",
+        ".tag-links a",
+        ".entry-tags a",
+        ".category-tags a",
+        ".tags span",
+        ".post-tags span",
+        ".article-tags span",
+        ".wp-tag-cloud a",
+        ".tag-list a",
+        ".hashtags a",
+    )
+
+    # Limit tags to avoid spam
+    _MAX_TAGS = 10
+
+    # Realistic pages carry only a handful of JSON-LD blocks
+    _MAX_JSONLD_SCRIPTS = 10
+
+    def __init__(self, extract_all_images: bool = True):
+        """
+        Initialize the metadata extractor
+
+        Args:
+            extract_all_images (bool): Whether to collect every article image
+                into image_urls; when False and the page declares an
+                OpenGraph/Twitter/JSON-LD image, only that image is returned
+                and the body images are never scanned
+        """
+        self.extract_all_images = extract_all_images
         self.logger = logging.getLogger(__name__)
 
-    def extract_metadata(self, soup: BeautifulSoup, url: str) -> Dict:
+    def extract_metadata(
+        self,
+        document: Union[str, bytes, LexborHTMLParser, BeautifulSoup],
+        url: str,
+    ) -> Dict:
         """
         Extract comprehensive metadata from HTML content
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            document (Union[str, bytes, LexborHTMLParser, BeautifulSoup]): Raw
+                HTML or an already parsed Lexbor tree; BeautifulSoup objects
+                are still accepted and are re-parsed with Lexbor. A passed
+                tree stays owned by the caller and is only read, so it can
+                be shared with ContentParser.parse_article_data
             url (str): Original URL
 
         Returns:
             Dict: Extracted metadata
         """
+        if isinstance(document, LexborHTMLParser):
+            tree = document
+        elif isinstance(document, BeautifulSoup):
+            tree = LexborHTMLParser(str(document))
+        else:
+            tree = LexborHTMLParser(document, encoding=True)
+
         metadata = {}
 
+        # Collect meta tags, link rels and JSON-LD scripts in one tree walk
+        head = self._index_document(tree)
+
         # Extract source
         parsed_url = urlparse(url)
         metadata["source"] = parsed_url.netloc
 
         # Extract author
-        metadata["author"] = self._extract_author(soup)
+        metadata["author"] = self._extract_author(tree)
 
         # Extract published date
-        metadata["published_date"] = self._extract_published_date(soup)
+        metadata["published_date"] = self._extract_published_date(tree)
 
         # Extract summary/description
-        metadata["summary"] = self._extract_summary(soup)
+        metadata["summary"] = self._extract_summary(tree)
 
         # Extract top image
-        metadata["top_image"] = self._extract_top_image(soup, url)
+        metadata["top_image"] = self._extract_top_image(tree, url, head)
 
         # Extract additional OpenGraph metadata
-        metadata.update(self._extract_opengraph_metadata(soup))
+        metadata.update(self._extract_opengraph_metadata(head))
 
         # Extract Twitter Card metadata
-        metadata.update(self._extract_twitter_metadata(soup))
+        metadata.update(self._extract_twitter_metadata(head))
 
         # Extract JSON-LD structured data
-        metadata.update(self._extract_jsonld_metadata(soup))
+        metadata.update(self._extract_jsonld_metadata(head))
 
         # New metadata extraction
-        metadata["category"] = self._extract_category(soup)
+        metadata["category"] = self._extract_category(tree, head)
         metadata["publication_name"] = self._extract_publication_name(
-            soup, metadata.get("source")
+            head, metadata.get("source")
+        )
+        metadata["meta_description"] = self._extract_meta_description(head)
+        metadata["meta_keywords"] = self._extract_meta_keywords(head)
+        metadata["tags"] = self._extract_tags(tree, metadata, head)
+        metadata["canonical_link"] = self._extract_canonical_link(head)
+        # Locate the article body once for the image, video and link helpers
+        article_body = self._find_article_body(tree)
+        meta_image = (
+            None if self.extract_all_images else self._extract_meta_image(head, url)
+        )
+        metadata["image_urls"] = (
+            [meta_image] if meta_image else self._extract_image_urls(article_body)
         )
-        metadata["meta_description"] = self._extract_meta_description(soup)
-        metadata["meta_keywords"] = self._extract_meta_keywords(soup)
-        metadata["tags"] = self._extract_tags(soup, metadata)  # Add tags extraction
-        metadata["canonical_link"] = self._extract_canonical_link(soup)
-        metadata["image_urls"] = self._extract_image_urls(soup)
-        metadata["video_urls"] = self._extract_video_urls(soup)
-        metadata["links"] = self._extract_links(soup, url)
-        metadata["is_paywalled"] = self._extract_is_paywalled(soup)
+        metadata["video_urls"] = self._extract_video_urls(article_body or tree)
+        metadata["links"] = self._extract_links(article_body, url)
+        metadata["is_paywalled"] = self._extract_is_paywalled(tree)
 
         return metadata
 
-    def _extract_author(self, soup: BeautifulSoup) -> str:
+    def extract_metadata_batch(
+        self,
+        items: List[Tuple[Union[str, bytes], str]],
+        max_workers: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Extract metadata for many pages in parallel worker processes
+
+        Parsing and selector matching are CPU-bound, so separate processes
+        scale across cores where threads would contend for the GIL.
+
+        Args:
+            items (List[Tuple[Union[str, bytes], str]]): (raw HTML, URL) pairs
+            max_workers (int, optional): Worker processes; defaults to the
+                number of CPUs
+
+        Returns:
+            List[Dict]: Extracted metadata, in input order
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(items))
+        if workers <= 1:
+            return [self.extract_metadata(html, url) for html, url in items]
+
+        jobs = [(html, url, self.extract_all_images) for html, url in items]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_extract_metadata_worker, jobs, chunksize=8))
+
+    def _index_document(self, tree: LexborHTMLParser) -> Dict:
+        """
+        Index meta tags, link rels and JSON-LD scripts in a single pass
+
+        Only the first tag per property/name is kept, matching css_first.
+
+        Args:
+            tree (LexborHTMLParser): Parsed HTML content
+
+        Returns:
+            Dict: Lookups keyed 'property', 'name', 'article_tags',
+                'canonical' and 'jsonld'
+        """
+        meta_by_property = {}
+        meta_by_name = {}
+        article_tags = []
+        canonical = None
+        jsonld_scripts = []
+
+        for element in tree.css("meta, link, script"):
+            attributes = element.attributes
+            if element.tag == "meta":
+                content = attributes.get("content")
+                prop = attributes.get("property")
+                if prop:
+                    meta_by_property.setdefault(prop, content)
+                    if prop == "article:tag" and content:
+                        article_tags.append(content)
+                name = attributes.get("name")
+                if name:
+                    meta_by_name.setdefault(name, content)
+            elif element.tag == "link":
+                rel = (attributes.get("rel") or "").split()
+                if canonical is None and "canonical" in rel:
+                    canonical = attributes.get("href") or ""
+            elif (
+                attributes.get("type") == "application/ld+json"
+                and len(jsonld_scripts) < self._MAX_JSONLD_SCRIPTS
+            ):
+                jsonld_scripts.append(element.text())
+
+        return {
+            "property": meta_by_property,
+            "name": meta_by_name,
+            "article_tags": article_tags,
+            "canonical": canonical or "",
+            "jsonld": self._parse_jsonld(jsonld_scripts),
+        }
+
+    def _parse_jsonld(self, scripts: List[str]) -> List[Dict]:
+        """
+        Parse JSON-LD script bodies once into a flat list of objects
+
+        Top-level arrays and @graph containers are flattened so consumers
+        can look for Article/NewsArticle nodes in a single loop.
+
+        Args:
+            scripts (List[str]): Raw JSON-LD script contents
+
+        Returns:
+            List[Dict]: Parsed JSON-LD objects
+        """
+        objects = []
+        for script in scripts:
+            # Only Article/NewsArticle nodes are consumed; both names contain
+            # "Article", so blobs without it are never decoded
+            if not script or "Article" not in script:
+                continue
+            try:
+                data = _json_loads(script)
+            except json.JSONDecodeError:
+                continue
+
+            for item in data if isinstance(data, list) else [data]:
+                if not isinstance(item, dict):
+                    continue
+                objects.append(item)
+                graph = item.get("@graph")
+                if isinstance(graph, list):
+                    objects.extend(node for node in graph if isinstance(node, dict))
+
+        return objects
+
+    @staticmethod
+    def _first_matches(tree: LexborHTMLParser, selectors: Sequence[str]) -> Iterator:
+        """
+        Yield the first match of each selector in priority order
+
+        Args:
+            tree (LexborHTMLParser): Parsed HTML content
+            selectors (Sequence[str]): Priority-ordered CSS selectors
+
+        Yields:
+            The first node matching each selector that matched anything
+        """
+        for selector in selectors:
+            element = tree.css_first(selector)
+            if element is not None:
+                yield element
+
+    def _extract_author(self, tree: LexborHTMLParser) -> str:
         """
         Extract author information using multiple selectors
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            tree (LexborHTMLParser): Parsed HTML content
 
         Returns:
             str: Author name or empty string
         """
-        author_selectors = [
-            '[rel="author"]',
-            '[property="article:author"]',
-            '[name="author"]',
-            ".author",
-            ".byline",
-            ".writer-name",
-            ".article-author",
-            ".post-author",
-        ]
-
-        for selector in author_selectors:
-            element = soup.select_one(selector)
-            if element:
-                author = element.get("content") or element.get_text(strip=True)
-                if author and len(author) > 0:
-                    return author
+        for element in self._first_matches(tree, self._AUTHOR_SELECTORS):
+            author = element.attributes.get("content") or element.text(strip=True)
+            if author and len(author) > 0:
+                return author
 
         return ""
 
-    def _extract_published_date(self, soup: BeautifulSoup) -> str:
+    def _extract_published_date(self, tree: LexborHTMLParser) -> str:
         """
         Extract published date using multiple selectors
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            tree (LexborHTMLParser): Parsed HTML content
 
         Returns:
             str: Published date or empty string
         """
-        date_selectors = [
-            '[property="article:published_time"]',
-            '[property="og:published_time"]',
-            '[name="article:published_time"]',
-            "time[datetime]",
-            ".publish-date",
-            ".date",
-            ".published-date",
-            ".article-date",
-        ]
-
-        for selector in date_selectors:
-            element = soup.select_one(selector)
-            if element:
-                date_text = (
-                    element.get("datetime")
-                    or element.get("content")
-                    or element.get_text(strip=True)
-                )
-                if date_text:
-                    return date_text
+        for element in self._first_matches(tree, self._DATE_SELECTORS):
+            attributes = element.attributes
+            date_text = (
+                attributes.get("datetime")
+                or attributes.get("content")
+                or element.text(strip=True)
+            )
+            if date_text:
+                return date_text
 
         return ""
 
-    def _extract_summary(self, soup: BeautifulSoup) -> str:
+    def _extract_summary(self, tree: LexborHTMLParser) -> str:
         """
         Extract article summary/description
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            tree (LexborHTMLParser): Parsed HTML content
 
         Returns:
             str: Summary or empty string
         """
-        summary_selectors = [
-            '[property="og:description"]',
-            '[name="description"]',
-            '[name="twitter:description"]',
-            ".article-summary",
-            ".excerpt",
-            ".article-excerpt",
-            ".post-excerpt",
-        ]
-
-        for selector in summary_selectors:
-            element = soup.select_one(selector)
-            if element:
-                summary = element.get("content") or element.get_text(strip=True)
-                if summary and len(summary) > 20:  # Reasonable summary length
-                    return summary
+        for element in self._first_matches(tree, self._SUMMARY_SELECTORS):
+            summary = element.attributes.get("content") or element.text(strip=True)
+            if summary and len(summary) > 20:  # Reasonable summary length
+                return summary
 
         return ""
 
-    def _extract_top_image(self, soup: BeautifulSoup, url: str) -> str:
+    def _extract_top_image(self, tree: LexborHTMLParser, url: str, head: Dict) -> str:
         """
         Extract the top image from the article with enhanced detection
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            tree (LexborHTMLParser): Parsed HTML content
             url (str): Original URL
+            head (Dict): Document index from _index_document
 
         Returns:
             str: URL of the top image or empty string
         """
-        from urllib.parse import urljoin
-
-        # Priority 1: OpenGraph image
-        og_image = soup.select_one('[property="og:image"]')
-        if og_image and og_image.get("content"):
-            return self._normalize_image_url(og_image["content"], url)
-
-        # Priority 2: Twitter Card image
-        twitter_image = soup.select_one('[name="twitter:image"]')
-        if twitter_image and twitter_image.get("content"):
-            return self._normalize_image_url(twitter_image["content"], url)
-
-        # Priority 3: JSON-LD structured data image
-        jsonld_image = self._extract_jsonld_image(soup)
-        if jsonld_image:
-            return self._normalize_image_url(jsonld_image, url)
+        # Priorities 1-3: images declared in meta tags or structured data
+        meta_image = self._extract_meta_image(head, url)
+        if meta_image:
+            return meta_image
 
         # Priority 4: Featured image selectors (CMS-specific)
-        featured_selectors = [
-            ".featured-image img",
-            ".post-thumbnail img",
-            ".article-image img",
-            ".hero-image img",
-            ".wp-post-image",
-            ".entry-featured-image img",
-            ".article-featured-image img",
-        ]
-
-        for selector in featured_selectors:
-            element = soup.select_one(selector)
-            if element and element.get("src"):
-                return self._normalize_image_url(element["src"], url)
+        for element in self._first_matches(tree, self._FEATURED_IMAGE_SELECTORS):
+            src = element.attributes.get("src")
+            if src:
+                return self._normalize_image_url(src, url)
 
         # Priority 5: First large image in content
-        content_images = soup.select(
+        content_images = tree.css(
             "article img, .content img, .post-content img, .entry-content img"
         )
         for img in content_images:
-            if img.get("src") and self._is_valid_image(img):
-                return self._normalize_image_url(img["src"], url)
+            if img.attributes.get("src") and self._is_valid_image(img):
+                return self._normalize_image_url(img.attributes["src"], url)
 
         # Priority 6: Any reasonable image
-        all_images = soup.find_all("img", src=True)
+        all_images = tree.css("img[src]")
         for img in all_images:
             if self._is_valid_image(img):
-                return self._normalize_image_url(img["src"], url)
+                return self._normalize_image_url(img.attributes["src"], url)
+
+        return ""
+
+    def _extract_meta_image(self, head: Dict, url: str) -> str:
+        """
+        Extract the image declared by the page itself
+
+        Args:
+            head (Dict): Document index from _index_document
+            url (str): Original URL
+
+        Returns:
+            str: Absolute image URL or empty string
+        """
+        # Priority 1: OpenGraph image
+        og_image = head["property"].get("og:image")
+        if og_image:
+            return self._normalize_image_url(og_image, url)
+
+        # Priority 2: Twitter Card image
+        twitter_image = head["name"].get("twitter:image")
+        if twitter_image:
+            return self._normalize_image_url(twitter_image, url)
+
+        # Priority 3: JSON-LD structured data image
+        jsonld_image = self._extract_jsonld_image(head)
+        if jsonld_image:
+            return self._normalize_image_url(jsonld_image, url)
 
         return ""
 
-    def _extract_jsonld_image(self, soup: BeautifulSoup) -> str:
+    def _extract_jsonld_image(self, head: Dict) -> str:
         """Extract image from JSON-LD structured data"""
-        try:
-            import json
-
-            jsonld_scripts = soup.find_all("script", type="application/ld+json")
-
-            for script in jsonld_scripts:
-                try:
-                    data = json.loads(script.string)
-                    if isinstance(data, dict):
-                        # Check for image in Article or NewsArticle
-                        if (
-                            data.get("@type") in ["Article", "NewsArticle"]
-                            and "image" in data
-                        ):
-                            image = data["image"]
-                            if isinstance(image, str):
-                                return image
-                            elif isinstance(image, dict) and "url" in image:
-                                return image["url"]
-                            elif isinstance(image, list) and len(image) > 0:
-                                first_image = image[0]
-                                if isinstance(first_image, str):
-                                    return first_image
-                                elif (
-                                    isinstance(first_image, dict)
-                                    and "url" in first_image
-                                ):
-                                    return first_image["url"]
-                except json.JSONDecodeError:
-                    continue
-        except ImportError:
-            pass
+        for data in head["jsonld"]:
+            # Check for image in Article or NewsArticle
+            if data.get("@type") in ["Article", "NewsArticle"] and "image" in data:
+                image = data["image"]
+                if isinstance(image, str):
+                    return image
+                elif isinstance(image, dict) and "url" in image:
+                    return image["url"]
+                elif isinstance(image, list) and len(image) > 0:
+                    first_image = image[0]
+                    if isinstance(first_image, str):
+                        return first_image
+                    elif isinstance(first_image, dict) and "url" in first_image:
+                        return first_image["url"]
 
         return ""
 
     def _normalize_image_url(self, image_url: str, base_url: str) -> str:
         """Normalize image URL to absolute URL"""
-        from urllib.parse import urljoin, urlparse
-
         if not image_url:
             return ""
 
@@ -280,42 +485,21 @@ class MetadataExtractor:
 
     def _is_valid_image(self, img_element) -> bool:
         """Check if image element represents a valid article image"""
-        src = img_element.get("src", "")
-        alt = img_element.get("alt", "")
+        attributes = img_element.attributes
+        src = attributes.get("src") or ""
+        alt = attributes.get("alt") or ""
 
         # Skip if no src
         if not src:
             return False
 
-        # Skip common non-content images
-        skip_patterns = [
-            "logo",
-            "icon",
-            "avatar",
-            "profile",
-            "social",
-            "share",
-            "advertisement",
-            "ad-",
-            "banner",
-            "placeholder",
-            "spacer",
-            "tracking",
-            "pixel",
-            "1x1",
-            "transparent",
-        ]
-
-        src_lower = src.lower()
-        alt_lower = alt.lower()
-
-        for pattern in skip_patterns:
-            if pattern in src_lower or pattern in alt_lower:
-                return False
+        # Skip common non-content images (one scan; no pattern spans a newline)
+        if _IMAGE_SKIP_RE.search(f"{src}\n{alt}"):
+            return False
 
         # Check image dimensions if available
-        width = img_element.get("width")
-        height = img_element.get("height")
+        width = attributes.get("width")
+        height = attributes.get("height")
 
         if width and height:
             try:
@@ -332,12 +516,12 @@ class MetadataExtractor:
 
         return True
 
-    def _extract_opengraph_metadata(self, soup: BeautifulSoup) -> Dict:
+    def _extract_opengraph_metadata(self, head: Dict) -> Dict:
         """
         Extract OpenGraph metadata
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            head (Dict): Document index from _index_document
 
         Returns:
             Dict: OpenGraph metadata
@@ -359,23 +543,22 @@ class MetadataExtractor:
             "article:tag",
         ]
 
+        meta_by_property = head["property"]
         for prop in og_properties:
-            element = soup.select_one(f'[property="{prop}"]')
-            if element:
-                content = element.get("content")
-                if content:
-                    # Convert property name to snake_case
-                    key = prop.replace(":", "_").replace("-", "_")
-                    og_metadata[key] = content
+            content = meta_by_property.get(prop)
+            if content:
+                # Convert property name to snake_case
+                key = prop.replace(":", "_").replace("-", "_")
+                og_metadata[key] = content
 
         return og_metadata
 
-    def _extract_twitter_metadata(self, soup: BeautifulSoup) -> Dict:
+    def _extract_twitter_metadata(self, head: Dict) -> Dict:
         """
         Extract Twitter Card metadata
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            head (Dict): Document index from _index_document
 
         Returns:
             Dict: Twitter Card metadata
@@ -392,95 +575,72 @@ class MetadataExtractor:
             "twitter:creator",
         ]
 
+        meta_by_name = head["name"]
         for prop in twitter_properties:
-            element = soup.select_one(f'[name="{prop}"]')
-            if element:
-                content = element.get("content")
-                if content:
-                    # Convert property name to snake_case
-                    key = prop.replace(":", "_").replace("-", "_")
-                    twitter_metadata[key] = content
+            content = meta_by_name.get(prop)
+            if content:
+                # Convert property name to snake_case
+                key = prop.replace(":", "_").replace("-", "_")
+                twitter_metadata[key] = content
 
         return twitter_metadata
 
-    def _extract_jsonld_metadata(self, soup: BeautifulSoup) -> Dict:
+    def _extract_jsonld_metadata(self, head: Dict) -> Dict:
         """
         Extract JSON-LD structured data (basic implementation)
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            head (Dict): Document index from _index_document
 
         Returns:
             Dict: JSON-LD metadata
         """
         jsonld_metadata = {}
 
-        try:
-            import json
-
-            # Find JSON-LD script tags
-            jsonld_scripts = soup.find_all("script", type="application/ld+json")
-
-            for script in jsonld_scripts:
-                try:
-                    data = json.loads(script.string)
-
-                    # Extract relevant fields for news articles
-                    if isinstance(data, dict):
-                        if data.get("@type") in ["Article", "NewsArticle"]:
-                            if "headline" in data:
-                                jsonld_metadata["jsonld_headline"] = data["headline"]
-                            if "author" in data:
-                                if isinstance(data["author"], dict):
-                                    jsonld_metadata["jsonld_author"] = data[
-                                        "author"
-                                    ].get("name", "")
-                                elif isinstance(data["author"], str):
-                                    jsonld_metadata["jsonld_author"] = data["author"]
-                            if "datePublished" in data:
-                                jsonld_metadata["jsonld_date_published"] = data[
-                                    "datePublished"
-                                ]
-                            if "description" in data:
-                                jsonld_metadata["jsonld_description"] = data[
-                                    "description"
-                                ]
-
-                except json.JSONDecodeError:
-                    continue
-
-        except ImportError:
-            self.logger.debug("JSON module not available for JSON-LD parsing")
-        except Exception as e:
-            self.logger.debug(f"Failed to parse JSON-LD: {e}")
-
-        return {}
-
-    def _extract_category(self, soup: BeautifulSoup) -> str:
+        for data in head["jsonld"]:
+            # Extract relevant fields for news articles
+            if data.get("@type") in ["Article", "NewsArticle"]:
+                if "headline" in data:
+                    jsonld_metadata["jsonld_headline"] = data["headline"]
+                if "author" in data:
+                    if isinstance(data["author"], dict):
+                        jsonld_metadata["jsonld_author"] = data["author"].get(
+                            "name", ""
+                        )
+                    elif isinstance(data["author"], str):
+                        jsonld_metadata["jsonld_author"] = data["author"]
+                if "datePublished" in data:
+                    jsonld_metadata["jsonld_date_published"] = data["datePublished"]
+                if "description" in data:
+                    jsonld_metadata["jsonld_description"] = data["description"]
+
+        return jsonld_metadata
+
+    def _extract_category(self, tree: LexborHTMLParser, head: Dict) -> str:
         """Extract article category."""
         # Try OpenGraph property first
-        og_category = soup.find("meta", property="article:section")
-        if og_category and og_category.get("content"):
-            return og_category["content"]
+        og_category = head["property"].get("article:section")
+        if og_category:
+            return og_category
 
         # Look for breadcrumbs
-        breadcrumb = soup.select_one(
+        breadcrumb = tree.css_first(
             ".breadcrumb a, .breadcrumbs a, .b-breadcrumbs__item a"
         )
         if breadcrumb:
-            return breadcrumb.get_text(strip=True)
+            return breadcrumb.text(strip=True)
 
         return ""
 
-    def _extract_publication_name(self, soup: BeautifulSoup, source: str) -> str:
+    def _extract_publication_name(self, head: Dict, source: str) -> str:
         """Extract publication name."""
-        og_site_name = soup.find("meta", property="og:site_name")
-        if og_site_name and og_site_name.get("content"):
-            return og_site_name["content"]
+        og_site_name = head["property"].get("og:site_name")
+        if og_site_name:
+            return og_site_name
 
-        twitter_site = soup.find("meta", attrs={"name": "twitter:site"})
-        if twitter_site and twitter_site.get("content"):
-            return twitter_site["content"].lstrip("@")
+        twitter_site = head["name"].get("twitter:site")
+        if twitter_site:
+            return twitter_site.lstrip("@")
 
         if source:
             # Capitalize the first part of the domain
@@ -488,27 +648,27 @@ class MetadataExtractor:
 
         return ""
 
-    def _extract_meta_description(self, soup: BeautifulSoup) -> str:
+    def _extract_meta_description(self, head: Dict) -> str:
         """Extract meta description."""
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content"):
-            return meta_desc["content"]
-        return ""
+        return head["name"].get("description") or ""
 
-    def _extract_meta_keywords(self, soup: BeautifulSoup) -> list[str]:
+    def _extract_meta_keywords(self, head: Dict) -> list[str]:
         """Extract meta keywords."""
-        meta_keywords = soup.find("meta", attrs={"name": "keywords"})
-        if meta_keywords and meta_keywords.get("content"):
-            return [k.strip() for k in meta_keywords["content"].split(",")]
+        meta_keywords = head["name"].get("keywords")
+        if meta_keywords:
+            return [k.strip() for k in meta_keywords.split(",")]
         return []
 
-    def _extract_tags(self, soup: BeautifulSoup, metadata: Dict) -> List[str]:
+    def _extract_tags(
+        self, tree: LexborHTMLParser, metadata: Dict, head: Dict
+    ) -> List[str]:
         """
         Extract tags from various sources including OpenGraph, HTML elements, and meta keywords
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            tree (LexborHTMLParser): Parsed HTML content
             metadata (Dict): Already extracted metadata that might contain tags
+            head (Dict): Document index from _index_document
 
         Returns:
             List[str]: List of extracted tags
@@ -516,11 +676,8 @@ class MetadataExtractor:
         tags = []
 
         # 1. Extract from OpenGraph article:tag (multiple tags possible)
-        article_tags = soup.find_all("meta", property="article:tag")
-        for tag_element in article_tags:
-            content = tag_element.get("content")
-            if content:
-                tags.append(content.strip())
+        for content in head["article_tags"]:
+            tags.append(content.strip())
 
         # 2. Extract from already extracted OpenGraph metadata
         if "article_tag" in metadata:
@@ -529,26 +686,15 @@ class MetadataExtractor:
             elif isinstance(metadata["article_tag"], str):
                 tags.append(metadata["article_tag"])
 
-        # 3. Extract from common HTML tag selectors
-        tag_selectors = [
-            ".tags a",
-            ".post-tags a",
-            ".article-tags a",
-            ".tag-links a",
-            ".entry-tags a",
-            ".category-tags a",
-            ".tags span",
-            ".post-tags span",
-            ".article-tags span",
-            ".wp-tag-cloud a",
-            ".tag-list a",
-            ".hashtags a",
-        ]
+        # Meta tags alone may already fill the output; skip the body scan
+        cleaned_tags = self._clean_tags(tags)
+        if len(cleaned_tags) >= self._MAX_TAGS:
+            return cleaned_tags
 
-        for selector in tag_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                tag_text = element.get_text(strip=True)
+        # 3. Extract from common HTML tag selectors
+        for selector in self._TAG_SELECTORS:
+            for element in tree.css(selector):
+                tag_text = element.text(strip=True)
                 if tag_text and len(tag_text) > 1:  # Avoid single characters
                     tags.append(tag_text)
 
@@ -558,11 +704,9 @@ class MetadataExtractor:
 
         # 5. Extract from breadcrumbs as fallback categories
         if not tags:
-            breadcrumbs = soup.select(
-                ".breadcrumb a, .breadcrumbs a, .nav-breadcrumb a"
-            )
+            breadcrumbs = tree.css(".breadcrumb a, .breadcrumbs a, .nav-breadcrumb a")
             for breadcrumb in breadcrumbs[1:]:  # Skip first (usually "Home")
-                breadcrumb_text = breadcrumb.get_text(strip=True)
+                breadcrumb_text = breadcrumb.text(strip=True)
                 if breadcrumb_text and breadcrumb_text.lower() not in [
                     "home",
                     "news",
@@ -570,68 +714,76 @@ class MetadataExtractor:
                 ]:
                     tags.append(breadcrumb_text)
 
-        # Clean and deduplicate tags
+        return self._clean_tags(tags)
+
+    def _clean_tags(self, tags: List[str]) -> List[str]:
+        """Strip and deduplicate tags, keeping the first _MAX_TAGS"""
         cleaned_tags = []
+        seen = set()
         for tag in tags:
             tag = tag.strip()
-            if tag and len(tag) > 1 and tag not in cleaned_tags:
+            if len(tag) > 1 and tag not in seen:
+                seen.add(tag)
                 cleaned_tags.append(tag)
+                if len(cleaned_tags) == self._MAX_TAGS:
+                    break
 
-        return cleaned_tags[:10]  # Limit to 10 tags to avoid spam
+        return cleaned_tags
 
-    def _extract_canonical_link(self, soup: BeautifulSoup) -> str:
+    def _extract_canonical_link(self, head: Dict) -> str:
         """Extract canonical link."""
-        canonical = soup.find("link", rel="canonical")
-        if canonical and canonical.get("href"):
-            return canonical["href"]
-        return ""
+        return head["canonical"]
+
+    def _find_article_body(self, tree: LexborHTMLParser) -> Optional[LexborNode]:
+        """Locate the main article container, if the page marks one"""
+        return (
+            tree.css_first("article")
+            or tree.css_first("div.post-content")
+            or tree.css_first("div.entry-content")
+        )
 
-    def _extract_image_urls(self, soup: BeautifulSoup) -> list[str]:
+    def _extract_image_urls(self, article_body: Optional[LexborNode]) -> list[str]:
         """Extract all image URLs from the article body."""
         images = []
-        article_body = (
-            soup.find("article")
-            or soup.find("div", class_="post-content")
-            or soup.find("div", class_="entry-content")
-        )
         if article_body:
-            for img in article_body.find_all("img"):
-                if img.get("src"):
-                    images.append(img["src"])
-        return list(set(images))
-
-    def _extract_video_urls(self, soup: BeautifulSoup) -> list[str]:
+            for img in article_body.css("img[src]"):
+                src = img.attributes["src"]
+                if src:
+                    images.append(src)
+        return list(dict.fromkeys(images))
+
+    def _extract_video_urls(
+        self, root: Union[LexborHTMLParser, LexborNode]
+    ) -> list[str]:
         """Extract all video URLs from the article body."""
         videos = []
         # Look for iframes from common video hosts
-        for iframe in soup.find_all("iframe"):
-            src = iframe.get("src", "")
+        for iframe in root.css("iframe"):
+            src = iframe.attributes.get("src") or ""
             if "youtube.com" in src or "vimeo.com" in src:
                 videos.append(src)
-        return list(set(videos))
+        return list(dict.fromkeys(videos))
 
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> list[str]:
+    def _extract_links(
+        self, article_body: Optional[LexborNode], base_url: str
+    ) -> list[str]:
         """Extract all outbound links from the article body."""
-        from urllib.parse import urljoin, urlparse
-
         links = []
-        article_body = (
-            soup.find("article")
-            or soup.find("div", class_="post-content")
-            or soup.find("div", class_="entry-content")
-        )
+        base_netloc = urlparse(base_url).netloc
         if article_body:
-            for a in article_body.find_all("a", href=True):
-                href = a["href"]
-                # Ensure it's an absolute URL and not an internal link
-                if (
-                    href.startswith("http")
-                    and urlparse(href).netloc != urlparse(base_url).netloc
-                ):
-                    links.append(urljoin(base_url, href))
-        return list(set(links))  # Return unique links
-
-    def _extract_is_paywalled(self, soup: BeautifulSoup) -> bool:
+            for a in article_body.css("a[href]"):
+                href = a.attributes["href"] or ""
+                # Ensure it's an absolute URL and not an internal link; only a
+                # full http(s):// URL can skip urljoin, since relative hrefs
+                # like "http-status.html" also start with "http"
+                if not href.startswith(("http://", "https://")):
+                    continue
+                netloc = urlparse(href).netloc
+                if netloc and netloc != base_netloc:
+                    links.append(href)
+        return list(dict.fromkeys(links))  # Return unique links, in page order
+
+    def _extract_is_paywalled(self, tree: LexborHTMLParser) -> bool:
         """Detect if the article is behind a paywall."""
         # This is a simple heuristic and might need to be more sophisticated
         paywall_selectors = [
@@ -641,6 +793,6 @@ class MetadataExtractor:
             "div[class*='paywall']",
         ]
         for selector in paywall_selectors:
-            if soup.select_one(selector):
+            if tree.css_first(selector) is not None:
                 return True
         return False
@@ -5,21 +5,45 @@ News Extractor - Main Module
 Professional news extraction engine with modular architecture
 """
 
+import asyncio
 import logging
+import threading
 import time
-from typing import List, Dict, Optional, Union
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+from selectolax.lexbor import LexborHTMLParser
 
 from models.article import Article
 from utils.exceptions import ExtractionError, ValidationError
 from utils.validators import URLValidator
 
-from core.http_client import HTTPClient
+from core.http_client import HTTPClient, HTTPX_AVAILABLE, decode_html
 from core.content_parser import ContentParser
 from core.rss_parser import RSSParser
 from core.metadata_extractor import MetadataExtractor
 from core.language_processor import LanguageProcessor
-from core.nlp_processor import NLPProcessor
+from core.nlp_processor import NLPProcessor, NLPResults
+
+
+@lru_cache(maxsize=4)
+def _get_worker_extractor(config: Tuple) -> "NewsExtractor":
+    """Build (once per worker process) an extractor for the given settings"""
+    language, enable_nlp, enable_transformers, summarization_method = config
+    return NewsExtractor(
+        language=language,
+        enable_nlp=enable_nlp,
+        enable_transformers=enable_transformers,
+        summarization_method=summarization_method,
+    )
+
+
+def _extract_article_worker(job: Tuple[Union[str, bytes], str, Tuple]) -> Article:
+    """Process-pool entry point: parse and analyze one fetched page"""
+    html_content, url, config = job
+    return _get_worker_extractor(config)._extract_article_from_html(html_content, url)
 
 
 class NewsExtractor:
@@ -57,6 +81,14 @@ class NewsExtractor:
         self.delay_between_requests = delay_between_requests
         self.enable_nlp = enable_nlp
 
+        # Settings a worker process needs to rebuild the parse/NLP pipeline
+        self._worker_config = (
+            language,
+            enable_nlp,
+            enable_transformers,
+            summarization_method,
+        )
+
         # Initialize components
         self.http_client = HTTPClient(request_timeout, max_retries, custom_headers)
         self.content_parser = ContentParser()
@@ -73,15 +105,24 @@ class NewsExtractor:
         )
         self.url_validator = URLValidator()
 
+        # Per-host politeness state shared by the worker threads
+        self._host_locks = defaultdict(threading.Lock)
+        self._host_locks_guard = threading.Lock()
+        self._host_last_request: Dict[str, float] = {}
+
         # Setup logging
         self.logger = logging.getLogger(__name__)
 
-    def extract_from_url(self, url: str) -> Union[Article, List[Article]]:
+    def extract_from_url(
+        self, url: str, process_nlp: bool = True
+    ) -> Union[Article, List[Article]]:
         """
         Extract article(s) from a single URL - auto-detects RSS feeds vs regular articles
 
         Args:
             url (str): URL of the news article or RSS feed
+            process_nlp (bool): Whether to run NLP analysis on a regular
+                article; batch callers pass False and analyze afterwards
 
         Returns:
             Union[Article, List[Article]]: Single article for regular URLs, list for RSS feeds
@@ -101,7 +142,7 @@ class NewsExtractor:
                 return self.extract_from_rss_feed(url)
             else:
                 self.logger.info(f"Extracting regular article: {url}")
-                return self._extract_single_article(url)
+                return self._extract_single_article(url, process_nlp)
 
         except Exception as e:
             self.logger.error(f"Failed to extract from {url}: {str(e)}")
@@ -119,11 +160,14 @@ class NewsExtractor:
             List[Article]: List of extracted articles
         """
         articles = []
+        # Single articles are NLP-processed together after extraction
+        nlp_pending = []
+        self.http_client.ensure_pool_size(max_workers)
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all tasks
             future_to_url = {
-                executor.submit(self.extract_from_url, url): url for url in urls
+                executor.submit(self._extract_from_url_polite, url): url for url in urls
             }
 
             # Collect results
@@ -136,15 +180,247 @@ class NewsExtractor:
                         articles.extend(result)
                     else:
                         articles.append(result)
+                        nlp_pending.append(result)
                 except Exception as e:
                     self.logger.error(f"Failed to extract from {url}: {str(e)}")
                     continue
 
-                # Add delay between requests
-                time.sleep(self.delay_between_requests)
+        self._process_nlp_batch(nlp_pending)
+
+        return articles
+
+    def _extract_from_url_polite(self, url: str) -> Union[Article, List[Article]]:
+        """
+        Extract from a URL after waiting out the per-host request delay
+
+        Requests to the same host are spaced by delay_between_requests while
+        requests to different hosts proceed concurrently.
+
+        Args:
+            url (str): URL of the news article or RSS feed
+
+        Returns:
+            Union[Article, List[Article]]: Result of extract_from_url
+        """
+        host = urlparse(url).netloc.lower()
+        with self._host_locks_guard:
+            host_lock = self._host_locks[host]
+
+        with host_lock:
+            last = self._host_last_request.get(host)
+            if last is not None:
+                sleep_for = last + self.delay_between_requests - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+            self._host_last_request[host] = time.monotonic()
+
+        return self.extract_from_url(url, process_nlp=False)
+
+    def extract_many(
+        self,
+        urls: List[str],
+        concurrency: int = 20,
+        max_workers: int = 5,
+        use_processes: bool = False,
+        per_host: Optional[int] = 2,
+    ) -> List[Article]:
+        """
+        Extract many article URLs, fetching them concurrently
+
+        All pages are fetched with async HTTP (or a thread pool sized to the
+        batch when httpx is not installed or the calling thread is already
+        running an event loop), then parsed in a thread pool.
+        RSS detection is skipped; use extract_from_urls for mixed inputs.
+
+        Args:
+            urls (List[str]): Article URLs to extract
+            concurrency (int): Maximum number of requests in flight
+            max_workers (int): Maximum number of parsing threads (or
+                processes)
+            use_processes (bool): Whether to parse and run NLP in worker
+                processes, which scales CPU-bound work across cores
+            per_host (int, optional): Maximum number of requests in flight
+                per host; unlimited when None
+
+        Returns:
+            List[Article]: Extracted articles, in input order; failures are
+                logged and skipped
+        """
+        valid_urls = []
+        for url in urls:
+            if self.url_validator.is_valid(url):
+                valid_urls.append(url)
+            else:
+                self.logger.error(f"Skipping invalid URL: {url}")
+
+        if not valid_urls:
+            return []
+
+        # asyncio.run cannot start a loop from inside a running one (Jupyter,
+        # async web handlers), so such callers get the thread pool instead
+        try:
+            asyncio.get_running_loop()
+            loop_running = True
+        except RuntimeError:
+            loop_running = False
+
+        if HTTPX_AVAILABLE and not loop_running:
+            responses = asyncio.run(
+                self.http_client.fetch_many(valid_urls, concurrency, per_host)
+            )
+        else:
+            responses = self._fetch_many_threaded(valid_urls, concurrency, per_host)
+
+        return self._parse_responses(valid_urls, responses, max_workers, use_processes)
+
+    async def aextract_from_urls(
+        self,
+        urls: List[str],
+        concurrency: int = 50,
+        per_host: int = 2,
+        max_workers: int = 5,
+        use_processes: bool = False,
+    ) -> List[Article]:
+        """
+        Asynchronously extract many article URLs
+
+        Pages are fetched on one event loop with at most concurrency requests
+        in flight overall and per_host per host; parsing runs in a thread
+        pool off the loop. Like extract_many, RSS detection is skipped.
+
+        Args:
+            urls (List[str]): Article URLs to extract
+            concurrency (int): Maximum number of requests in flight
+            per_host (int): Maximum number of requests in flight per host
+            max_workers (int): Maximum number of parsing threads (or
+                processes)
+            use_processes (bool): Whether to parse and run NLP in worker
+                processes
+
+        Returns:
+            List[Article]: Extracted articles, in input order; failures are
+                logged and skipped
+
+        Raises:
+            ExtractionError: If httpx is not available
+        """
+        valid_urls = []
+        for url in urls:
+            if self.url_validator.is_valid(url):
+                valid_urls.append(url)
+            else:
+                self.logger.error(f"Skipping invalid URL: {url}")
+
+        if not valid_urls:
+            return []
+
+        responses = await self.http_client.fetch_many(valid_urls, concurrency, per_host)
+        return await asyncio.to_thread(
+            self._parse_responses, valid_urls, responses, max_workers, use_processes
+        )
+
+    def _parse_responses(
+        self,
+        urls: List[str],
+        responses: List,
+        max_workers: int = 5,
+        use_processes: bool = False,
+    ) -> List[Article]:
+        """
+        Parse fetched pages into articles in a thread or process pool
+
+        Threads share this extractor and NLP runs afterwards as one batch;
+        worker processes rebuild the pipeline from the extractor's settings
+        and run parsing and NLP together.
+
+        Args:
+            urls (List[str]): URLs the responses were fetched from
+            responses (List): One response or exception per URL
+            max_workers (int): Maximum number of parsing threads (or
+                processes)
+            use_processes (bool): Whether to use worker processes
+
+        Returns:
+            List[Article]: Extracted articles, in input order; failures are
+                logged and skipped
+        """
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+
+        with executor_class(max_workers=max_workers) as executor:
+            futures = []
+            for url, response in zip(urls, responses):
+                if isinstance(response, Exception):
+                    self.logger.error(f"Failed to fetch {url}: {response}")
+                    continue
+
+                if use_processes:
+                    future = executor.submit(
+                        _extract_article_worker,
+                        (decode_html(response), url, self._worker_config),
+                    )
+                else:
+                    future = executor.submit(
+                        self._extract_article_from_html,
+                        decode_html(response),
+                        url,
+                        False,
+                    )
+                futures.append((url, future))
+
+            articles = []
+            for url, future in futures:
+                try:
+                    articles.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"Failed to extract from {url}: {str(e)}")
+
+        if not use_processes:
+            self._process_nlp_batch(articles)
 
         return articles
 
+    def _fetch_many_threaded(
+        self, urls: List[str], concurrency: int = 20, per_host: Optional[int] = None
+    ) -> List:
+        """
+        Fetch many URLs with blocking requests in a thread pool
+
+        Args:
+            urls (List[str]): URLs to fetch
+            concurrency (int): Maximum number of fetch threads
+            per_host (int, optional): Maximum number of requests in flight
+                per host; unlimited when None
+
+        Returns:
+            List: One response or exception per URL, in input order
+        """
+        # One slot pool per host, created up front so threads never race
+        # to create a host's semaphore
+        host_slots = (
+            {urlparse(url).netloc: threading.Semaphore(per_host) for url in urls}
+            if per_host
+            else None
+        )
+
+        def fetch(url: str):
+            if host_slots is None:
+                return self.http_client.fetch_url(url)
+            with host_slots[urlparse(url).netloc]:
+                return self.http_client.fetch_url(url)
+
+        workers = max(1, min(32, concurrency, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(fetch, url) for url in urls]
+
+            responses = []
+            for future in futures:
+                try:
+                    responses.append(future.result())
+                except Exception as e:
+                    responses.append(e)
+
+        return responses
+
     def extract_from_rss_feed(
         self, feed_url: str, limit: Optional[int] = None
     ) -> List[Article]:
@@ -162,10 +438,22 @@ class NewsExtractor:
             # Parse RSS feed to get article data
             articles_data = self.rss_parser.parse_feed(feed_url, limit)
 
+            # Detect and translate the whole feed together, so its entries
+            # share batched translation requests
+            self.language_processor.process_contents(
+                [
+                    data
+                    for data in articles_data
+                    if data.get("title") and data.get("content")
+                ]
+            )
+
             # Convert to Article objects
             articles = []
             for article_data in articles_data:
-                article = self._create_article_from_data(article_data)
+                article = self._create_article_from_data(
+                    article_data, language_processed=True
+                )
                 if article:
                     articles.append(article)
 
@@ -178,12 +466,13 @@ class NewsExtractor:
             self.logger.error(f"Failed to extract from RSS feed {feed_url}: {e}")
             raise ExtractionError(f"Failed to extract from RSS feed: {str(e)}")
 
-    def _extract_single_article(self, url: str) -> Article:
+    def _extract_single_article(self, url: str, process_nlp: bool = True) -> Article:
         """
         Extract article from a single URL (non-RSS)
 
         Args:
             url (str): URL of the news article
+            process_nlp (bool): Whether to run NLP analysis on the article
 
         Returns:
             Article: Extracted article object
@@ -192,40 +481,62 @@ class NewsExtractor:
             # Fetch content
             response = self.http_client.fetch_url(url)
 
-            # Parse content
-            article_data = self.content_parser.parse_article_data(response.text, url)
+            return self._extract_article_from_html(
+                decode_html(response), url, process_nlp
+            )
 
-            # Extract comprehensive metadata
-            from bs4 import BeautifulSoup
+        except Exception as e:
+            self.logger.error(f"Failed to extract single article from {url}: {e}")
+            raise ExtractionError(f"Failed to extract article: {str(e)}")
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            metadata = self.metadata_extractor.extract_metadata(soup, url)
+    def _extract_article_from_html(
+        self, html_content: Union[str, bytes], url: str, process_nlp: bool = True
+    ) -> Article:
+        """
+        Build an article from already fetched HTML
 
-            # Merge metadata
-            article_data.update(metadata)
-            article_data["url"] = url
+        Args:
+            html_content (Union[str, bytes]): Raw HTML of the article page
+            url (str): URL the HTML was fetched from
+            process_nlp (bool): Whether to run NLP analysis on the article
 
-            # Create Article object
-            article = self._create_article_from_data(article_data)
+        Returns:
+            Article: Extracted article object
+        """
+        # Parse the page once; both extractors only read the shared tree
+        tree = LexborHTMLParser(html_content, encoding=True)
 
-            if not article:
-                raise ExtractionError("Failed to create article from extracted data")
+        # Parse content
+        article_data = self.content_parser.parse_article_data(html_content, url, tree)
 
-            # Process language and NLP if enabled
-            self._process_language_and_nlp(article)
+        # Extract comprehensive metadata
+        metadata = self.metadata_extractor.extract_metadata(tree, url)
 
-            return article
+        # Merge metadata
+        article_data.update(metadata)
+        article_data["url"] = url
 
-        except Exception as e:
-            self.logger.error(f"Failed to extract single article from {url}: {e}")
-            raise ExtractionError(f"Failed to extract article: {str(e)}")
+        # Create Article object
+        article = self._create_article_from_data(article_data)
+
+        if not article:
+            raise ExtractionError("Failed to create article from extracted data")
+
+        # Process language and NLP if enabled
+        self._process_language_and_nlp(article, process_nlp)
 
-    def _create_article_from_data(self, data: Dict) -> Optional[Article]:
+        return article
+
+    def _create_article_from_data(
+        self, data: Dict, language_processed: bool = False
+    ) -> Optional[Article]:
         """
         Create an Article object from extracted data dictionary
 
         Args:
             data (Dict): Dictionary of article data
+            language_processed (bool): Whether data already went through the
+                language processor (detection and translation)
 
         Returns:
             Optional[Article]: Article object or None if validation fails
@@ -239,7 +550,11 @@ class NewsExtractor:
                 return None
 
             # Process language detection using the language processor
-            processed_data = self.language_processor.process_content(data)
+            processed_data = (
+                data
+                if language_processed
+                else self.language_processor.process_content(data)
+            )
 
             article = Article(
                 title=processed_data.get("title", ""),
@@ -274,32 +589,25 @@ class NewsExtractor:
             self.logger.error(f"Error creating article object: {e}")
             return None
 
-    def _process_language_and_nlp(self, article: Article):
+    def _process_language_and_nlp(self, article: Article, process_nlp: bool = True):
         """
         Process language translation and NLP analysis for the article
 
         Args:
             article (Article): Article object to process
+            process_nlp (bool): Whether to run NLP analysis after translation
         """
         try:
             # Language translation
             if self.language and not article.translated:
-                from core.translator import Translator, TranslationProvider
+                # Reuse the processor's translator and its pooled connections
+                translator = self.language_processor.translator
 
-                translator = Translator(provider=TranslationProvider.GOOGLE_FREE)
-
-                # Translate title and content
+                # Translate title and content in one request
                 try:
-                    if article.content:
-                        translated_content = translator.translate(
-                            article.content, target_lang=self.language
-                        )
-                        article.content = translated_content
-                    if article.title:
-                        translated_title = translator.translate(
-                            article.title, target_lang=self.language
-                        )
-                        article.title = translated_title
+                    article.title, article.content = translator.translate_many(
+                        [article.title, article.content], target_lang=self.language
+                    )
                     article.translated = True
                     self.logger.info(f"Article translated to {self.language}")
                 except Exception as e:
@@ -308,21 +616,52 @@ class NewsExtractor:
                     )
 
             # NLP processing
-            if self.enable_nlp and self.nlp_processor:
+            if process_nlp and self.enable_nlp and self.nlp_processor:
                 nlp_results = self.nlp_processor.process_article(
                     article.title, article.content
                 )
-
-                # Update article with NLP results
-                article.entities = nlp_results.entities
-                article.sentiment = nlp_results.sentiment
-                article.nlp_summary = nlp_results.summary
-                article.nlp_processed = True
-
-                self.logger.debug(
-                    f"NLP processing completed for article: {sum(len(v) for v in nlp_results.entities.values())} entities"
-                )
+                self._apply_nlp_results(article, nlp_results)
 
         except Exception as e:
             self.logger.error(f"Error in language or NLP processing: {e}")
             article.nlp_processed = False
+
+    def _process_nlp_batch(self, articles: List[Article]):
+        """
+        Run NLP analysis on several articles in one batch
+
+        Args:
+            articles (List[Article]): Article objects to process
+        """
+        if not articles or not (self.enable_nlp and self.nlp_processor):
+            return
+
+        try:
+            results = self.nlp_processor.process_articles_batch(
+                [(article.title, article.content) for article in articles]
+            )
+        except Exception as e:
+            self.logger.error(f"Error in batch NLP processing: {e}")
+            for article in articles:
+                article.nlp_processed = False
+            return
+
+        for article, nlp_results in zip(articles, results):
+            self._apply_nlp_results(article, nlp_results)
+
+    def _apply_nlp_results(self, article: Article, nlp_results: NLPResults):
+        """
+        Copy NLP analysis results onto an article
+
+        Args:
+            article (Article): Article object to update
+            nlp_results (NLPResults): Results from the NLP processor
+        """
+        article.entities = nlp_results.entities
+        article.sentiment = nlp_results.sentiment
+        article.nlp_summary = nlp_results.summary
+        article.nlp_processed = True
+
+        self.logger.debug(
+            f"NLP processing completed for article: {sum(len(v) for v in nlp_results.entities.values())} entities"
+        )
@@ -11,8 +11,15 @@ Comprehensive NLP processing for extracted articles including:
 """
 
 import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import islice
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 # Core NLP libraries
 try:
@@ -80,6 +87,96 @@ except ImportError:
     TRANSFORMERS_AVAILABLE = False
 
 
+logger = logging.getLogger(__name__)
+
+# Process-wide LRU of analysis results, so re-delivered articles (e.g. the
+# same item across RSS polls) are analyzed once per configuration
+_NLP_CACHE_SIZE = 4096
+_nlp_cache: "OrderedDict[tuple, NLPResults]" = OrderedDict()
+_nlp_cache_lock = threading.Lock()
+
+# Sentence boundary: terminal punctuation, whitespace, then a sentence start;
+# unlike splitting on ".", this keeps "U.S." and "3.14" intact
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'])")
+_JUNK_SENTENCE_RE = re.compile(r"(?:click|read more|subscribe)", re.IGNORECASE)
+
+# Common English words; plain-ASCII text containing one is taken as English
+_ENGLISH_MARKERS = (" the ", " and ", " of ", " to ")
+
+
+@lru_cache(maxsize=None)
+def _get_spacy(model: str):
+    """
+    Load a spaCy model once per process with components NER does not use disabled
+
+    Args:
+        model (str): Name of the installed spaCy model
+
+    Returns:
+        spacy.language.Language: The shared pipeline
+
+    Raises:
+        OSError: If the model is not installed
+    """
+    nlp = spacy.load(model)
+    for name in ("parser", "lemmatizer", "tagger", "attribute_ruler"):
+        if name in nlp.pipe_names:
+            nlp.disable_pipe(name)
+    return nlp
+
+
+@lru_cache(maxsize=1)
+def _get_vader():
+    """Create the shared VADER sentiment analyzer"""
+    return SentimentIntensityAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def _get_summarizer():
+    """Load the shared transformer summarization pipeline (CPU)"""
+    return pipeline("summarization", model="facebook/bart-large-cnn", device=-1)
+
+
+@lru_cache(maxsize=1024)
+def _classify_language(text: str) -> Tuple[str, float]:
+    """
+    Classify the language of a text sample, caching repeated samples
+
+    Args:
+        text (str): Text sample to classify
+
+    Returns:
+        Tuple[str, float]: Language code and confidence
+    """
+    # Fast path: nearly all-ASCII text with common English words
+    sample = text[:400]
+    ascii_ratio = len(sample.encode("ascii", "ignore")) / len(sample)
+    if ascii_ratio > 0.98:
+        lowered = sample.lower()
+        if any(marker in lowered for marker in _ENGLISH_MARKERS):
+            return "en", 0.99
+
+    # Method 1: langdetect (more accurate)
+    if LANGDETECT_AVAILABLE:
+        try:
+            detected_langs = detect_langs(text)
+            if detected_langs:
+                top_lang = detected_langs[0]
+                return top_lang.lang, top_lang.prob
+        except Exception as e:
+            logger.debug(f"langdetect failed: {e}")
+
+    # Method 2: langid (fallback)
+    if LANGID_AVAILABLE:
+        try:
+            lang, confidence = langid.classify(text)
+            return lang, confidence
+        except Exception as e:
+            logger.debug(f"langid failed: {e}")
+
+    return "unknown", 0.0
+
+
 @dataclass
 class NLPResults:
     """Comprehensive NLP analysis results"""
@@ -98,11 +195,16 @@ class NLPProcessor:
     Comprehensive NLP processor with multiple analysis capabilities
     """
 
+    # Shortest text (in characters) that sumy's LexRank is tried on
+    LEXRANK_MIN_CHARS = 4000
+
     def __init__(
         self,
         spacy_model: str = "en_core_web_sm",
         enable_transformers: bool = False,
         summarization_method: str = "auto",
+        ner_char_limit: int = 5000,
+        parallel_nlp: bool = False,
     ):
         """
         Initialize the NLP processor
@@ -111,16 +213,29 @@ class NLPProcessor:
             spacy_model (str): spaCy model to use for NER and processing
             enable_transformers (bool): Whether to use transformer models (requires GPU/high memory)
             summarization_method (str): Preferred summarization method ('auto', 'sumy', 'transformers')
+            ner_char_limit (int): Characters of each text passed to NER; lower
+                it for latency, raise it to find entities deeper in long pages
+            parallel_nlp (bool): Whether to run NER and sentiment analysis
+                concurrently with language detection and summarization
         """
         self.logger = logging.getLogger(__name__)
         self.enable_transformers = enable_transformers
         self.summarization_method = summarization_method
+        self.ner_char_limit = ner_char_limit
+        # Settings that change results; part of every cache key
+        self._cache_config = (
+            spacy_model,
+            enable_transformers,
+            summarization_method,
+            ner_char_limit,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=2) if parallel_nlp else None
 
-        # Initialize spaCy model
+        # Models are loaded once per process and shared between instances
         self.nlp = None
         if SPACY_AVAILABLE:
             try:
-                self.nlp = spacy.load(spacy_model)
+                self.nlp = _get_spacy(spacy_model)
                 self.logger.debug(f"Loaded spaCy model: {spacy_model}")
             except OSError:
                 self.logger.warning(
@@ -130,13 +245,27 @@ class NLPProcessor:
         # Initialize sentiment analyzers
         self.vader_analyzer = None
         if VADER_AVAILABLE:
-            self.vader_analyzer = SentimentIntensityAnalyzer()
+            self.vader_analyzer = _get_vader()
+
+        # Resolved once so the per-article path makes no availability checks
+        self._vader_scorer = (
+            self.vader_analyzer.polarity_scores if self.vader_analyzer else None
+        )
 
         # Initialize RAKE for keyword extraction
         self.rake = None
         if RAKE_AVAILABLE:
             self.rake = Rake()
 
+        # Sumy summarizers are stateless between calls; tokenizers load
+        # NLTK punkt data, so they are built once per language
+        self._sumy_summarizers = (
+            (TextRankSummarizer(), LexRankSummarizer(), LuhnSummarizer())
+            if SUMY_AVAILABLE
+            else ()
+        )
+        self._sumy_tokenizers: Dict[str, "Tokenizer"] = {}
+
         # Initialize transformer models (lazy loading)
         self.summarizer = None
         self.sentiment_pipeline = None
@@ -144,6 +273,18 @@ class NLPProcessor:
         # Log available features
         self._log_available_features()
 
+    def close(self):
+        """Shut down the worker threads used for parallel NLP"""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            executor.shutdown()
+
+    def __enter__(self) -> "NLPProcessor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _log_available_features(self):
         """Log which NLP features are available"""
         features = []
@@ -180,13 +321,135 @@ class NLPProcessor:
         Returns:
             NLPResults: Comprehensive analysis results
         """
+        key = self._cache_key(title, content)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         text = f"{title}. {content}" if title else content
 
-        # Language detection
+        if self._executor is not None:
+            results = self._process_article_parallel(text, content)
+        else:
+            # Named Entity Recognition
+            entities = self._extract_entities(text)
+            results = self._build_results(text, content, entities)
+
+        self._cache_put(key, results)
+        return results
+
+    def _process_article_parallel(self, text: str, content: str) -> NLPResults:
+        """
+        Analyze an article with NER and sentiment running in worker threads
+
+        Summarization needs the detected language, so detection and
+        summarization run on the calling thread meanwhile.
+
+        Args:
+            text (str): Title and content combined
+            content (str): Article content
+
+        Returns:
+            NLPResults: Comprehensive analysis results
+        """
+        entities_future = self._executor.submit(self._extract_entities, text)
+        sentiment_future = self._executor.submit(self._analyze_sentiment, text)
+
         language, lang_confidence = self._detect_language(text)
+        summary, summary_method = self._generate_summary(content, language)
+
+        return NLPResults(
+            entities=entities_future.result(),
+            sentiment=sentiment_future.result(),
+            language=language,
+            language_confidence=lang_confidence,
+            summary=summary,
+            summary_method=summary_method,
+        )
 
-        # Named Entity Recognition
-        entities = self._extract_entities(text)
+    def process_articles_batch(
+        self, articles: List[Tuple[str, str]], batch_size: int = 32
+    ) -> List[NLPResults]:
+        """
+        Perform NLP analysis on many articles at once
+
+        Named entity recognition streams all texts through spaCy's nlp.pipe,
+        amortizing per-document overhead; results match process_article.
+
+        Args:
+            articles (List[Tuple[str, str]]): (title, content) pairs
+            batch_size (int): Number of texts spaCy processes per batch
+
+        Returns:
+            List[NLPResults]: Analysis results, in input order
+        """
+        keys = [self._cache_key(title, content) for title, content in articles]
+        results = [self._cache_get(key) for key in keys]
+
+        # Only articles missing from the cache go through the pipeline
+        pending = [i for i, result in enumerate(results) if result is None]
+        texts = [
+            f"{title}. {content}" if title else content
+            for title, content in (articles[i] for i in pending)
+        ]
+        entities_list = self._extract_entities_batch(texts, batch_size)
+
+        for i, text, entities in zip(pending, texts, entities_list):
+            results[i] = self._build_results(text, articles[i][1], entities)
+            self._cache_put(keys[i], results[i])
+
+        return results
+
+    def _cache_key(self, title: str, content: str) -> tuple:
+        """Build the result cache key for an article under this configuration"""
+        digest = blake2b(digest_size=16)
+        digest.update((title or "").encode("utf-8"))
+        digest.update(b"\0")
+        digest.update((content or "").encode("utf-8"))
+        return (self._cache_config, digest.digest())
+
+    @staticmethod
+    def _copy_results(results: NLPResults) -> NLPResults:
+        """Copy results so callers never share mutable fields with the cache"""
+        return replace(
+            results,
+            entities={k: list(v) for k, v in results.entities.items()},
+            sentiment=dict(results.sentiment),
+        )
+
+    def _cache_get(self, key: tuple) -> Optional[NLPResults]:
+        """Return a copy of cached results for key, or None"""
+        with _nlp_cache_lock:
+            cached = _nlp_cache.get(key)
+            if cached is None:
+                return None
+            _nlp_cache.move_to_end(key)
+        return self._copy_results(cached)
+
+    def _cache_put(self, key: tuple, results: NLPResults):
+        """Store a copy of results under key, evicting the oldest entry"""
+        results = self._copy_results(results)
+        with _nlp_cache_lock:
+            _nlp_cache[key] = results
+            if len(_nlp_cache) > _NLP_CACHE_SIZE:
+                _nlp_cache.popitem(last=False)
+
+    def _build_results(
+        self, text: str, content: str, entities: Dict[str, List[str]]
+    ) -> NLPResults:
+        """
+        Run the per-article analyses and assemble the results
+
+        Args:
+            text (str): Title and content combined
+            content (str): Article content
+            entities (Dict[str, List[str]]): Already extracted entities
+
+        Returns:
+            NLPResults: Comprehensive analysis results
+        """
+        # Language detection
+        language, lang_confidence = self._detect_language(text)
 
         # Sentiment analysis
         sentiment = self._analyze_sentiment(text)
@@ -213,28 +476,13 @@ class NLPProcessor:
         Returns:
             Tuple[str, float]: Language code and confidence
         """
-        if not text or len(text.strip()) < 10:
-            return "unknown", 0.0
+        sample = text[:1000] if text else ""  # Use first 1000 chars
 
-        # Method 1: langdetect (more accurate)
-        if LANGDETECT_AVAILABLE:
-            try:
-                detected_langs = detect_langs(text[:1000])  # Use first 1000 chars
-                if detected_langs:
-                    top_lang = detected_langs[0]
-                    return top_lang.lang, top_lang.prob
-            except Exception as e:
-                self.logger.debug(f"langdetect failed: {e}")
-
-        # Method 2: langid (fallback)
-        if LANGID_AVAILABLE:
-            try:
-                lang, confidence = langid.classify(text[:1000])
-                return lang, confidence
-            except Exception as e:
-                self.logger.debug(f"langid failed: {e}")
+        # Strip only the sample, not a full copy of a long article
+        if len(sample.strip()) < 10:
+            return "unknown", 0.0
 
-        return "unknown", 0.0
+        return _classify_language(sample)
 
     def _extract_entities(self, text: str) -> Dict[str, List[str]]:
         """
@@ -246,7 +494,57 @@ class NLPProcessor:
         Returns:
             Dict[str, List[str]]: Entities grouped by type
         """
-        entities = {
+        if not SPACY_AVAILABLE or not self.nlp:
+            return self._empty_entities()
+
+        try:
+            doc = self.nlp(text[: self._ner_limit()])
+            return self._entities_from_doc(doc)
+        except Exception as e:
+            self.logger.debug(f"Entity extraction failed: {e}")
+            return self._empty_entities()
+
+    def _extract_entities_batch(
+        self, texts: List[str], batch_size: int = 32
+    ) -> List[Dict[str, List[str]]]:
+        """
+        Extract named entities from many texts with spaCy's nlp.pipe
+
+        Args:
+            texts (List[str]): Texts to analyze
+            batch_size (int): Number of texts spaCy processes per batch
+
+        Returns:
+            List[Dict[str, List[str]]]: Entities grouped by type, per text
+        """
+        if not SPACY_AVAILABLE or not self.nlp:
+            return [self._empty_entities() for _ in texts]
+
+        # Components NER does not depend on
+        disable = [
+            name for name in ("parser", "lemmatizer") if name in self.nlp.pipe_names
+        ]
+
+        limit = self._ner_limit()
+        try:
+            docs = self.nlp.pipe(
+                (text[:limit] for text in texts),
+                batch_size=batch_size,
+                disable=disable,
+            )
+            return [self._entities_from_doc(doc) for doc in docs]
+        except Exception as e:
+            self.logger.debug(f"Batch entity extraction failed: {e}")
+            return [self._extract_entities(text) for text in texts]
+
+    def _ner_limit(self) -> int:
+        """Characters of text to run NER on, within spaCy's max_length"""
+        return min(self.ner_char_limit, self.nlp.max_length)
+
+    @staticmethod
+    def _empty_entities() -> Dict[str, List[str]]:
+        """Return an empty entity mapping with every tracked type"""
+        return {
             "PERSON": [],
             "ORG": [],
             "GPE": [],  # Geopolitical entities
@@ -256,27 +554,37 @@ class NLPProcessor:
             "PRODUCT": [],
         }
 
-        if not SPACY_AVAILABLE or not self.nlp:
-            return entities
+    def _entities_from_doc(self, doc) -> Dict[str, List[str]]:
+        """
+        Group a spaCy document's entities by type
 
-        try:
-            doc = self.nlp(text[:5000])  # Limit for performance
+        Args:
+            doc: Processed spaCy document
 
-            for ent in doc.ents:
-                entity_type = ent.label_
-                entity_text = ent.text.strip()
+        Returns:
+            Dict[str, List[str]]: Up to five unique entities per type
+        """
+        entities = self._empty_entities()
+        seen = {entity_type: set() for entity_type in entities}
+        open_types = len(entities)
 
-                if entity_type in entities and entity_text:
-                    # Avoid duplicates
-                    if entity_text not in entities[entity_type]:
-                        entities[entity_type].append(entity_text)
+        for ent in doc.ents:
+            entity_type = ent.label_
+            found = entities.get(entity_type)
 
-            # Limit entities per type
-            for entity_type in entities:
-                entities[entity_type] = entities[entity_type][:5]
+            # Skip untracked types and types already at the limit
+            if found is None or len(found) >= 5:
+                continue
 
-        except Exception as e:
-            self.logger.debug(f"Entity extraction failed: {e}")
+            entity_text = ent.text.strip()
+            if entity_text and entity_text not in seen[entity_type]:
+                seen[entity_type].add(entity_text)
+                found.append(entity_text)
+
+                if len(found) == 5:
+                    open_types -= 1
+                    if not open_types:
+                        break
 
         return entities
 
@@ -300,31 +608,27 @@ class NLPProcessor:
             "label": "neutral",
         }
 
+        # Both analyzers read the same prefix; slice it once
+        sample = text[:2000]
+
         # Method 1: VADER sentiment
-        if VADER_AVAILABLE and self.vader_analyzer:
+        if self._vader_scorer is not None:
             try:
-                vader_scores = self.vader_analyzer.polarity_scores(text[:2000])
-                sentiment.update(
-                    {
-                        "compound": vader_scores["compound"],
-                        "positive": vader_scores["pos"],
-                        "negative": vader_scores["neg"],
-                        "neutral": vader_scores["neu"],
-                    }
-                )
+                vader_scores = self._vader_scorer(sample)
+                sentiment["compound"] = vader_scores["compound"]
+                sentiment["positive"] = vader_scores["pos"]
+                sentiment["negative"] = vader_scores["neg"]
+                sentiment["neutral"] = vader_scores["neu"]
             except Exception as e:
                 self.logger.debug(f"VADER sentiment analysis failed: {e}")
 
         # Method 2: TextBlob sentiment
         if TEXTBLOB_AVAILABLE:
             try:
-                blob = TextBlob(text[:2000])
-                sentiment.update(
-                    {
-                        "polarity": blob.sentiment.polarity,
-                        "subjectivity": blob.sentiment.subjectivity,
-                    }
-                )
+                # TextBlob.sentiment re-runs the analyzer on each access
+                blob_sentiment = TextBlob(sample).sentiment
+                sentiment["polarity"] = blob_sentiment.polarity
+                sentiment["subjectivity"] = blob_sentiment.subjectivity
             except Exception as e:
                 self.logger.debug(f"TextBlob sentiment analysis failed: {e}")
 
@@ -388,14 +692,22 @@ class NLPProcessor:
             return ""
 
         try:
-            # Try different summarizers
-            summarizers = [TextRankSummarizer(), LexRankSummarizer(), LuhnSummarizer()]
-
-            parser = PlaintextParser.from_string(text, Tokenizer(language))
-
-            for summarizer in summarizers:
+            tokenizer = self._sumy_tokenizers.get(language)
+            if tokenizer is None:
+                tokenizer = self._sumy_tokenizers[language] = Tokenizer(language)
+
+            document = PlaintextParser.from_string(text, tokenizer).document
+
+            # Try different summarizers; LexRank's matrix work is only worth
+            # it (and only needed as a fallback) on long articles
+            for summarizer in self._sumy_summarizers:
+                if (
+                    isinstance(summarizer, LexRankSummarizer)
+                    and len(text) <= self.LEXRANK_MIN_CHARS
+                ):
+                    continue
                 try:
-                    sentences = summarizer(parser.document, 3)  # 3 sentences
+                    sentences = summarizer(document, 3)  # 3 sentences
                     summary = " ".join([str(sentence) for sentence in sentences])
                     if summary and len(summary) > 50:
                         return summary
@@ -415,9 +727,7 @@ class NLPProcessor:
         try:
             # Lazy load summarizer
             if not self.summarizer:
-                self.summarizer = pipeline(
-                    "summarization", model="facebook/bart-large-cnn", device=-1
-                )  # CPU
+                self.summarizer = _get_summarizer()
 
             # Limit text length for transformer
             max_length = min(1024, len(text))
@@ -435,20 +745,16 @@ class NLPProcessor:
 
     def _summarize_simple(self, text: str) -> str:
         """Simple extractive summarization"""
-        sentences = text.split(".")
-
-        # Filter meaningful sentences
-        meaningful_sentences = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) > 30 and not sentence.lower().startswith(
-                ("click", "read more", "subscribe")
-            ):
-                meaningful_sentences.append(sentence)
-
-        # Return first 2-3 sentences as summary
-        if meaningful_sentences:
-            summary_sentences = meaningful_sentences[:3]
-            return ". ".join(summary_sentences) + "."
+        # First three meaningful sentences; stops scanning once found
+        summary_sentences = list(
+            islice(
+                (
+                    sentence
+                    for sentence in map(str.strip, _SENTENCE_SPLIT_RE.split(text))
+                    if len(sentence) > 30 and not _JUNK_SENTENCE_RE.match(sentence)
+                ),
+                3,
+            )
+        )
 
-        return ""
+        return " ".join(summary_sentences)
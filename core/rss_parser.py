@@ -6,23 +6,92 @@ Handles RSS/Atom feed parsing and entry processing
 """
 
 import re
+import threading
+import time
 import logging
 import feedparser
-from datetime import datetime
-from typing import List, Optional, Dict
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Dict, Tuple
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
+from dateutil import parser as date_parser
 
 from models.article import Article
 from utils.exceptions import ExtractionError
 from core.http_client import HTTPClient
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    LXML_AVAILABLE = True
+    _PARSER = "lxml"
+except ImportError:  # pragma: no cover - lxml is a core dependency
+    LXML_AVAILABLE = False
+    _PARSER = "html.parser"
+
+# Feed-like URL paths (.xml/.rss files, /rss and /feed(s) segments) as one
+# alternation, so a URL is scanned once rather than once per pattern
+_RSS_URL_RE = re.compile(r"\.(?:xml|rss)$|/(?:rss|feed)(?:/|$)|/feeds/")
+
+# Feed vocabularies the streaming parser understands; elements from any other
+# namespace (Media RSS, iTunes, ...) are skipped, since they reuse local names
+# such as title, description and content for unrelated data
+_RSS10_NS = "http://purl.org/rss/1.0/"
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_ATOM03_NS = "http://purl.org/atom/ns#"
+_CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+_DC_NS = "http://purl.org/dc/elements/1.1/"
+
+# Entry elements: RSS 2.0/0.9x items (no namespace), RSS 1.0 (RDF) items and
+# Atom 1.0/0.3 entries
+_ENTRY_TAGS = (
+    "{}item",
+    f"{{{_RSS10_NS}}}item",
+    f"{{{_ATOM_NS}}}entry",
+    f"{{{_ATOM03_NS}}}entry",
+)
+
+# Fully qualified entry child tag -> the entry field it fills
+_ENTRY_FIELDS = {
+    f"{{{ns}}}{name}" if ns else name: field
+    for ns in ("", _RSS10_NS, _ATOM_NS, _ATOM03_NS)
+    for name, field in (
+        ("title", "title"),
+        ("link", "link"),
+        ("guid", "guid"),
+        ("description", "summary"),
+        ("summary", "summary"),
+        ("content", "content"),
+        ("author", "author"),
+        ("pubDate", "published"),
+        ("published", "published"),
+        ("updated", "updated"),
+        ("category", "category"),
+    )
+}
+_ENTRY_FIELDS.update(
+    {
+        f"{{{_ATOM03_NS}}}issued": "published",
+        f"{{{_ATOM03_NS}}}modified": "updated",
+        f"{{{_CONTENT_NS}}}encoded": "content",
+        f"{{{_DC_NS}}}creator": "author",
+        f"{{{_DC_NS}}}date": "published",
+        f"{{{_DC_NS}}}subject": "category",
+    }
+)
+
 
 class RSSParser:
     """
     Professional RSS/Atom feed parser with robust entry processing
     """
 
+    # Seconds a feedparser result stays reusable, and how many are kept
+    FEED_CACHE_TTL = 60.0
+    FEED_CACHE_SIZE = 128
+
     def __init__(self, http_client: HTTPClient):
         """
         Initialize the RSS parser
@@ -32,6 +101,8 @@ class RSSParser:
         """
         self.http_client = http_client
         self.logger = logging.getLogger(__name__)
+        self._feed_cache: Dict[str, Tuple[float, Any]] = {}
+        self._feed_cache_lock = threading.Lock()
 
     def is_rss_feed(self, url: str) -> bool:
         """
@@ -45,24 +116,10 @@ class RSSParser:
         """
         try:
             # Check URL patterns first (quick check)
-            rss_patterns = [
-                r"\.xml$",
-                r"\.rss$",
-                r"/rss/",
-                r"/feed/",
-                r"/feeds/",
-                r"rss\.xml$",
-                r"feed\.xml$",
-                r"atom\.xml$",
-                r"/rss$",
-                r"/feed$",
-            ]
-
-            url_lower = url.lower()
-            for pattern in rss_patterns:
-                if re.search(pattern, url_lower):
-                    self.logger.debug(f"RSS pattern detected in URL: {pattern}")
-                    return True
+            match = _RSS_URL_RE.search(url.lower())
+            if match:
+                self.logger.debug(f"RSS pattern detected in URL: {match.group()}")
+                return True
 
             # If no pattern matches, try to fetch and check content type
             try:
@@ -85,7 +142,7 @@ class RSSParser:
 
             # Final check: try to parse as RSS (lightweight check)
             try:
-                feed = feedparser.parse(url)
+                feed = self._parse_cached(url)
                 # If feed has entries and no major errors, it's likely RSS
                 if feed.entries and not feed.bozo_exception:
                     self.logger.debug("RSS structure detected via feedparser")
@@ -116,19 +173,24 @@ class RSSParser:
         """
         try:
             self.logger.info(f"Parsing RSS feed: {feed_url}")
-            feed = feedparser.parse(feed_url)
+            entries = self._stream_entries(feed_url, limit)
 
-            if feed.bozo and feed.bozo_exception:
-                self.logger.warning(
-                    f"RSS feed has parsing issues: {feed.bozo_exception}"
-                )
+            if not entries:
+                feed = self._parse_cached(feed_url)
+
+                if feed.bozo and feed.bozo_exception:
+                    self.logger.warning(
+                        f"RSS feed has parsing issues: {feed.bozo_exception}"
+                    )
+
+                entries = feed.entries[:limit] if limit else feed.entries
 
             articles_data = []
-            entries = feed.entries[:limit] if limit else feed.entries
+            source = urlparse(feed_url).netloc
 
             for entry in entries:
                 try:
-                    article_data = self._parse_entry(entry, feed_url)
+                    article_data = self._parse_entry(entry, source)
                     if article_data:
                         articles_data.append(article_data)
 
@@ -145,22 +207,210 @@ class RSSParser:
             self.logger.error(f"Failed to parse RSS feed {feed_url}: {e}")
             raise ExtractionError(f"Failed to parse RSS feed: {str(e)}")
 
-    def _parse_entry(self, entry, feed_url: str) -> Optional[Dict]:
+    def parse_feeds(
+        self, feed_urls: List[str], limit: Optional[int] = None, max_workers: int = 4
+    ) -> Dict[str, List[Dict]]:
+        """
+        Parse several RSS/Atom feeds concurrently
+
+        Args:
+            feed_urls (List[str]): URLs of the RSS feeds
+            limit (int, optional): Maximum number of articles per feed
+            max_workers (int): Maximum number of feeds fetched at once
+
+        Returns:
+            Dict[str, List[Dict]]: Article data per feed URL; a feed that
+                fails to parse maps to an empty list
+        """
+
+        def parse_one(feed_url: str) -> List[Dict]:
+            try:
+                return self.parse_feed(feed_url, limit)
+            except ExtractionError as e:
+                self.logger.error(f"Skipping feed {feed_url}: {e}")
+                return []
+
+        if len(feed_urls) <= 1 or max_workers <= 1:
+            return {feed_url: parse_one(feed_url) for feed_url in feed_urls}
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(feed_urls))
+        ) as executor:
+            return dict(zip(feed_urls, executor.map(parse_one, feed_urls)))
+
+    def _parse_cached(self, url: str) -> feedparser.FeedParserDict:
+        """
+        Parse a feed with feedparser, reusing a recent result for the same URL
+
+        is_rss_feed's final check and parse_feed's fallback both parse the
+        whole feed, so a URL that goes through both is fetched once.
+
+        Args:
+            url (str): Feed URL
+
+        Returns:
+            feedparser.FeedParserDict: Parsed feed
+        """
+        now = time.monotonic()
+        with self._feed_cache_lock:
+            cached = self._feed_cache.get(url)
+        if cached and now - cached[0] < self.FEED_CACHE_TTL:
+            return cached[1]
+
+        feed = feedparser.parse(url)
+
+        with self._feed_cache_lock:
+            if len(self._feed_cache) >= self.FEED_CACHE_SIZE:
+                self._feed_cache = {
+                    key: value
+                    for key, value in self._feed_cache.items()
+                    if now - value[0] < self.FEED_CACHE_TTL
+                }
+                if len(self._feed_cache) >= self.FEED_CACHE_SIZE:
+                    self._feed_cache.pop(next(iter(self._feed_cache)))
+            self._feed_cache[url] = (now, feed)
+        return feed
+
+    def _stream_entries(
+        self, feed_url: str, limit: Optional[int] = None
+    ) -> List[feedparser.FeedParserDict]:
+        """
+        Incrementally parse feed entries straight off the response stream
+
+        Each entry is converted and then freed as soon as its closing tag is
+        seen, so memory stays proportional to one entry rather than the whole
+        document, and the download stops once limit entries have been read.
+
+        Args:
+            feed_url (str): URL of the RSS feed
+            limit (int, optional): Maximum number of entries to read
+
+        Returns:
+            List[feedparser.FeedParserDict]: Entries shaped like feedparser's;
+                empty if the feed could not be streamed, in which case the
+                caller falls back to feedparser
+        """
+        if not LXML_AVAILABLE:
+            return []
+
+        entries = []
+        try:
+            with self.http_client.fetch_stream(feed_url) as response:
+                for _, element in etree.iterparse(
+                    response.raw,
+                    events=("end",),
+                    tag=_ENTRY_TAGS,
+                    recover=True,
+                    resolve_entities=False,
+                    no_network=True,
+                ):
+                    entries.append(self._element_to_entry(element))
+
+                    # Drop the entry and its already-processed siblings
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+
+                    if limit and len(entries) >= limit:
+                        break
+
+        except Exception as e:
+            self.logger.debug(f"Streaming parse failed for {feed_url}: {e}")
+            return []
+
+        return entries
+
+    def _element_to_entry(self, element) -> feedparser.FeedParserDict:
+        """
+        Convert an RSS item or Atom entry element to a feedparser-style entry
+
+        Args:
+            element: lxml element of the entry
+
+        Returns:
+            feedparser.FeedParserDict: Entry with the fields _parse_entry reads
+        """
+        entry = feedparser.FeedParserDict()
+        tags = []
+        guid = None
+        has_published = False
+
+        for child in element:
+            if not isinstance(child.tag, str):
+                continue
+
+            field = _ENTRY_FIELDS.get(child.tag)
+            if field is None:
+                continue
+            text = (child.text or "").strip()
+
+            if field == "title":
+                entry["title"] = text
+            elif field == "link":
+                href = child.get("href")
+                if href is None:
+                    entry.setdefault("link", text)
+                elif child.get("rel", "alternate") == "alternate":
+                    entry.setdefault("link", href)
+            elif field == "guid" and child.get("isPermaLink") != "false":
+                guid = text
+            elif field == "summary":
+                entry["summary"] = entry["description"] = text
+            elif field == "content":
+                if len(child):
+                    # Atom type="xhtml" content is inline markup
+                    text = "".join(
+                        etree.tostring(node, encoding="unicode") for node in child
+                    )
+                entry["content"] = [feedparser.FeedParserDict(value=text)]
+            elif field == "author":
+                author = child.findtext("{*}name") if len(child) else text
+                entry.setdefault("author", (author or "").strip())
+            elif field == "published":
+                entry["published"] = text
+                has_published = True
+            elif field == "updated":
+                if not has_published:
+                    entry["published"] = text
+            elif field == "category":
+                term = child.get("term") or text
+                if term:
+                    tags.append(feedparser.FeedParserDict(term=term))
+
+        if "link" not in entry and guid:
+            entry["link"] = guid
+        if tags:
+            entry["tags"] = tags
+
+        published = entry.get("published")
+        if published:
+            try:
+                parsed = date_parser.parse(published)
+                if parsed.tzinfo is not None:
+                    parsed = parsed.astimezone(timezone.utc)
+                entry["published_parsed"] = parsed.timetuple()
+            except (ValueError, OverflowError):
+                pass
+
+        return entry
+
+    def _parse_entry(self, entry, source: str) -> Optional[Dict]:
         """
         Parse a single RSS entry into article data
 
         Args:
             entry: RSS entry from feedparser
-            feed_url (str): Original feed URL
+            source (str): Network location of the feed URL
 
         Returns:
             Optional[Dict]: Article data dictionary or None if parsing fails
         """
         try:
             # Extract basic information
-            title = getattr(entry, "title", "Unknown Title")
-            link = getattr(entry, "link", "")
-            summary = getattr(entry, "summary", "") or getattr(entry, "description", "")
+            get = entry.get
+            title = get("title", "Unknown Title")
+            link = get("link", "")
+            summary = get("summary", "") or get("description", "")
 
             # Extract content (try different fields)
             content = self._extract_entry_content(entry, summary)
@@ -171,10 +421,6 @@ class RSSParser:
             # Extract published date
             published_date = self._extract_entry_date(entry)
 
-            # Extract source from feed URL
-            parsed_feed_url = urlparse(feed_url)
-            source = parsed_feed_url.netloc
-
             # Extract tags/categories
             tags = self._extract_entry_tags(entry)
 
@@ -209,24 +455,58 @@ class RSSParser:
         content = ""
 
         # Try different content fields
-        if hasattr(entry, "content") and entry.content:
+        entry_content = entry.get("content")
+        if entry_content:
             content = (
-                entry.content[0].value
-                if isinstance(entry.content, list)
-                else entry.content
+                entry_content[0].value
+                if isinstance(entry_content, list)
+                else entry_content
             )
-        elif hasattr(entry, "description"):
-            content = entry.description
+        elif "description" in entry:
+            content = entry["description"]
         elif summary:
             content = summary
 
         # Clean HTML from content if present
         if content:
-            soup = BeautifulSoup(content, "html.parser")
-            content = soup.get_text(separator="\n", strip=True)
+            content = self._html_to_text(content)
 
         return content
 
+    def _html_to_text(self, content: str) -> str:
+        """
+        Strip markup from an entry's HTML, one stripped text node per line
+
+        The fragment is parsed straight into lxml, which yields the same
+        text as BeautifulSoup's get_text(separator="\n", strip=True)
+        without building a soup tree; BeautifulSoup remains the fallback
+        for fragments lxml rejects.
+
+        Args:
+            content (str): HTML fragment
+
+        Returns:
+            str: Plain text
+        """
+        # Plain-text summaries have no tags or entities to resolve
+        if "<" not in content and "&" not in content:
+            return content.strip()
+
+        if LXML_AVAILABLE:
+            try:
+                root = lxml_html.fragment_fromstring(content, create_parent="div")
+                etree.strip_elements(
+                    root, "script", "style", etree.Comment, with_tail=False
+                )
+                return "\n".join(
+                    text for text in (node.strip() for node in root.itertext()) if text
+                )
+            except (etree.ParserError, ValueError) as e:
+                self.logger.debug(f"lxml could not parse entry HTML: {e}")
+
+        soup = BeautifulSoup(content, _PARSER)
+        return soup.get_text(separator="\n", strip=True)
+
     def _extract_entry_author(self, entry) -> str:
         """
         Extract author from RSS entry
@@ -239,10 +519,12 @@ class RSSParser:
         """
         author = ""
 
-        if hasattr(entry, "author"):
-            author = entry.author
-        elif hasattr(entry, "author_detail") and entry.author_detail:
-            author = entry.author_detail.get("name", "")
+        if "author" in entry:
+            author = entry["author"]
+        else:
+            author_detail = entry.get("author_detail")
+            if author_detail:
+                author = author_detail.get("name", "")
 
         return author
 
@@ -258,13 +540,14 @@ class RSSParser:
         """
         published_date = None
 
-        if hasattr(entry, "published_parsed") and entry.published_parsed:
+        published_parsed = entry.get("published_parsed")
+        if published_parsed:
             try:
-                published_date = datetime(*entry.published_parsed[:6]).isoformat()
+                published_date = datetime(*published_parsed[:6]).isoformat()
             except:
                 pass
-        elif hasattr(entry, "published"):
-            published_date = entry.published
+        elif "published" in entry:
+            published_date = entry["published"]
 
         return published_date
 
@@ -280,7 +563,7 @@ class RSSParser:
         """
         tags = []
 
-        if hasattr(entry, "tags"):
-            tags = [tag.term for tag in entry.tags if hasattr(tag, "term")]
+        if "tags" in entry:
+            tags = [tag["term"] for tag in entry["tags"] if "term" in tag]
 
         return tags
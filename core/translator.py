@@ -5,8 +5,15 @@ Translation Module
 Professional translation module with multiple provider support
 """
 
+import asyncio
+import json
 import requests
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from requests.adapters import HTTPAdapter
 import time
 from typing import Dict, Optional, List
 import logging
@@ -15,6 +22,77 @@ from enum import Enum
 
 from utils.exceptions import TranslationError
 
+# Try to import orjson for faster decoding of provider responses
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Character classes for _is_latin_script
+_NON_WORD_RE = re.compile(r"\W+")
+_LATIN_RUN_RE = re.compile(r"[\u0000-\u024F]+")
+
+# Word tokens and common English words for _is_likely_english
+_WORD_RE = re.compile(r"\w+")
+_COMMON_ENGLISH_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "from",
+        "up",
+        "about",
+        "into",
+        "through",
+        "during",
+        "before",
+        "after",
+        "above",
+        "below",
+        "between",
+        "among",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "shall",
+        "can",
+        "this",
+        "that",
+        "these",
+        "those",
+    }
+)
+
 
 class TranslationProvider(Enum):
     """Supported translation providers"""
@@ -25,7 +103,7 @@ class TranslationProvider(Enum):
     DEEPL = "deepl"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranslationResult:
     """
     Translation result data class
@@ -52,6 +130,20 @@ class Translator:
     Professional translation class with multiple provider support
     """
 
+    # The free Google endpoint takes one string; batches are joined with a
+    # separator the service leaves untouched, up to this many characters
+    _BATCH_SEPARATOR = "§§§"
+    _MAX_BATCH_CHARS = 5000
+
+    # Translations shared by every translator in the process, least recently
+    # used first, so separate extractors and searchers reuse each other's
+    # work. Longer texts are truncated by the providers' request limits, so
+    # they are not cached.
+    _CACHE_SIZE = 10000
+    _MAX_CACHED_CHARS = 5000
+    _cache: "OrderedDict[tuple, str]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
     def __init__(
         self,
         provider: TranslationProvider = TranslationProvider.GOOGLE_FREE,
@@ -75,6 +167,17 @@ class Translator:
 
         self.logger = logging.getLogger(__name__)
 
+        # Start time of the next rate-limited request, shared across threads
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+        # Pooled session so repeated calls reuse TCP/TLS connections; retries
+        # stay in _translate_with_provider, so the adapter does not retry
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        )
+
         # Language detection patterns
         self.language_patterns = {
             "hi": r"[\u0900-\u097F]",  # Devanagari (Hindi)
@@ -96,6 +199,7 @@ class Translator:
             "ru": r"[\u0400-\u04FF]",  # Russian
             "th": r"[\u0E00-\u0E7F]",  # Thai
         }
+        self._compile_language_patterns()
 
     def translate(
         self, text: str, target_lang: str = "en", source_lang: str = "auto"
@@ -129,39 +233,260 @@ class Translator:
             )
             return text
 
+        key = self._cache_key(text, target_lang, source_lang)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
             result = self._translate_with_provider(text, target_lang, source_lang)
+            self._cache_put(key, result.translated_text)
             return result.translated_text
 
         except Exception as e:
             self.logger.error(f"Translation failed: {str(e)}")
             return text  # Return original text if translation fails
 
+    def _cache_key(
+        self, text: str, target_lang: str, source_lang: str
+    ) -> Optional[tuple]:
+        """
+        Build the cache key for a translation, or None if it is not cached
+
+        The source language is the resolved one, never 'auto', so a hit is
+        only reused for text detected (or declared) as the same language;
+        the provider is part of the key because the cache is process-wide.
+        """
+        if len(text) > self._MAX_CACHED_CHARS:
+            return None
+        digest = blake2b(text.encode("utf-8"), digest_size=16).digest()
+        return (self.provider, source_lang, target_lang, digest)
+
+    def _cache_get(self, key: Optional[tuple]) -> Optional[str]:
+        """Return a cached translation for key, or None"""
+        if key is None:
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            return cached
+
+    def _cache_put(self, key: Optional[tuple], translated: str):
+        """Cache a translation under key, evicting the least recently used"""
+        if key is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = translated
+            if len(self._cache) > self._CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached translations in the process"""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    async def translate_async(
+        self, text: str, target_lang: str = "en", source_lang: str = "auto"
+    ) -> str:
+        """
+        Translate text without blocking the event loop
+
+        Args:
+            text (str): Text to translate
+            target_lang (str): Target language code
+            source_lang (str): Source language code ('auto' for detection)
+
+        Returns:
+            str: Translated text
+        """
+        return await asyncio.to_thread(self.translate, text, target_lang, source_lang)
+
+    async def translate_batch_async(
+        self,
+        texts: List[str],
+        target_lang: str = "en",
+        source_lang: str = "auto",
+        max_workers: int = 4,
+    ) -> List[str]:
+        """
+        Translate multiple texts without blocking the event loop
+
+        Args:
+            texts (List[str]): List of texts to translate
+            target_lang (str): Target language code
+            source_lang (str): Source language code
+            max_workers (int): Maximum number of concurrent requests
+
+        Returns:
+            List[str]: List of translated texts
+        """
+        return await asyncio.to_thread(
+            self.translate_batch, texts, target_lang, source_lang, max_workers
+        )
+
     def translate_batch(
-        self, texts: List[str], target_lang: str = "en", source_lang: str = "auto"
+        self,
+        texts: List[str],
+        target_lang: str = "en",
+        source_lang: str = "auto",
+        max_workers: int = 4,
     ) -> List[str]:
         """
         Translate multiple texts
 
+        Texts are packed into as few requests as the provider's payload
+        limit allows. Those requests run concurrently, but their starts are
+        still spaced by rate_limit_delay, so the provider sees the same
+        request rate.
+
         Args:
             texts (List[str]): List of texts to translate
             target_lang (str): Target language code
             source_lang (str): Source language code
+            max_workers (int): Maximum number of requests in flight
 
         Returns:
             List[str]: List of translated texts
         """
-        translated_texts = []
 
-        for text in texts:
-            translated = self.translate(text, target_lang, source_lang)
-            translated_texts.append(translated)
+        # Texts are packed into groups that each fit one provider request
+        groups = self._pack_batches(texts)
+
+        def translate_group(group: List[int]) -> List[str]:
+            self._wait_for_rate_limit()
+            return self.translate_many(
+                [texts[index] for index in group], target_lang, source_lang
+            )
+
+        if len(groups) <= 1 or max_workers <= 1:
+            group_results = [translate_group(group) for group in groups]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(groups))
+            ) as executor:
+                group_results = list(executor.map(translate_group, groups))
+
+        results = list(texts)
+        for group, translated in zip(groups, group_results):
+            for index, text in zip(group, translated):
+                results[index] = text
+        return results
+
+    def _pack_batches(self, texts: List[str]) -> List[List[int]]:
+        """
+        Group consecutive texts so each group's joined payload fits a request
+
+        Args:
+            texts (List[str]): Texts to group
+
+        Returns:
+            List[List[int]]: Groups of text indices, in order; a text longer
+                than the limit forms a group of its own
+        """
+        separator_chars = len(self._BATCH_SEPARATOR) + 4
+        groups = []
+        current = []
+        size = 0
+
+        for index, text in enumerate(texts):
+            added = len(text or "") + (separator_chars if current else 0)
+            if current and size + added > self._MAX_BATCH_CHARS:
+                groups.append(current)
+                current, size = [], 0
+                added = len(text or "")
+            current.append(index)
+            size += added
+
+        if current:
+            groups.append(current)
+        return groups
+
+    def _wait_for_rate_limit(self):
+        """Block until this thread may start its next provider request"""
+        if self.rate_limit_delay <= 0:
+            return
+
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self.rate_limit_delay
+
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def translate_many(
+        self, texts: List[str], target_lang: str = "en", source_lang: str = "auto"
+    ) -> List[str]:
+        """
+        Translate several texts, in a single request where possible
+
+        Google Cloud, Microsoft and DeepL accept a list of texts natively;
+        for the free Google endpoint the texts are joined with a separator
+        when they fit in one request. Blank texts and texts already in the
+        target language are returned unchanged.
 
-            # Rate limiting
-            if self.rate_limit_delay > 0:
-                time.sleep(self.rate_limit_delay)
+        Args:
+            texts (List[str]): Texts to translate
+            target_lang (str): Target language code
+            source_lang (str): Source language code ('auto' for detection)
+
+        Returns:
+            List[str]: Translated texts, one per input; originals are
+                returned if translation fails
+        """
+        results = list(texts)
+        keys = [None] * len(texts)
+        pending = []
+        sources = set()
+
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+
+            source = source_lang
+            if source == "auto":
+                try:
+                    source = self.detect_language(text)
+                except Exception as e:
+                    self.logger.debug(
+                        f"Language detection failed, assuming English: {e}"
+                    )
+                    source = "en"
+
+            if source == target_lang:
+                continue
+
+            keys[index] = self._cache_key(text, target_lang, source)
+            cached = self._cache_get(keys[index])
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+                sources.add(source)
+
+        if not pending:
+            return results
+
+        # Let the provider detect when the texts disagree on the source
+        batch_source = sources.pop() if len(sources) == 1 else "auto"
+
+        try:
+            translated = self._with_retries(
+                self._translate_many_with_provider,
+                [texts[index] for index in pending],
+                target_lang,
+                batch_source,
+            )
+        except Exception as e:
+            self.logger.error(f"Batch translation failed: {str(e)}")
+            return results
 
-        return translated_texts
+        for index, text in zip(pending, translated):
+            results[index] = text
+            self._cache_put(keys[index], text)
+        return results
 
     def detect_language(self, text: str) -> str:
         """
@@ -176,10 +501,15 @@ class Translator:
         if not text or not text.strip():
             return "unknown"
 
+        # Pure ASCII cannot match any script pattern below and is always
+        # Latin, so it resolves without scanning the text per pattern
+        if text.isascii():
+            return "en" if re.search(r"\w", text) else "unknown"
+
         # Check for common Indian and other languages first
-        for lang_code, pattern in self.language_patterns.items():
-            if re.search(pattern, text):
-                return lang_code
+        lang_code = self._first_script_language(text)
+        if lang_code:
+            return lang_code
 
         # If no non-Latin script detected, check if it's English or other Latin-based language
         # If text contains mostly Latin characters, it's likely English or similar language
@@ -202,11 +532,41 @@ class Translator:
             return False
 
         # Check for non-Latin scripts
-        for pattern in self.language_patterns.values():
-            if re.search(pattern, text):
-                return True
+        return self._script_re.search(text) is not None
+
+    def _compile_language_patterns(self):
+        """
+        Compile the script patterns into one alternation
+
+        Each alternative sits in a named group recording its position, so a
+        match tells which pattern, earliest-listed first, the character hit.
+        """
+        self._script_codes = list(self.language_patterns)
+        self._script_re = re.compile(
+            "|".join(
+                f"(?P<g{index}>{pattern})"
+                for index, pattern in enumerate(self.language_patterns.values())
+            )
+        )
+
+    def _first_script_language(self, text: str) -> Optional[str]:
+        """
+        Find the language of the first non-Latin script character in the text
+
+        The scan stops at that character, so a long article is classified
+        from its opening rather than read to the end. Characters shared by
+        several patterns resolve to the earliest-listed language.
 
-        return False
+        Args:
+            text (str): Text to analyze
+
+        Returns:
+            Optional[str]: Language code, or None if no pattern matches
+        """
+        match = self._script_re.search(text)
+        if match is None:
+            return None
+        return self._script_codes[int(match.lastgroup[1:])]
 
     def _translate_with_provider(
         self, text: str, target_lang: str, source_lang: str
@@ -222,18 +582,36 @@ class Translator:
         Returns:
             TranslationResult: Translation result
         """
+        if self.provider == TranslationProvider.GOOGLE_FREE:
+            translate = self._translate_google_free
+        elif self.provider == TranslationProvider.GOOGLE_PAID:
+            translate = self._translate_google_paid
+        elif self.provider == TranslationProvider.MICROSOFT:
+            translate = self._translate_microsoft
+        elif self.provider == TranslationProvider.DEEPL:
+            translate = self._translate_deepl
+        else:
+            raise TranslationError(f"Unsupported provider: {self.provider}")
+
+        return self._with_retries(translate, text, target_lang, source_lang)
+
+    def _with_retries(self, func, *args):
+        """
+        Call a provider request with exponential backoff between attempts
+
+        Args:
+            func: Provider request function
+            *args: Arguments passed to func
+
+        Returns:
+            The value returned by func
+
+        Raises:
+            TranslationError: If every attempt fails
+        """
         for attempt in range(self.max_retries):
             try:
-                if self.provider == TranslationProvider.GOOGLE_FREE:
-                    return self._translate_google_free(text, target_lang, source_lang)
-                elif self.provider == TranslationProvider.GOOGLE_PAID:
-                    return self._translate_google_paid(text, target_lang, source_lang)
-                elif self.provider == TranslationProvider.MICROSOFT:
-                    return self._translate_microsoft(text, target_lang, source_lang)
-                elif self.provider == TranslationProvider.DEEPL:
-                    return self._translate_deepl(text, target_lang, source_lang)
-                else:
-                    raise TranslationError(f"Unsupported provider: {self.provider}")
+                return func(*args)
 
             except Exception as e:
                 if attempt == self.max_retries - 1:
@@ -246,6 +624,109 @@ class Translator:
                 )
                 time.sleep(2**attempt)  # Exponential backoff
 
+    def _translate_many_with_provider(
+        self, texts: List[str], target_lang: str, source_lang: str
+    ) -> List[str]:
+        """
+        Translate a list of texts using the configured provider
+
+        Args:
+            texts (List[str]): Texts to translate
+            target_lang (str): Target language
+            source_lang (str): Source language
+
+        Returns:
+            List[str]: Translated texts, one per input
+        """
+        if self.provider == TranslationProvider.GOOGLE_FREE:
+            separator = f"\n\n{self._BATCH_SEPARATOR}\n\n"
+            payload = separator.join(texts)
+
+            if len(texts) > 1 and len(payload) <= self._MAX_BATCH_CHARS:
+                result = self._translate_google_free(payload, target_lang, source_lang)
+                parts = [
+                    part.strip()
+                    for part in result.translated_text.split(self._BATCH_SEPARATOR)
+                ]
+                if len(parts) == len(texts):
+                    return parts
+                self.logger.debug(
+                    "Batched translation lost separators, translating one by one"
+                )
+
+            return [
+                self._translate_google_free(
+                    text, target_lang, source_lang
+                ).translated_text
+                for text in texts
+            ]
+
+        if self.provider == TranslationProvider.GOOGLE_PAID:
+            if not self.api_key:
+                raise TranslationError(
+                    "Google Cloud API key is required for paid translation"
+                )
+            url = f"https://translation.googleapis.com/language/translate/v2?key={self.api_key}"
+            data = {"q": texts, "target": target_lang, "format": "text"}
+            if source_lang != "auto":
+                data["source"] = source_lang
+
+            response = self.session.post(url, data=data, timeout=10)
+            response.raise_for_status()
+            translations = _json_loads(response.content)["data"]["translations"]
+            translated = [translation["translatedText"] for translation in translations]
+
+        elif self.provider == TranslationProvider.MICROSOFT:
+            if not self.api_key:
+                raise TranslationError("Microsoft Translator API key is required")
+            headers = {
+                "Ocp-Apim-Subscription-Key": self.api_key,
+                "Content-Type": "application/json",
+            }
+            params = {"api-version": "3.0", "to": target_lang}
+            if source_lang != "auto":
+                params["from"] = source_lang
+
+            response = self.session.post(
+                "https://api.cognitive.microsofttranslator.com/translate",
+                headers=headers,
+                params=params,
+                json=[{"text": text} for text in texts],
+                timeout=10,
+            )
+            response.raise_for_status()
+            translated = [
+                item["translations"][0]["text"]
+                for item in _json_loads(response.content)
+            ]
+
+        elif self.provider == TranslationProvider.DEEPL:
+            if not self.api_key:
+                raise TranslationError("DeepL API key is required")
+            data = {
+                "auth_key": self.api_key,
+                "text": texts,
+                "target_lang": target_lang.upper(),
+            }
+            if source_lang != "auto":
+                data["source_lang"] = source_lang.upper()
+
+            response = self.session.post(
+                "https://api-free.deepl.com/v2/translate", data=data, timeout=10
+            )
+            response.raise_for_status()
+            translated = [
+                translation["text"]
+                for translation in _json_loads(response.content)["translations"]
+            ]
+
+        else:
+            raise TranslationError(f"Unsupported provider: {self.provider}")
+
+        if len(translated) != len(texts):
+            raise TranslationError("Provider returned a different number of texts")
+        return translated
+
     def _translate_google_free(
         self, text: str, target_lang: str, source_lang: str
     ) -> TranslationResult:
@@ -281,12 +762,12 @@ class Translator:
                         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                     }
 
-                    response = requests.get(
+                    response = self.session.get(
                         base_url, params=params, headers=headers, timeout=15
                     )
                     response.raise_for_status()
 
-                    result = response.json()
+                    result = _json_loads(response.content)
 
                     # Extract translated text
                     if result and len(result) > 0 and result[0]:
@@ -348,10 +829,10 @@ class Translator:
             if source_lang != "auto":
                 data["source"] = source_lang
 
-            response = requests.post(url, data=data, timeout=10)
+            response = self.session.post(url, data=data, timeout=10)
             response.raise_for_status()
 
-            result = response.json()
+            result = _json_loads(response.content)
 
             if "data" in result and "translations" in result["data"]:
                 translation = result["data"]["translations"][0]
@@ -404,12 +885,12 @@ class Translator:
 
             body = [{"text": text}]
 
-            response = requests.post(
+            response = self.session.post(
                 url, headers=headers, params=params, json=body, timeout=10
             )
             response.raise_for_status()
 
-            result = response.json()
+            result = _json_loads(response.content)
 
             if result and len(result) > 0:
                 translation = result[0]
@@ -461,10 +942,10 @@ class Translator:
             if source_lang != "auto":
                 data["source_lang"] = source_lang.upper()
 
-            response = requests.post(url, data=data, timeout=10)
+            response = self.session.post(url, data=data, timeout=10)
             response.raise_for_status()
 
-            result = response.json()
+            result = _json_loads(response.content)
 
             if "translations" in result and len(result["translations"]) > 0:
                 translation = result["translations"][0]
@@ -498,16 +979,19 @@ class Translator:
         if not text:
             return False
 
+        # ASCII word characters are all Latin, so only check that one exists
+        if text.isascii():
+            return _NON_WORD_RE.fullmatch(text) is None
+
         # Remove punctuation and spaces for analysis
-        cleaned_text = re.sub(r"[^\w]", "", text)
-        if not cleaned_text:
+        cleaned_text = _NON_WORD_RE.sub("", text)
+        total_chars = len(cleaned_text)
+        if not total_chars:
             return False
 
-        # Count Latin characters (basic Latin + Latin-1 supplement)
-        latin_chars = sum(
-            1 for char in cleaned_text if ord(char) < 592
-        )  # Covers most Latin scripts
-        total_chars = len(cleaned_text)
+        # Count Latin characters (below U+0250 covers most Latin scripts) by
+        # stripping their runs and measuring what is left, all in C
+        latin_chars = total_chars - len(_LATIN_RUN_RE.sub("", cleaned_text))
 
         # If more than 80% of characters are Latin script, consider it Latin-based
         return (latin_chars / total_chars) > 0.8 if total_chars > 0 else False
@@ -525,65 +1009,11 @@ class Translator:
         if not text:
             return False
 
-        # Check for common English words
-        common_english_words = {
-            "the",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "up",
-            "about",
-            "into",
-            "through",
-            "during",
-            "before",
-            "after",
-            "above",
-            "below",
-            "between",
-            "among",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "shall",
-            "can",
-            "this",
-            "that",
-            "these",
-            "those",
-        }
-
-        words = re.findall(r"\b\w+\b", text.lower())
+        words = _WORD_RE.findall(text.lower())
         if not words:
             return False
 
-        english_word_count = sum(1 for word in words if word in common_english_words)
+        english_word_count = sum(map(_COMMON_ENGLISH_WORDS.__contains__, words))
 
         # If more than 20% of words are common English words, likely English
         return english_word_count / len(words) > 0.2
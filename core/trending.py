@@ -5,18 +5,117 @@ News Search Module
 Module for searching and extracting trending news articles from various sources
 """
 
+import asyncio
+import copy
+import json
+import os
+import re
 import requests
-from typing import List, Dict, Optional, Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, List, Dict, Optional, Any, Tuple
+from urllib.parse import urlsplit
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import time
+from dateutil import parser as date_parser
+
+from core.http_client import HTTPX_AVAILABLE
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from models.article import Article
 from utils.exceptions import TrendingError, APIError
 
+# Try to import orjson for faster decoding of search API responses
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Try to import diskcache for persisting search results across restarts
+try:
+    import diskcache
+
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Relative result dates such as "2 hours ago"
+_RELATIVE_DATE_RE = re.compile(
+    r"(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago", re.IGNORECASE
+)
+_RELATIVE_DATE_UNITS = {
+    "second": timedelta(seconds=1),
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+
+
+def _parse_serp_date(date_str: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a search result date, relative ("2 hours ago") or absolute
+
+    Dates are always returned timezone-aware in UTC so results from either
+    form can be compared and sorted together.
+
+    Args:
+        date_str (str, optional): Date as returned by the search API
+
+    Returns:
+        Optional[datetime]: Parsed date, or None if it cannot be parsed
+    """
+    if not date_str:
+        return None
+
+    match = _RELATIVE_DATE_RE.fullmatch(date_str.strip())
+    if match:
+        unit = _RELATIVE_DATE_UNITS[match.group(2).lower()]
+        return datetime.now(timezone.utc) - int(match.group(1)) * unit
 
-@dataclass
+    return _parse_absolute_date(date_str)
+
+
+@lru_cache(maxsize=1024)
+def _parse_absolute_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse an absolute date string, memoized since results often share dates
+
+    SerpAPI dates look like "11/20/2024, 03:33 PM, +0000 UTC"; the trailing
+    zone name is dropped since the offset already gives the zone.
+
+    Args:
+        date_str (str): Absolute date string
+
+    Returns:
+        Optional[datetime]: Parsed date, or None if it cannot be parsed
+    """
+    date_str = date_str.strip()
+    if date_str.endswith(" UTC"):
+        date_str = date_str[:-4]
+
+    try:
+        parsed = date_parser.parse(date_str)
+    except (ValueError, OverflowError):
+        return None
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+@dataclass(slots=True)
 class NewsSearchResult:
     """
     Data class for news search results
@@ -41,7 +140,7 @@ class NewsSearchResult:
 
     def __post_init__(self):
         if self.published_date is None:
-            self.published_date = datetime.now()
+            self.published_date = datetime.now(timezone.utc)
 
 
 class NewsSearcher:
@@ -55,6 +154,16 @@ class NewsSearcher:
     4. Returning complete Article objects with content
     """
 
+    # Maximum number of cached search results, and bytes kept on disk
+    CACHE_SIZE = 256
+    DISK_CACHE_SIZE_LIMIT = 256 * 2**20
+
+    # Maximum number of extracted articles reused across searches by URL
+    ARTICLE_CACHE_SIZE = 1024
+
+    # (connect, read) timeouts for search API requests, in seconds
+    SEARCH_TIMEOUT = (5, 25)
+
     def __init__(
         self,
         serpapi_key: str = None,
@@ -62,6 +171,9 @@ class NewsSearcher:
         country: str = "IN",
         language: str = "en",
         cache_duration: int = 3600,
+        cache_dir: Optional[str] = None,
+        skip_domains: Optional[Iterable[str]] = None,
+        use_processes: bool = False,
     ):
         """
         Initialize news searcher
@@ -72,12 +184,25 @@ class NewsSearcher:
             country (str): Country code for news search
             language (str): Language code for translation
             cache_duration (int): Cache duration in seconds
+            cache_dir (str, optional): Directory to persist cached results in,
+                so they survive restarts; requires diskcache
+            skip_domains (Iterable[str], optional): Domains (and their
+                subdomains) whose results are dropped before extraction,
+                e.g. hard-paywalled sites that never yield content
+            use_processes (bool): Whether to parse and analyze articles in
+                worker processes, one per CPU, instead of threads
         """
         self.serpapi_key = serpapi_key
         self.newsapi_key = newsapi_key
         self.country = country
         self.language = language
         self.cache_duration = cache_duration
+        self.use_processes = use_processes
+        # Worker processes scale CPU-bound parsing and NLP across cores
+        self._parse_workers = (os.cpu_count() or 4) if use_processes else 5
+        self.skip_domains = frozenset(
+            domain.lower().removeprefix("www.") for domain in skip_domains or ()
+        )
 
         # Initialize components with new simplified API
         # Dynamic import to avoid circular dependency
@@ -86,9 +211,56 @@ class NewsSearcher:
         self.extractor = NewsExtractor(language=language)
         self.logger = logging.getLogger(__name__)
 
-        # Cache for search results
-        self._cache = {}
-        self._cache_timestamps = {}
+        # Pooled session so repeated searches reuse the keep-alive connection;
+        # urllib3 retries rate limits and server errors with backoff
+        self._http = requests.Session()
+        self._http.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            ),
+        )
+
+        # LRU of search results keyed by query, with monotonic store times
+        self._cache: "OrderedDict[str, Tuple[float, List[Article]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # LRU of extracted articles keyed by URL, shared by all searches so
+        # overlapping results are fetched once; guarded by _cache_lock
+        self._article_cache: "OrderedDict[str, Tuple[float, Article]]" = OrderedDict()
+
+        # Validators and decoded bodies of search responses, for conditional
+        # requests once a result has expired; guarded by _cache_lock
+        self._search_validators: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+        # Optional on-disk copy of the cache, read when memory misses
+        self._disk_cache = None
+        if cache_dir:
+            if DISKCACHE_AVAILABLE:
+                self._disk_cache = diskcache.Cache(
+                    os.path.expanduser(cache_dir),
+                    size_limit=self.DISK_CACHE_SIZE_LIMIT,
+                )
+            else:
+                self.logger.warning(
+                    "diskcache is not installed; search results are cached in memory only"
+                )
+
+        # Requests currently being fetched, so concurrent identical calls
+        # wait for the first one instead of repeating it
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Search API requests started ahead of use, keyed like the cache
+        self._prefetched: Dict[str, Tuple[float, Future]] = {}
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
 
     def get_trending_news(self, limit: int = 10) -> List[Article]:
         """
@@ -101,103 +273,532 @@ class NewsSearcher:
             List[Article]: List of trending news articles with full content
         """
         cache_key = f"trending_news_{self.country}_{limit}"
+        return self._single_flight(
+            cache_key, self._fetch_trending_news, cache_key, limit
+        )
+
+    def search_news_by_keyword(self, keyword: str, limit: int = 10) -> List[Article]:
+        """
+        Search for news articles by keyword and extract full content
+
+        Args:
+            keyword (str): Search keyword or phrase
+            limit (int): Maximum number of articles to return
 
-        # Check cache
-        if self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
+        Returns:
+            List[Article]: List of news articles with full content
+        """
+        cache_key = f"search_{keyword}_{limit}"
+        return self._single_flight(
+            cache_key, self._fetch_news_by_keyword, cache_key, keyword, limit
+        )
 
+    async def aget_trending_news(self, limit: int = 10) -> List[Article]:
+        """
+        Asynchronously get trending news articles with full content extraction
+
+        Args:
+            limit (int): Maximum number of articles to return
+
+        Returns:
+            List[Article]: List of trending news articles with full content
+        """
+        cache_key = f"trending_news_{self.country}_{limit}"
+        return await self._asingle_flight(
+            cache_key, self._afetch_trending_news, cache_key, limit
+        )
+
+    async def asearch_news_by_keyword(
+        self, keyword: str, limit: int = 10
+    ) -> List[Article]:
+        """
+        Asynchronously search for news articles by keyword and extract content
+
+        Args:
+            keyword (str): Search keyword or phrase
+            limit (int): Maximum number of articles to return
+
+        Returns:
+            List[Article]: List of news articles with full content
+        """
+        cache_key = f"search_{keyword}_{limit}"
+        return await self._asingle_flight(
+            cache_key, self._afetch_news_by_keyword, cache_key, keyword, limit
+        )
+
+    def _fetch_trending_news(self, cache_key: str, limit: int) -> List[Article]:
+        """Search for trending news and extract the articles, uncached"""
         try:
             # Search for trending news articles
-            news_results = self._search_trending_news(limit)
+            news_results = self._search(cache_key, self._search_trending_news, limit)
 
-            # Extract full content from each article
-            articles = []
-            for i, news_item in enumerate(news_results):
-                try:
-                    self.logger.info(
-                        f"Extracting article {i+1}/{len(news_results)}: {news_item.title[:50]}..."
-                    )
+            # Extract full content from all articles concurrently
+            return self._extract_search_results(news_results)
 
-                    # Extract full article content
-                    article = self.extractor.extract_from_url(news_item.url)
-
-                    # Enrich with search metadata
-                    article.category = news_item.category
-                    if not article.published_date and news_item.published_date:
-                        article.published_date = news_item.published_date
+        except Exception as e:
+            self.logger.error(f"Failed to fetch trending news: {str(e)}")
+            raise TrendingError(f"Failed to fetch trending news: {str(e)}")
 
-                    articles.append(article)
+    def _fetch_news_by_keyword(
+        self, cache_key: str, keyword: str, limit: int
+    ) -> List[Article]:
+        """Search for news by keyword and extract the articles, uncached"""
+        try:
+            # Search for news by keyword
+            news_results = self._search(
+                cache_key, self._search_news_by_keyword, keyword, limit
+            )
 
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to extract article from {news_item.url}: {e}"
-                    )
-                    continue
+            # Extract full content from all articles concurrently
+            return self._extract_search_results(news_results)
 
-            # Cache results
-            self._cache[cache_key] = articles
-            self._cache_timestamps[cache_key] = datetime.now()
+        except Exception as e:
+            self.logger.error(f"Failed to search news for '{keyword}': {str(e)}")
+            raise TrendingError(f"Failed to search news for '{keyword}': {str(e)}")
 
-            return articles
+    async def _afetch_trending_news(self, cache_key: str, limit: int) -> List[Article]:
+        """Asynchronously search for trending news and extract the articles"""
+        try:
+            news_results = await asyncio.to_thread(
+                self._search, cache_key, self._search_trending_news, limit
+            )
+            return await self._aextract_search_results(news_results)
 
         except Exception as e:
             self.logger.error(f"Failed to fetch trending news: {str(e)}")
             raise TrendingError(f"Failed to fetch trending news: {str(e)}")
 
-    def search_news_by_keyword(self, keyword: str, limit: int = 10) -> List[Article]:
+    async def _afetch_news_by_keyword(
+        self, cache_key: str, keyword: str, limit: int
+    ) -> List[Article]:
+        """Asynchronously search for news by keyword and extract the articles"""
+        try:
+            news_results = await asyncio.to_thread(
+                self._search, cache_key, self._search_news_by_keyword, keyword, limit
+            )
+            return await self._aextract_search_results(news_results)
+
+        except Exception as e:
+            self.logger.error(f"Failed to search news for '{keyword}': {str(e)}")
+            raise TrendingError(f"Failed to search news for '{keyword}': {str(e)}")
+
+    def _join_flight(self, cache_key: str) -> Tuple[Any, Optional[Future]]:
         """
-        Search for news articles by keyword and extract full content
+        Find cached results or an in-flight request for a key, or register one
 
         Args:
-            keyword (str): Search keyword or phrase
-            limit (int): Maximum number of articles to return
+            cache_key (str): Cache key of the request
 
         Returns:
-            List[Article]: List of news articles with full content
+            Tuple[Any, Optional[Future]]: (cached articles, None) on a cache
+                hit, (None, future) when another caller is already fetching,
+                or (None, None) when this caller now owns the request and
+                must call _land_flight
         """
-        cache_key = f"search_{keyword}_{limit}"
+        with self._inflight_lock:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached, None
+
+            future = self._inflight.get(cache_key)
+            if future is not None:
+                return None, future
+
+            self._inflight[cache_key] = Future()
+            return None, None
+
+    def _land_flight(
+        self,
+        cache_key: str,
+        articles: Optional[List[Article]] = None,
+        error: Optional[BaseException] = None,
+    ):
+        """
+        Cache an owned request's results and hand them to waiting callers
 
-        # Check cache
-        if self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
+        Args:
+            cache_key (str): Cache key of the request
+            articles (List[Article], optional): Results of the request
+            error (BaseException, optional): Error the request raised instead
+        """
+        with self._inflight_lock:
+            future = self._inflight.pop(cache_key)
+            if error is None:
+                self._cache_put(cache_key, articles)
+
+        if error is None:
+            future.set_result(articles)
+        else:
+            future.set_exception(error)
+
+    def _single_flight(self, cache_key: str, fetch, *args) -> List[Article]:
+        """
+        Return cached results, or run fetch once for all concurrent callers
+
+        Args:
+            cache_key (str): Cache key of the request
+            fetch: Uncached fetch method
+            *args: Arguments passed to fetch
+
+        Returns:
+            List[Article]: Articles from the cache or the shared request
+        """
+        cached, future = self._join_flight(cache_key)
+        if cached is not None:
+            return cached
+        if future is not None:
+            return future.result()
 
         try:
-            # Search for news by keyword
-            news_results = self._search_news_by_keyword(keyword, limit)
+            articles = fetch(*args)
+        except BaseException as e:
+            self._land_flight(cache_key, error=e)
+            raise
 
-            # Extract full content from each article
-            articles = []
-            for i, news_item in enumerate(news_results):
-                try:
-                    self.logger.info(
-                        f"Extracting article {i+1}/{len(news_results)}: {news_item.title[:50]}..."
-                    )
+        self._land_flight(cache_key, articles)
+        return articles
 
-                    # Extract full article content
-                    article = self.extractor.extract_from_url(news_item.url)
+    async def _asingle_flight(self, cache_key: str, fetch, *args) -> List[Article]:
+        """
+        Asynchronous _single_flight; fetch is a coroutine function
 
-                    # Enrich with search metadata
-                    article.category = news_item.category
-                    if not article.published_date and news_item.published_date:
-                        article.published_date = news_item.published_date
+        Args:
+            cache_key (str): Cache key of the request
+            fetch: Uncached coroutine fetch method
+            *args: Arguments passed to fetch
 
-                    articles.append(article)
+        Returns:
+            List[Article]: Articles from the cache or the shared request
+        """
+        cached, future = self._join_flight(cache_key)
+        if cached is not None:
+            return cached
+        if future is not None:
+            return await asyncio.wrap_future(future)
 
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to extract article from {news_item.url}: {e}"
-                    )
+        try:
+            articles = await fetch(*args)
+        except BaseException as e:
+            self._land_flight(cache_key, error=e)
+            raise
+
+        self._land_flight(cache_key, articles)
+        return articles
+
+    def prefetch_trending_news(self, limit: int = 10):
+        """
+        Start the trending news search in the background
+
+        A later get_trending_news call with the same limit reuses the
+        response instead of waiting for a new search request.
+
+        Args:
+            limit (int): Maximum number of articles the later call will request
+        """
+        cache_key = f"trending_news_{self.country}_{limit}"
+        self._prefetch(cache_key, self._search_trending_news, limit)
+
+    def prefetch_news_by_keyword(self, keyword: str, limit: int = 10):
+        """
+        Start a keyword news search in the background
+
+        A later search_news_by_keyword call with the same arguments reuses
+        the response instead of waiting for a new search request.
+
+        Args:
+            keyword (str): Search keyword or phrase
+            limit (int): Maximum number of articles the later call will request
+        """
+        cache_key = f"search_{keyword}_{limit}"
+        self._prefetch(cache_key, self._search_news_by_keyword, keyword, limit)
+
+    def _prefetch(self, cache_key: str, search, *args):
+        """
+        Submit a search request to the background executor
+
+        Args:
+            cache_key (str): Cache key of the call that will use the results
+            search: Search method to run
+            *args: Arguments passed to search
+        """
+        if self._cache_get(cache_key) is not None:
+            return
+
+        with self._prefetch_lock:
+            if cache_key in self._prefetched:
+                return
+
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="news-prefetch"
+                )
+
+            future = self._prefetch_executor.submit(search, *args)
+            self._prefetched[cache_key] = (time.monotonic(), future)
+
+    def _search(self, cache_key: str, search, *args) -> List[NewsSearchResult]:
+        """
+        Run a search, using a prefetched response when one is available
+
+        Args:
+            cache_key (str): Cache key of the calling method
+            search: Search method to run when nothing was prefetched
+            *args: Arguments passed to search
+
+        Returns:
+            List[NewsSearchResult]: List of news search results
+        """
+        with self._prefetch_lock:
+            prefetched = self._prefetched.pop(cache_key, None)
+
+        # Prefetched results older than the cache duration are stale
+        if prefetched and time.monotonic() - prefetched[0] < self.cache_duration:
+            self.logger.debug(f"Using prefetched search results for {cache_key}")
+            return prefetched[1].result()
+
+        return search(*args)
+
+    def _extract_search_results(
+        self, news_results: List[NewsSearchResult]
+    ) -> List[Article]:
+        """
+        Extract full articles for search results, fetching them concurrently
+
+        Args:
+            news_results (List[NewsSearchResult]): Search results to extract
+
+        Returns:
+            List[Article]: Extracted articles enriched with search metadata;
+                results that fail to extract are logged and skipped
+        """
+        news_results = self._drop_skipped_domains(news_results)
+        cached, urls = self._split_cached_articles(news_results)
+        extracted = (
+            self.extractor.extract_many(
+                urls,
+                max_workers=self._parse_workers,
+                use_processes=self.use_processes,
+            )
+            if urls
+            else []
+        )
+        articles = self._merge_articles(news_results, cached, extracted)
+        return self._enrich_articles(news_results, articles)
+
+    async def _aextract_search_results(
+        self, news_results: List[NewsSearchResult]
+    ) -> List[Article]:
+        """
+        Asynchronously extract full articles for search results
+
+        Args:
+            news_results (List[NewsSearchResult]): Search results to extract
+
+        Returns:
+            List[Article]: Extracted articles enriched with search metadata;
+                results that fail to extract are logged and skipped
+        """
+        news_results = self._drop_skipped_domains(news_results)
+        cached, urls = self._split_cached_articles(news_results)
+
+        if not urls:
+            extracted = []
+        elif HTTPX_AVAILABLE:
+            extracted = await self.extractor.aextract_from_urls(
+                urls,
+                max_workers=self._parse_workers,
+                use_processes=self.use_processes,
+            )
+        else:
+            extracted = await asyncio.to_thread(
+                self.extractor.extract_many,
+                urls,
+                max_workers=self._parse_workers,
+                use_processes=self.use_processes,
+            )
+
+        articles = self._merge_articles(news_results, cached, extracted)
+        return self._enrich_articles(news_results, articles)
+
+    def _drop_skipped_domains(
+        self, news_results: List[NewsSearchResult]
+    ) -> List[NewsSearchResult]:
+        """
+        Remove search results hosted on skip_domains or their subdomains
+
+        Args:
+            news_results (List[NewsSearchResult]): Search results to filter
+
+        Returns:
+            List[NewsSearchResult]: Results worth extracting
+        """
+        if not self.skip_domains:
+            return news_results
+
+        kept = []
+        for item in news_results:
+            host = (urlsplit(item.url).hostname or "").removeprefix("www.")
+            parts = host.split(".")
+            # Match the host and every parent domain, e.g. a.b.com, b.com, com
+            if any(".".join(parts[i:]) in self.skip_domains for i in range(len(parts))):
+                self.logger.debug(f"Skipping result from skipped domain: {item.url}")
+            else:
+                kept.append(item)
+
+        return kept
+
+    def _split_cached_articles(
+        self, news_results: List[NewsSearchResult]
+    ) -> Tuple[Dict[str, Article], List[str]]:
+        """
+        Look up already extracted articles for search results by URL
+
+        Args:
+            news_results (List[NewsSearchResult]): Search results to extract
+
+        Returns:
+            Tuple[Dict[str, Article], List[str]]: Cached articles by URL, and
+                the URLs that still need extracting, without duplicates
+        """
+        cached = {}
+        urls = []
+        now = time.monotonic()
+
+        with self._cache_lock:
+            for item in news_results:
+                if item.url in cached or item.url in urls:
                     continue
 
-            # Cache results
-            self._cache[cache_key] = articles
-            self._cache_timestamps[cache_key] = datetime.now()
+                entry = self._article_cache.get(item.url)
+                if entry is not None and now - entry[0] < self.cache_duration:
+                    self._article_cache.move_to_end(item.url)
+                    cached[item.url] = entry[1]
+                else:
+                    urls.append(item.url)
 
-            return articles
+        self.logger.info(
+            f"Extracting {len(urls)} articles ({len(cached)} already extracted)"
+        )
+        return cached, urls
 
-        except Exception as e:
-            self.logger.error(f"Failed to search news for '{keyword}': {str(e)}")
-            raise TrendingError(f"Failed to search news for '{keyword}': {str(e)}")
+    def _merge_articles(
+        self,
+        news_results: List[NewsSearchResult],
+        cached: Dict[str, Article],
+        extracted: List[Article],
+    ) -> List[Article]:
+        """
+        Cache newly extracted articles and order all articles like the results
+
+        Args:
+            news_results (List[NewsSearchResult]): Search results that were extracted
+            cached (Dict[str, Article]): Previously extracted articles by URL
+            extracted (List[Article]): Articles extracted for this search
+
+        Returns:
+            List[Article]: Copies of the articles, one per extracted result, so
+                enriching them leaves the cached articles untouched
+        """
+        articles_by_url = dict(cached)
+        now = time.monotonic()
+
+        with self._cache_lock:
+            for article in extracted:
+                articles_by_url[article.url] = article
+                self._article_cache[article.url] = (now, article)
+                self._article_cache.move_to_end(article.url)
+                if len(self._article_cache) > self.ARTICLE_CACHE_SIZE:
+                    self._article_cache.popitem(last=False)
+
+        return [
+            copy.copy(articles_by_url[item.url])
+            for item in news_results
+            if item.url in articles_by_url
+        ]
+
+    def _enrich_articles(
+        self, news_results: List[NewsSearchResult], articles: List[Article]
+    ) -> List[Article]:
+        """
+        Copy search metadata onto the articles extracted from the results
+
+        Args:
+            news_results (List[NewsSearchResult]): Search results that were extracted
+            articles (List[Article]): Articles extracted from their URLs
+
+        Returns:
+            List[Article]: The enriched articles
+        """
+        news_items = {item.url: item for item in news_results}
+
+        for article in articles:
+            news_item = news_items.get(article.url)
+            if news_item is None:
+                continue
+
+            article.category = news_item.category
+            if not article.published_date and news_item.published_date:
+                article.published_date = news_item.published_date
+
+        if len(articles) < len(news_results):
+            self.logger.warning(
+                f"Extracted {len(articles)} of {len(news_results)} news articles"
+            )
+
+        return articles
+
+    def _get_search_json(self, url: str, params: Dict[str, Any]) -> Any:
+        """
+        GET a search API response, revalidating a previous one when possible
+
+        When an earlier response for the same request carried an ETag or
+        Last-Modified header, the request is made conditional and a 304
+        reuses the earlier decoded body. Endpoints that send neither header
+        are requested unconditionally.
+
+        Args:
+            url (str): Endpoint URL
+            params (Dict[str, Any]): Query parameters
+
+        Returns:
+            Any: Decoded JSON body
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        key = (url, tuple(sorted((name, str(value)) for name, value in params.items())))
+        with self._cache_lock:
+            validated = self._search_validators.get(key)
+
+        headers = {}
+        if validated:
+            etag, last_modified, _ = validated
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = self._http.get(
+            url, params=params, headers=headers, timeout=self.SEARCH_TIMEOUT
+        )
+
+        if response.status_code == 304 and validated:
+            self.logger.debug(f"Search response not modified: {url}")
+            return validated[2]
+
+        response.raise_for_status()
+        data = _json_loads(response.content)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._cache_lock:
+                self._search_validators[key] = (etag, last_modified, data)
+                self._search_validators.move_to_end(key)
+                if len(self._search_validators) > self.CACHE_SIZE:
+                    self._search_validators.popitem(last=False)
+
+        return data
 
     def _search_trending_news(self, limit: int) -> List[NewsSearchResult]:
         """
@@ -224,10 +825,7 @@ class NewsSearcher:
                 "num": limit,
             }
 
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._get_search_json(url, params)
 
             if "error" in data:
                 raise APIError(f"SerpAPI error: {data['error']}")
@@ -245,15 +843,10 @@ class NewsSearcher:
                         search_term="trending",
                     )
 
-                    # Parse date if available
-                    if "date" in item:
-                        try:
-                            # Parse different date formats
-                            date_str = item["date"]
-                            # Add parsing logic for different date formats
-                            result.published_date = datetime.now()  # Fallback for now
-                        except:
-                            result.published_date = datetime.now()
+                    # Parse date if available; otherwise it stays at now
+                    published_date = _parse_serp_date(item.get("date"))
+                    if published_date:
+                        result.published_date = published_date
 
                     news_results.append(result)
 
@@ -296,10 +889,7 @@ class NewsSearcher:
                 "num": limit,
             }
 
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._get_search_json(url, params)
 
             if "error" in data:
                 raise APIError(f"SerpAPI error: {data['error']}")
@@ -317,15 +907,10 @@ class NewsSearcher:
                         search_term=keyword,
                     )
 
-                    # Parse date if available
-                    if "date" in item:
-                        try:
-                            # Parse different date formats
-                            date_str = item["date"]
-                            # Add parsing logic for different date formats
-                            result.published_date = datetime.now()  # Fallback for now
-                        except:
-                            result.published_date = datetime.now()
+                    # Parse date if available; otherwise it stays at now
+                    published_date = _parse_serp_date(item.get("date"))
+                    if published_date:
+                        result.published_date = published_date
 
                     news_results.append(result)
 
@@ -340,26 +925,72 @@ class NewsSearcher:
         except Exception as e:
             raise TrendingError(f"Unexpected error in news search: {str(e)}")
 
-    def _is_cache_valid(self, cache_key: str) -> bool:
+    def _cache_get(self, cache_key: str) -> Optional[List[Article]]:
         """
-        Check if cache entry is still valid
+        Get cached results that are younger than the cache duration
 
         Args:
-            cache_key (str): Cache key to check
+            cache_key (str): Cache key to look up
 
         Returns:
-            bool: True if cache is valid, False otherwise
+            Optional[List[Article]]: Cached articles, or None if absent or expired
+        """
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None:
+                if time.monotonic() - entry[0] < self.cache_duration:
+                    self._cache.move_to_end(cache_key)
+                    return entry[1]
+                del self._cache[cache_key]
+
+        if self._disk_cache is None:
+            return None
+
+        articles, expire_time = self._disk_cache.get(cache_key, expire_time=True)
+        if articles is None:
+            return None
+
+        # Keep the entry's remaining lifetime when promoting it to memory
+        remaining = expire_time - time.time() if expire_time else self.cache_duration
+        stored_at = time.monotonic() - (self.cache_duration - remaining)
+        self._cache_put(cache_key, articles, stored_at, persist=False)
+        return articles
+
+    def _cache_put(
+        self,
+        cache_key: str,
+        articles: List[Article],
+        stored_at: Optional[float] = None,
+        persist: bool = True,
+    ):
+        """
+        Cache results, evicting the least recently used entry when full
+
+        Args:
+            cache_key (str): Cache key to store under
+            articles (List[Article]): Articles to cache
+            stored_at (float, optional): Monotonic time the results were
+                fetched at; defaults to now
+            persist (bool): Whether to also write the results to disk
         """
-        if cache_key not in self._cache or cache_key not in self._cache_timestamps:
-            return False
+        if stored_at is None:
+            stored_at = time.monotonic()
 
-        cache_time = self._cache_timestamps[cache_key]
-        elapsed = (datetime.now() - cache_time).total_seconds()
+        with self._cache_lock:
+            self._cache[cache_key] = (stored_at, articles)
+            self._cache.move_to_end(cache_key)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
 
-        return elapsed < self.cache_duration
+        if persist and self._disk_cache is not None:
+            self._disk_cache.set(cache_key, articles, expire=self.cache_duration)
 
     def clear_cache(self):
         """Clear all cached results"""
-        self._cache.clear()
-        self._cache_timestamps.clear()
+        with self._cache_lock:
+            self._cache.clear()
+            self._article_cache.clear()
+            self._search_validators.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
         self.logger.info("Cache cleared")
@@ -12,8 +12,16 @@ import json
 from dateutil import parser as date_parser
 import hashlib
 
+# Try to import orjson for faster JSON serialization
+try:
+    import orjson
 
-@dataclass
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@dataclass(slots=True)
 class Article:
     """
     Comprehensive article data model
@@ -71,6 +79,9 @@ class Article:
     nlp_summary: str = ""
     nlp_processed: bool = False
 
+    # hash(article_id), computed once since the ID never changes after init
+    _hash: int = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Post-initialization processing"""
         # Calculate word count
@@ -81,11 +92,21 @@ class Article:
 
         # Generate unique article ID
         self.article_id = self._generate_id()
+        self._hash = hash(self.article_id)
 
         # Parse published date if it's a string
         if isinstance(self.published_date, str):
             self.published_date = self._parse_date(self.published_date)
 
+    def __setstate__(self, state):
+        """Restore a pickled article, re-hashing its ID in this process"""
+        # Default pickling of a slotted object stores (None, {slot: value})
+        _, slot_state = state
+        for name, value in slot_state.items():
+            object.__setattr__(self, name, value)
+        # String hashes are salted per process, so the pickled hash is stale
+        self._hash = hash(self.article_id)
+
     def _generate_id(self) -> str:
         """Generate unique article ID based on URL and title"""
         content_hash = hashlib.md5(f"{self.url}{self.title}".encode()).hexdigest()
@@ -133,6 +154,13 @@ class Article:
             "nlp_processed": self.nlp_processed,
         }
 
+    def to_json(self) -> str:
+        """Convert article to a JSON string, encoded by orjson when available"""
+        data = self.to_dict()
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data).decode()
+        return json.dumps(data, ensure_ascii=False)
+
     def get_content_preview(self, max_length: int = 200) -> str:
         """Get a preview of the article content"""
         if not self.content:
@@ -210,4 +238,4 @@ class Article:
 
     def __hash__(self) -> int:
         """Hash based on article ID"""
-        return hash(self.article_id)
+        return self._hash
@@ -56,7 +56,9 @@ setup(
             "pre-commit>=2.0",
         ],
         "ai": ["spacy>=3.4.0"],  # For AI-powered summarization
-        "async": ["aiohttp>=3.8.0", "aiofiles>=0.8.0"],
+        "async": ["aiohttp>=3.8.0", "aiofiles>=0.8.0", "httpx[http2]>=0.24.0"],
+        "fast": ["orjson>=3.6.0"],  # Faster JSON decoding
+        "cache": ["diskcache>=5.0.0"],  # Persistent search result cache
     },
     keywords="news extraction scraping nlp translation trending rss",
     project_urls={
@@ -0,0 +1,62 @@
+"""
+Shared pytest fixtures
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _build_extractor(**kwargs):
+    """Create a NewsExtractor, skipping the test if dependencies are missing"""
+    try:
+        from core.news_extractor import NewsExtractor
+
+        return NewsExtractor(**kwargs)
+    except Exception as e:
+        pytest.skip(f"NewsExtractor initialization failed - missing dependencies: {e}")
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    """NewsExtractor with default parameters, shared across a test module"""
+    return _build_extractor()
+
+
+@pytest.fixture(scope="module")
+def extractor_nlp():
+    """NewsExtractor with NLP enabled, shared across a test module"""
+    return _build_extractor(enable_nlp=True)
+
+
+@pytest.fixture(scope="module")
+def extractor_es():
+    """NewsExtractor translating to Spanish, shared across a test module"""
+    return _build_extractor(language="es")
+
+
+@pytest.fixture(scope="session")
+def nlp():
+    """English spaCy pipeline, loaded once for the whole test session"""
+    from utils.helpers import SPACY_AVAILABLE, _get_nlp
+
+    if not SPACY_AVAILABLE:
+        pytest.skip("spaCy not installed")
+    try:
+        return _get_nlp()
+    except OSError:
+        pytest.skip("spaCy model en_core_web_sm not installed")
+
+
+@pytest.fixture(autouse=True)
+def fresh_translation_cache():
+    """Start each test with an empty process-wide translation cache"""
+    from core.translator import Translator
+
+    Translator.clear_cache()
+    yield
+    Translator.clear_cache()
@@ -13,8 +13,17 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
     # Import the main __init__.py from the root directory
     import __init__ as newsextractor_main
-    from core.news_extractor import NewsExtractor
+    from core.content_parser import ContentParser
+    from core.http_client import decode_html
+    from core.language_processor import LanguageProcessor
+    from core.metadata_extractor import MetadataExtractor
+    from core.rss_parser import RSSParser, _ENTRY_TAGS
+    from core import nlp_processor
+    from core.nlp_processor import NLPProcessor
+    from core.translator import Translator, TranslationResult
+    from core.trending import NewsSearchResult, _parse_serp_date
     from models.article import Article
+    from utils.helpers import SPACY_AVAILABLE, TextProcessor
     from utils.validators import URLValidator
 except ImportError as e:
     # Skip tests if modules cannot be imported
@@ -24,32 +33,36 @@ except ImportError as e:
 class TestNewsExtractor:
     """Test cases for NewsExtractor class"""
 
-    def test_extractor_initialization(self):
+    def test_extractor_initialization(self, extractor):
         """Test that NewsExtractor can be initialized with default parameters"""
-        try:
-            extractor = NewsExtractor()
-            assert extractor is not None
-            assert hasattr(extractor, "extract_from_url")
-        except Exception:
-            pytest.skip("NewsExtractor initialization failed - missing dependencies")
-
-    def test_extractor_with_nlp(self):
+        assert extractor is not None
+        assert hasattr(extractor, "extract_from_url")
+
+    def test_extractor_with_nlp(self, extractor_nlp):
         """Test that NewsExtractor can be initialized with NLP enabled"""
-        try:
-            extractor = NewsExtractor(enable_nlp=True)
-            assert extractor is not None
-        except Exception:
-            pytest.skip("NewsExtractor with NLP failed - missing dependencies")
+        assert extractor_nlp is not None
 
-    def test_extractor_with_custom_language(self):
+    def test_extractor_with_custom_language(self, extractor_es):
         """Test that NewsExtractor can be initialized with custom language"""
-        try:
-            extractor = NewsExtractor(language="es")
-            assert extractor is not None
-        except Exception:
-            pytest.skip(
-                "NewsExtractor with custom language failed - missing dependencies"
-            )
+        assert extractor_es is not None
+
+    def test_extract_many_inside_running_loop(self, extractor, monkeypatch):
+        """Test that extract_many works when called from a running event loop"""
+        import asyncio
+
+        fetched = []
+        monkeypatch.setattr(
+            extractor,
+            "_fetch_many_threaded",
+            lambda urls, *limits: fetched.extend(urls)
+            or [ConnectionError("offline") for _ in urls],
+        )
+
+        async def call_from_loop():
+            return extractor.extract_many(["https://example.com/story"])
+
+        assert asyncio.run(call_from_loop()) == []
+        assert fetched == ["https://example.com/story"]
 
 
 class TestArticleModel:
@@ -84,6 +97,405 @@ class TestArticleModel:
         article = Article(title="Test", content=content, url="https://example.com")
         assert article.read_time == 1
 
+    def test_article_to_json_matches_to_dict(self):
+        """Test JSON export round-trips to the dictionary form"""
+        import json
+
+        article = Article(
+            title="Test",
+            content="One two three",
+            url="https://example.com",
+            published_date="2025-01-02T03:04:05",
+        )
+        assert json.loads(article.to_json()) == article.to_dict()
+
+
+class TestContentParser:
+    """Test cases for ContentParser text cleaning"""
+
+    def test_clean_extracted_content(self):
+        """Test that boilerplate and mostly-numeric lines are dropped"""
+        parser = ContentParser()
+        content = "\n".join(
+            [
+                "This is a real sentence from the article body.",
+                "Click HERE to subscribe to our newsletter",
+                "12/05/2024 - 10:45",
+                "short",
+                "Another   meaningful   sentence about the news.",
+            ]
+        )
+
+        cleaned = parser._clean_extracted_content(content)
+
+        assert cleaned == (
+            "This is a real sentence from the article body.\n\n"
+            "Another meaningful sentence about the news."
+        )
+
+    def test_title_prefers_og_title(self):
+        """Test that og:title wins over the first heading"""
+        parser = ContentParser()
+        html = (
+            '<html><head><meta property="og:title" content="Headline from OpenGraph">'
+            "</head><body><h1>Site navigation heading</h1></body></html>"
+        )
+
+        data = parser.parse_article_data(html, "https://example.com/story")
+
+        assert data["title"] == "Headline from OpenGraph"
+        assert data["metadata"]["source"] == "example.com"
+
+
+class TestHTTPClient:
+    """Test cases for HTTP response handling"""
+
+    @staticmethod
+    def _response(body, content_type):
+        import requests
+
+        response = requests.Response()
+        response._content = body
+        response.headers["Content-Type"] = content_type
+        return response
+
+    def test_header_charset_applied_without_meta(self):
+        """Test that a charset sent only in Content-Type decodes the page"""
+        body = "<html><head><title>Новости дня в Москве</title></head></html>".encode(
+            "cp1251"
+        )
+        html = decode_html(self._response(body, "text/html; charset=windows-1251"))
+
+        data = ContentParser().parse_article_data(html, "https://example.ru/a")
+
+        assert data["title"] == "Новости дня в Москве"
+
+    def test_body_left_to_parser_without_header_charset(self):
+        """Test that pages without a header charset keep their raw bytes"""
+        body = b'<meta charset="utf-8"><title>x</title>'
+
+        assert decode_html(self._response(body, "text/html")) is body
+
+
+class TestRSSParser:
+    """Test cases for the streaming RSS entry converter"""
+
+    MEDIA_RSS = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel><title>Feed</title>
+<item>
+  <title>Real headline</title>
+  <link>https://example.com/a</link>
+  <description>Real summary</description>
+  <content:encoded><![CDATA[<p>Full body</p>]]></content:encoded>
+  <dc:creator>Jane</dc:creator>
+  <pubDate>Mon, 06 Jan 2025 10:00:00 GMT</pubDate>
+  <category>World</category>
+  <media:title>Photo title</media:title>
+  <media:description>Photo caption</media:description>
+  <media:content url="https://example.com/a.jpg"><media:title>x</media:title></media:content>
+</item>
+<item>
+  <title>Second headline</title>
+  <link>https://example.com/b</link>
+  <description>Second summary</description>
+  <media:content url="https://example.com/b.jpg"/>
+</item>
+</channel></rss>"""
+
+    def test_media_rss_matches_feedparser(self):
+        """Test that Media RSS elements do not overwrite the item's own fields"""
+        import feedparser
+        from lxml import etree
+
+        parser = RSSParser(http_client=None)
+        root = etree.fromstring(self.MEDIA_RSS)
+        streamed = [
+            parser._parse_entry(parser._element_to_entry(element), "example.com")
+            for element in root.iter(*_ENTRY_TAGS)
+        ]
+        expected = [
+            parser._parse_entry(entry, "example.com")
+            for entry in feedparser.parse(self.MEDIA_RSS).entries
+        ]
+
+        assert [a["title"] for a in streamed] == ["Real headline", "Second headline"]
+        assert [a["content"] for a in streamed] == ["Full body", "Second summary"]
+        # feedparser itself lets media:description replace the summary
+        assert [a["summary"] for a in streamed] == ["Real summary", "Second summary"]
+        for ours, theirs in zip(streamed, expected):
+            ours.pop("summary")
+            theirs.pop("summary")
+            assert ours == theirs
+
+
+class TestLanguageProcessor:
+    """Test cases for LanguageProcessor translation"""
+
+    @staticmethod
+    def _fake_provider(monkeypatch, translator):
+        """Replace the free Google request with an upper-casing stand-in"""
+        payloads = []
+
+        def fake_google_free(text, target_lang, source_lang):
+            payloads.append(text)
+            return TranslationResult(text, text.upper(), source_lang, target_lang)
+
+        monkeypatch.setattr(translator, "_translate_google_free", fake_google_free)
+        return payloads
+
+    def test_fields_translated_in_one_request(self, monkeypatch):
+        """Test that title, content and summary share a single provider request"""
+        processor = LanguageProcessor(target_language="en")
+        payloads = self._fake_provider(monkeypatch, processor.translator)
+        data = {"title": "titel", "content": "inhalt eins", "summary": "kurz"}
+
+        result = processor._translate_content(data, "de")
+
+        assert len(payloads) == 1
+        assert result["title"] == "TITEL"
+        assert result["content"] == "INHALT EINS"
+        assert result["summary"] == "KURZ"
+        assert result["translated"] is True
+
+    def test_feed_entries_translated_together(self, monkeypatch):
+        """Test that several articles' fields share one provider request"""
+        processor = LanguageProcessor(target_language="de")
+        payloads = self._fake_provider(monkeypatch, processor.translator)
+        articles = [
+            {"title": "first title", "content": "first body"},
+            {"title": "second title", "content": "second body", "summary": "sum"},
+        ]
+
+        processor.process_contents(articles)
+
+        assert len(payloads) == 1
+        assert [a["title"] for a in articles] == ["FIRST TITLE", "SECOND TITLE"]
+        assert articles[1]["summary"] == "SUM"
+        assert all(a["language"] == "en" and a["translated"] for a in articles)
+
+    def test_long_content_chunked_on_paragraphs(self):
+        """Test that long content is split at paragraph boundaries under the limit"""
+        paragraphs = [f"Paragraph {i}. " + "Some words here. " * 20 for i in range(10)]
+        chunks = LanguageProcessor._chunk_text("\n\n".join(paragraphs), 1000)
+
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert "\n\n".join(chunks) == "\n\n".join(p.strip() for p in paragraphs)
+
+    def test_repeated_text_served_from_cache(self, monkeypatch):
+        """Test that identical text is only sent to the provider once"""
+        processor = LanguageProcessor(target_language="en")
+        payloads = self._fake_provider(monkeypatch, processor.translator)
+
+        first = processor._translate_fields(["wiederholter titel"], "de")
+        second = processor._translate_fields(["wiederholter titel"], "de")
+
+        assert first == second == ["WIEDERHOLTER TITEL"]
+        assert payloads == ["wiederholter titel"]
+
+    def test_translations_shared_across_processors(self, monkeypatch):
+        """Test that a second processor reuses the first one's translations"""
+        first = LanguageProcessor(target_language="en")
+        second = LanguageProcessor(target_language="en")
+        payloads = self._fake_provider(monkeypatch, first.translator)
+        other_payloads = self._fake_provider(monkeypatch, second.translator)
+
+        first._translate_fields(["geteilter titel"], "de")
+        result = second._translate_fields(["geteilter titel"], "de")
+
+        assert result == ["GETEILTER TITEL"]
+        assert payloads == ["geteilter titel"]
+        assert other_payloads == []
+
+
+class TestTranslator:
+    """Test cases for Translator"""
+
+    def test_translate_many_sends_one_request(self, monkeypatch):
+        """Test that several texts share one request and keep their order"""
+        translator = Translator()
+        payloads = []
+
+        def fake_google_free(text, target_lang, source_lang):
+            payloads.append(text)
+            return TranslationResult(text, text.upper(), source_lang, target_lang)
+
+        monkeypatch.setattr(translator, "_translate_google_free", fake_google_free)
+
+        result = translator.translate_many(["hallo", "", "welt"], "en", "de")
+
+        assert len(payloads) == 1
+        assert result == ["HALLO", "", "WELT"]
+
+
+class TestMetadataExtractor:
+    """Test cases for MetadataExtractor"""
+
+    def test_jsonld_graph_metadata(self):
+        """Test that Article nodes inside a JSON-LD @graph are extracted"""
+        from bs4 import BeautifulSoup
+
+        html = (
+            '<html><head><script type="application/ld+json">'
+            '{"@graph": [{"@type": "WebSite"}, {"@type": "NewsArticle", '
+            '"headline": "Graph headline", "author": {"name": "A. Writer"}, '
+            '"image": "https://example.com/lead.jpg"}]}'
+            "</script></head><body></body></html>"
+        )
+        metadata = MetadataExtractor().extract_metadata(
+            BeautifulSoup(html, "lxml"), "https://example.com/story"
+        )
+
+        assert metadata["jsonld_headline"] == "Graph headline"
+        assert metadata["jsonld_author"] == "A. Writer"
+        assert metadata["top_image"] == "https://example.com/lead.jpg"
+
+    def test_metadata_batch_preserves_order(self):
+        """Test that batch extraction returns one result per page, in order"""
+        pages = [
+            (
+                f'<html><head><meta name="author" content="Author {i}"></head></html>',
+                f"https://site{i}.example.com/story",
+            )
+            for i in range(3)
+        ]
+        results = MetadataExtractor().extract_metadata_batch(pages, max_workers=2)
+
+        assert [r["author"] for r in results] == ["Author 0", "Author 1", "Author 2"]
+        assert results[2]["source"] == "site2.example.com"
+
+    def test_links_keep_only_outbound_absolute_urls(self):
+        """Test that relative hrefs starting with "http" are not outbound links"""
+        html = (
+            "<html><body><article>"
+            '<a href="https://other.example.org/a">outbound</a>'
+            '<a href="http-status.html">relative</a>'
+            '<a href="https-guide/">relative dir</a>'
+            '<a href="https://example.com/internal">internal</a>'
+            '<a href="http:///no-host">no host</a>'
+            "</article></body></html>"
+        )
+        metadata = MetadataExtractor().extract_metadata(
+            html, "https://example.com/story"
+        )
+
+        assert metadata["links"] == ["https://other.example.org/a"]
+
+
+class TestNLPProcessor:
+    """Test cases for NLPProcessor"""
+
+    class _FakeNLP:
+        """Stand-in spaCy pipeline tagging capitalised words as PERSON"""
+
+        pipe_names = ["tok2vec", "parser", "ner"]
+        max_length = 1000000
+
+        def __init__(self):
+            self.pipe_calls = []
+
+        def _doc(self, text):
+            from types import SimpleNamespace
+
+            ents = [
+                SimpleNamespace(label_="PERSON", text=word.strip(".,"))
+                for word in text.split()
+                if word[0].isupper()
+            ]
+            return SimpleNamespace(ents=ents)
+
+        def __call__(self, text):
+            return self._doc(text)
+
+        def pipe(self, texts, batch_size=32, disable=()):
+            self.pipe_calls.append(list(disable))
+            return (self._doc(text) for text in texts)
+
+    def test_batch_entities_use_single_pipe_call(self, monkeypatch):
+        """Test that batch NER makes one nlp.pipe pass and keeps input order"""
+        processor = NLPProcessor()
+        monkeypatch.setattr(nlp_processor, "SPACY_AVAILABLE", True)
+        processor.nlp = self._FakeNLP()
+
+        results = processor.process_articles_batch(
+            [("Alice wins", "the race"), ("", "then Bob speaks")]
+        )
+
+        assert processor.nlp.pipe_calls == [["parser"]]
+        assert results[0].entities["PERSON"] == ["Alice"]
+        assert results[1].entities["PERSON"] == ["Bob"]
+
+    def test_close_shuts_down_parallel_executor(self):
+        """Test that closing a parallel processor stops its worker threads"""
+        with NLPProcessor(parallel_nlp=True) as processor:
+            executor = processor._executor
+            assert executor is not None
+
+        assert processor._executor is None
+        assert executor._shutdown
+
+    def test_repeated_article_served_from_cache(self, monkeypatch):
+        """Test that re-processing identical content skips the analysis"""
+        processor = NLPProcessor()
+        calls = []
+        build_results = processor._build_results
+        monkeypatch.setattr(
+            processor,
+            "_build_results",
+            lambda *args: calls.append(args) or build_results(*args),
+        )
+
+        first = processor.process_article("Cache title", "Same body text. " * 20)
+        first.entities["PERSON"].append("Mutated")
+        second = processor.process_article("Cache title", "Same body text. " * 20)
+
+        assert len(calls) == 1
+        assert second.summary == first.summary
+        assert second.entities["PERSON"] == []
+
+
+class TestTextProcessor:
+    """Test cases for TextProcessor"""
+
+    def test_repeated_keywords_served_from_cache(self, monkeypatch):
+        """Test that identical text is analyzed once and results stay unshared"""
+        TextProcessor.clear_cache()
+        calls = []
+        extract = TextProcessor._extract_simple_keywords
+        monkeypatch.setattr(
+            TextProcessor,
+            "_extract_simple_keywords",
+            staticmethod(lambda *args: calls.append(args) or extract(*args)),
+        )
+
+        text = "Monsoon rainfall floods coastal districts as monsoon rainfall rises"
+        first = TextProcessor.extract_keywords(text, use_ai=False)
+        first.append("mutated")
+        second = TextProcessor.extract_keywords(text, use_ai=False)
+
+        assert len(calls) == 1
+        assert second[:2] == ["monsoon", "rainfall"]
+        assert "mutated" not in second
+
+    @pytest.mark.skipif(not SPACY_AVAILABLE, reason="spaCy not installed")
+    def test_ai_summary_keeps_original_order(self, nlp):
+        """Test that AI summaries are whole sentences in document order"""
+        content = (
+            "The city council approved the new transit budget on Monday. "
+            "Officials said the transit budget funds three new bus routes. "
+            "Residents had asked for more frequent buses for several years. "
+            "The first new routes are expected to open next spring."
+        )
+        doc = nlp(content, disable=["ner"])
+        summary = TextProcessor._summary_from_doc(doc, max_sentences=2)
+
+        sentences = [sent.text.strip() for sent in doc.sents]
+        chosen = [sentence for sentence in sentences if sentence in summary]
+        assert len(chosen) == 2
+        assert summary == " ".join(chosen)
+
 
 class TestURLValidator:
     """Test cases for URL validation"""
@@ -112,6 +524,67 @@ class TestURLValidator:
         for url in invalid_urls:
             assert not URLValidator.is_valid(url)
 
+    def test_blocked_domains(self):
+        """Test that blocked domains match whole labels only"""
+        assert not URLValidator.is_valid("https://facebook.com/page")
+        assert not URLValidator.is_valid("https://m.facebook.com/page")
+        assert not URLValidator.is_valid("https://WWW.YouTube.com:443/watch")
+        assert URLValidator.is_valid("https://notfacebook.com/page")
+        assert not URLValidator.is_valid("https://facebook.com./page")
+        assert not URLValidator.is_valid("https://m.facebook.com./page")
+
+    def test_blocked_domains_follow_class_configuration(self, monkeypatch):
+        """Test that subclasses and runtime edits of BLOCKED_DOMAINS apply"""
+
+        class StrictValidator(URLValidator):
+            BLOCKED_DOMAINS = URLValidator.BLOCKED_DOMAINS + ["example.net"]
+
+        assert not StrictValidator.is_valid("https://news.example.net/a")
+        assert URLValidator.is_valid("https://news.example.net/a")
+
+        monkeypatch.setattr(URLValidator, "BLOCKED_DOMAINS", ["example.org"])
+        assert not URLValidator.is_valid("https://example.org/a")
+        assert URLValidator.is_valid("https://facebook.com/a")
+
+
+class TestNewsSearcher:
+    """Test cases for news search results"""
+
+    def test_mixed_dates_sort_together(self):
+        """Test that relative and absolute search dates are comparable"""
+        dates = [
+            "2 hours ago",
+            "11/20/2024, 03:33 PM, +0000 UTC",
+            "11/21/2024, 10:00 AM",
+            "1 day ago",
+        ]
+        results = [
+            NewsSearchResult(
+                title=date,
+                url=f"https://example.com/{i}",
+                published_date=_parse_serp_date(date),
+            )
+            for i, date in enumerate(dates)
+        ]
+        results.append(
+            NewsSearchResult(title="undated", url="https://example.com/undated")
+        )
+
+        ordered = sorted(
+            results, key=lambda result: result.published_date, reverse=True
+        )
+
+        assert all(
+            result.published_date.utcoffset().total_seconds() == 0 for result in results
+        )
+        assert [result.title for result in ordered] == [
+            "undated",
+            "2 hours ago",
+            "1 day ago",
+            "11/21/2024, 10:00 AM",
+            "11/20/2024, 03:33 PM, +0000 UTC",
+        ]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -6,13 +6,19 @@ Advanced text processing with spaCy AI models for better extraction and summariz
 """
 
 import hashlib
+import heapq
+import os
 import time
 import re
 import string
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional
-from collections import Counter
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 import logging
+import threading
 
 # Import spaCy for advanced NLP features
 try:
@@ -25,12 +31,149 @@ except ImportError:
     STOP_WORDS = set()
 
 
+# Keywords are scored from the opening of an article only. Truncating the
+# text, rather than parsing everything and scoring a leading token Span, keeps
+# the parse itself short; slicing a text already within the limit is free.
+_MAX_KEYWORD_CHARS = 5000
+
+
+# Components summaries never read; keywords use the whole pipeline (entities,
+# noun chunks from the parser, POS tags and lemmas)
+_SUMMARY_DISABLED = ("ner",)
+
+
+# Sentence boundaries for the first-sentences summary fallback
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+
+
+# Words and stop words for the frequency-based keyword fallback
+_SIMPLE_WORD_RE = re.compile(r"\b[a-zA-Z]{4,}\b")
+_SIMPLE_STOP_WORDS = frozenset(
+    {
+        "this",
+        "that",
+        "with",
+        "have",
+        "will",
+        "from",
+        "they",
+        "know",
+        "want",
+        "been",
+        "good",
+        "much",
+        "some",
+        "time",
+        "very",
+        "when",
+        "come",
+        "here",
+        "just",
+        "like",
+        "long",
+        "make",
+        "many",
+        "over",
+        "such",
+        "take",
+        "than",
+        "them",
+        "well",
+        "were",
+        "what",
+        "your",
+    }
+)
+
+
+# Default TextProcessor mode: with NEWSEXTRACTOR_LAZY_AI=1, calls that leave
+# use_ai unset take the regex path ("ingest") instead of spaCy ("query")
+LAZY_AI = os.environ.get("NEWSEXTRACTOR_LAZY_AI", "0") == "1"
+_TEXT_MODES = ("ingest", "query")
+
+
+# Process-wide LRU of keyword and summary results, keyed by a digest of the
+# text so retried or re-translated articles are analyzed once
+_RESULT_CACHE_SIZE = 256
+_result_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _result_key(kind: str, text: str, *options) -> tuple:
+    """Cache key for a result of kind over text; long texts are digested"""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    return (kind, digest) + options
+
+
+def _result_cache_get(key: tuple) -> Any:
+    """Return the cached result for key, or None"""
+    with _result_cache_lock:
+        cached = _result_cache.get(key)
+        if cached is not None:
+            _result_cache.move_to_end(key)
+        return cached
+
+
+def _result_cache_put(key: tuple, result: Any):
+    """Store an immutable result under key, evicting the oldest entry"""
+    with _result_cache_lock:
+        _result_cache[key] = result
+        if len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
+def _get_nlp():
+    """
+    Load the English spaCy model once per process
+
+    Returns:
+        spacy.language.Language: The shared pipeline
+
+    Raises:
+        OSError: If the model is not installed
+    """
+    return spacy.load("en_core_web_sm")
+
+
 class TextProcessor:
     """Text processing utilities"""
 
+    # "ingest" resolves an unset use_ai to the regex path, "query" to spaCy
+    mode = "ingest" if LAZY_AI else "query"
+
+    @classmethod
+    def set_mode(cls, mode: str):
+        """
+        Choose how calls that leave use_ai unset are processed
+
+        Args:
+            mode (str): "ingest" for fast regex extraction (bulk pipelines) or
+                "query" for spaCy-based extraction (on-demand requests)
+
+        Raises:
+            ValueError: If mode is not "ingest" or "query"
+        """
+        if mode not in _TEXT_MODES:
+            raise ValueError(f"Unknown TextProcessor mode: {mode!r}")
+        cls.mode = mode
+
+    @classmethod
+    def _resolve_use_ai(cls, use_ai: Optional[bool]) -> bool:
+        """Apply the current mode to an unset use_ai and check spaCy is present"""
+        if use_ai is None:
+            use_ai = cls.mode == "query"
+        return use_ai and SPACY_AVAILABLE
+
+    @staticmethod
+    def clear_cache():
+        """Drop all cached keyword and summary results"""
+        with _result_cache_lock:
+            _result_cache.clear()
+
     @staticmethod
     def extract_keywords(
-        text: str, max_keywords: int = 10, use_ai: bool = True
+        text: str, max_keywords: int = 10, use_ai: Optional[bool] = None
     ) -> List[str]:
         """
         Extract important keywords from content using AI models
@@ -38,7 +181,8 @@ class TextProcessor:
         Args:
             text (str): Text content
             max_keywords (int): Maximum number of keywords to extract
-            use_ai (bool): Whether to use AI-based extraction
+            use_ai (Optional[bool]): Whether to use AI-based extraction;
+                None follows the current mode
 
         Returns:
             List[str]: List of extracted keywords
@@ -46,66 +190,81 @@ class TextProcessor:
         if not text:
             return []
 
-        if use_ai and SPACY_AVAILABLE:
-            return TextProcessor._extract_ai_keywords(text, max_keywords)
+        use_ai = TextProcessor._resolve_use_ai(use_ai)
+        key = _result_key("keywords", text, max_keywords, use_ai)
+        cached = _result_cache_get(key)
+        if cached is not None:
+            return list(cached)
+
+        if use_ai:
+            keywords = TextProcessor._extract_ai_keywords(text, max_keywords)
         else:
-            return TextProcessor._extract_simple_keywords(text, max_keywords)
+            keywords = TextProcessor._extract_simple_keywords(text, max_keywords)
+
+        _result_cache_put(key, tuple(keywords))
+        return keywords
 
     @staticmethod
-    def _extract_ai_keywords(content: str, max_keywords: int = 10) -> List[str]:
-        """Extract keywords using spaCy AI models"""
+    def extract_keywords_batch(
+        texts: List[str],
+        max_keywords: int = 10,
+        use_ai: Optional[bool] = None,
+        batch_size: int = 32,
+        n_process: int = 1,
+    ) -> List[List[str]]:
+        """
+        Extract keywords from many texts, parsing them in spaCy batches
+
+        Args:
+            texts (List[str]): Text contents
+            max_keywords (int): Maximum number of keywords per text
+            use_ai (Optional[bool]): Whether to use AI-based extraction;
+                None follows the current mode
+            batch_size (int): Number of texts spaCy parses per batch
+            n_process (int): Worker processes for spaCy (-1 for all CPUs)
+
+        Returns:
+            List[List[str]]: Keywords for each text, in input order
+        """
+        if not TextProcessor._resolve_use_ai(use_ai):
+            return [
+                TextProcessor.extract_keywords(text, max_keywords, use_ai=False)
+                for text in texts
+            ]
+
         try:
-            nlp = spacy.load("en_core_web_sm")
-            doc = nlp(content[:5000])  # Limit content length for performance
-
-            # Extract entities and important terms
-            keywords = set()
-
-            # Add named entities
-            for ent in doc.ents:
-                if (
-                    ent.label_ in ["PERSON", "ORG", "GPE", "EVENT", "PRODUCT"]
-                    and len(ent.text) > 2
-                ):
-                    keywords.add(ent.text.lower().strip())
-
-            # Add important noun phrases
-            for chunk in doc.noun_chunks:
-                chunk_text = chunk.text.strip()
-                if (
-                    2 <= len(chunk_text.split()) <= 3
-                ):  # Keep phrases short but meaningful
-                    keywords.add(chunk_text.lower())
-
-            # Add important single words
-            word_scores = {}
-            for token in doc:
-                if (
-                    token.pos_ in ["NOUN", "PROPN", "ADJ"]
-                    and not token.is_stop
-                    and not token.is_punct
-                    and len(token.lemma_) > 2
-                ):
-
-                    # Score based on TF-IDF-like approach
-                    score = 1.0
-                    if token.pos_ == "PROPN":  # Proper nouns are more important
-                        score *= 2.0
-                    if token.ent_type_:  # Entities are important
-                        score *= 1.5
-
-                    word_scores[token.lemma_.lower()] = score
-
-            # Combine and sort
-            all_keywords = list(keywords) + list(word_scores.keys())
-            keyword_scores = {
-                kw: word_scores.get(kw, 1.0) for kw in all_keywords if kw.strip()
-            }
-
-            sorted_keywords = sorted(
-                keyword_scores.items(), key=lambda x: x[1], reverse=True
+            nlp = _get_nlp()
+            # Empty texts are not parsed
+            docs = nlp.pipe(
+                (text[:_MAX_KEYWORD_CHARS] for text in texts if text),
+                batch_size=batch_size,
+                n_process=n_process,
+            )
+            return [
+                (
+                    TextProcessor._keywords_from_doc(next(docs), max_keywords)
+                    if text
+                    else []
+                )
+                for text in texts
+            ]
+
+        except Exception as e:
+            logging.warning(
+                f"AI keyword extraction failed: {e}. Falling back to simple method."
             )
-            return [kw for kw, score in sorted_keywords[:max_keywords]]
+            return [
+                TextProcessor.extract_keywords(text, max_keywords, use_ai=False)
+                for text in texts
+            ]
+
+    @staticmethod
+    def _extract_ai_keywords(content: str, max_keywords: int = 10) -> List[str]:
+        """Extract keywords using spaCy AI models from the opening of content"""
+        try:
+            nlp = _get_nlp()
+            doc = nlp(content[:_MAX_KEYWORD_CHARS])
+            return TextProcessor._keywords_from_doc(doc, max_keywords)
 
         except Exception as e:
             logging.warning(
@@ -113,61 +272,74 @@ class TextProcessor:
             )
             return TextProcessor._extract_simple_keywords(content, max_keywords)
 
+    @staticmethod
+    def _keywords_from_doc(doc, max_keywords: int = 10) -> List[str]:
+        """Score keywords from an already parsed spaCy document"""
+        # Extract entities and important terms
+        keywords = set()
+
+        # Add named entities
+        for ent in doc.ents:
+            if (
+                ent.label_ in ["PERSON", "ORG", "GPE", "EVENT", "PRODUCT"]
+                and len(ent.text) > 2
+            ):
+                keywords.add(ent.text.lower().strip())
+
+        # Add important noun phrases
+        for chunk in doc.noun_chunks:
+            chunk_text = chunk.text.strip()
+            if 2 <= len(chunk_text.split()) <= 3:  # Keep phrases short but meaningful
+                keywords.add(chunk_text.lower())
+
+        # Add important single words
+        word_scores = {}
+        for token in doc:
+            if (
+                token.pos_ in ["NOUN", "PROPN", "ADJ"]
+                and not token.is_stop
+                and not token.is_punct
+                and len(token.lemma_) > 2
+            ):
+
+                # Score based on TF-IDF-like approach
+                score = 1.0
+                if token.pos_ == "PROPN":  # Proper nouns are more important
+                    score *= 2.0
+                if token.ent_type_:  # Entities are important
+                    score *= 1.5
+
+                word_scores[token.lemma_.lower()] = score
+
+        # Combine and sort
+        all_keywords = list(keywords) + list(word_scores.keys())
+        keyword_scores = {
+            kw: word_scores.get(kw, 1.0) for kw in all_keywords if kw.strip()
+        }
+
+        # Partial selection of the top scores; ties keep insertion order as
+        # with a stable sort
+        top_keywords = heapq.nlargest(
+            max_keywords, keyword_scores.items(), key=itemgetter(1)
+        )
+        return [kw for kw, score in top_keywords]
+
     @staticmethod
     def _extract_simple_keywords(text: str, max_keywords: int = 10) -> List[str]:
         """Extract keywords using simple frequency analysis (fallback method)"""
         # Simple keyword extraction (can be improved with NLP)
-        words = re.findall(r"\b[a-zA-Z]{4,}\b", text.lower())
-
-        # Remove common stop words
-        stop_words = {
-            "this",
-            "that",
-            "with",
-            "have",
-            "will",
-            "from",
-            "they",
-            "know",
-            "want",
-            "been",
-            "good",
-            "much",
-            "some",
-            "time",
-            "very",
-            "when",
-            "come",
-            "here",
-            "just",
-            "like",
-            "long",
-            "make",
-            "many",
-            "over",
-            "such",
-            "take",
-            "than",
-            "them",
-            "well",
-            "were",
-            "what",
-            "your",
-        }
+        words = _SIMPLE_WORD_RE.findall(text.lower())
 
-        # Filter and count words
-        word_count = {}
-        for word in words:
-            if word not in stop_words and len(word) > 3:
-                word_count[word] = word_count.get(word, 0) + 1
+        # Count words that are not common stop words; the pattern already
+        # requires at least four letters
+        word_count = Counter(word for word in words if word not in _SIMPLE_STOP_WORDS)
 
         # Return top keywords
-        sorted_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, count in sorted_words[:max_keywords]]
+        return [word for word, count in word_count.most_common(max_keywords)]
 
     @staticmethod
     def generate_summary(
-        content: str, max_sentences: int = 3, use_ai: bool = True
+        content: str, max_sentences: int = 3, use_ai: Optional[bool] = None
     ) -> str:
         """
         Generate an intelligent summary from content using spaCy AI models
@@ -175,7 +347,8 @@ class TextProcessor:
         Args:
             content (str): Text content to summarize
             max_sentences (int): Maximum number of sentences in summary
-            use_ai (bool): Whether to use AI-based summarization
+            use_ai (Optional[bool]): Whether to use AI-based summarization;
+                None follows the current mode
 
         Returns:
             str: Generated summary
@@ -183,72 +356,81 @@ class TextProcessor:
         if not content:
             return ""
 
-        if use_ai and SPACY_AVAILABLE:
-            return TextProcessor._generate_ai_summary(content, max_sentences)
+        use_ai = TextProcessor._resolve_use_ai(use_ai)
+        key = _result_key("summary", content, max_sentences, use_ai)
+        cached = _result_cache_get(key)
+        if cached is not None:
+            return cached
+
+        if use_ai:
+            summary = TextProcessor._generate_ai_summary(content, max_sentences)
         else:
-            return TextProcessor._generate_simple_summary(content, max_sentences)
+            summary = TextProcessor._generate_simple_summary(content, max_sentences)
+
+        _result_cache_put(key, summary)
+        return summary
 
     @staticmethod
-    def _generate_ai_summary(content: str, max_sentences: int = 3) -> str:
-        """Generate AI-powered summary using spaCy"""
-        try:
-            # Load spaCy model
-            nlp = spacy.load("en_core_web_sm")
-            doc = nlp(content)
+    def generate_summary_batch(
+        contents: List[str],
+        max_sentences: int = 3,
+        use_ai: Optional[bool] = None,
+        batch_size: int = 32,
+        n_process: int = 1,
+    ) -> List[str]:
+        """
+        Generate summaries for many texts, parsing them in spaCy batches
+
+        Args:
+            contents (List[str]): Text contents to summarize
+            max_sentences (int): Maximum number of sentences per summary
+            use_ai (Optional[bool]): Whether to use AI-based summarization;
+                None follows the current mode
+            batch_size (int): Number of texts spaCy parses per batch
+            n_process (int): Worker processes for spaCy (-1 for all CPUs)
 
-            # Extract sentences and score them
-            sentences = [
-                sent.text.strip() for sent in doc.sents if len(sent.text.strip()) > 20
+        Returns:
+            List[str]: Summary for each text, in input order
+        """
+        if not TextProcessor._resolve_use_ai(use_ai):
+            return [
+                TextProcessor.generate_summary(content, max_sentences, use_ai=False)
+                for content in contents
             ]
-            if not sentences:
-                return ""
-
-            # Score sentences based on keyword frequency, position, and length
-            sentence_scores = {}
-            word_frequencies = TextProcessor._calculate_word_frequencies(doc)
-
-            for i, sentence in enumerate(sentences):
-                sent_doc = nlp(sentence)
-                score = 0
-                word_count = 0
-
-                # Score based on important words
-                for token in sent_doc:
-                    if (
-                        not token.is_stop
-                        and not token.is_punct
-                        and token.lemma_ in word_frequencies
-                    ):
-                        score += word_frequencies[token.lemma_]
-                        word_count += 1
-
-                # Normalize by word count
-                if word_count > 0:
-                    score = score / word_count
-
-                # Boost score for early sentences (position importance)
-                position_factor = 1.0 - (i / len(sentences)) * 0.3
-                score *= position_factor
-
-                # Penalize very short or very long sentences
-                length_factor = min(1.0, len(sentence.split()) / 20)
-                score *= length_factor
-
-                sentence_scores[sentence] = score
-
-            # Select top sentences
-            top_sentences = sorted(
-                sentence_scores.items(), key=lambda x: x[1], reverse=True
+
+        try:
+            nlp = _get_nlp()
+            docs = nlp.pipe(
+                (content for content in contents if content),
+                batch_size=batch_size,
+                disable=_SUMMARY_DISABLED,
+                n_process=n_process,
             )
-            summary_sentences = [sent[0] for sent in top_sentences[:max_sentences]]
+            return [
+                (
+                    TextProcessor._summary_from_doc(next(docs), max_sentences)
+                    if content
+                    else ""
+                )
+                for content in contents
+            ]
 
-            # Maintain original order
-            ordered_summary = []
-            for sentence in sentences:
-                if sentence in summary_sentences:
-                    ordered_summary.append(sentence)
+        except Exception as e:
+            logging.warning(
+                f"AI summarization failed: {e}. Falling back to simple method."
+            )
+            return [
+                TextProcessor.generate_summary(content, max_sentences, use_ai=False)
+                for content in contents
+            ]
 
-            return " ".join(ordered_summary)
+    @staticmethod
+    def _generate_ai_summary(content: str, max_sentences: int = 3) -> str:
+        """Generate AI-powered summary using spaCy"""
+        try:
+            nlp = _get_nlp()
+            doc = nlp(content, disable=_SUMMARY_DISABLED)
+            return TextProcessor._summary_from_doc(doc, max_sentences)
 
         except Exception as e:
             logging.warning(
@@ -256,30 +438,86 @@ class TextProcessor:
             )
             return TextProcessor._generate_simple_summary(content, max_sentences)
 
+    @staticmethod
+    def _summary_from_doc(doc, max_sentences: int = 3) -> str:
+        """Select summary sentences from an already parsed spaCy document"""
+        # Extract sentences and score them; the sentence spans already
+        # carry parsed tokens, so sentences are not parsed a second time
+        sents = [sent for sent in doc.sents if len(sent.text.strip()) > 20]
+        sentences = [sent.text.strip() for sent in sents]
+        if not sentences:
+            return ""
+
+        # Score sentences based on keyword frequency, position, and length;
+        # token attributes are read once for the whole document and each
+        # sentence scores its slice of the resulting lemma list
+        sentence_scores = {}
+        lemmas = TextProcessor._content_lemmas(doc)
+        word_frequencies = TextProcessor._calculate_word_frequencies(lemmas)
+
+        for i, (sent, sentence) in enumerate(zip(sents, sentences)):
+            # Score based on important words, normalized by word count
+            weights = [
+                word_frequencies[lemma]
+                for lemma in lemmas[sent.start : sent.end]
+                if lemma is not None
+            ]
+            score = sum(weights) / len(weights) if weights else 0
+
+            # Boost score for early sentences (position importance)
+            position_factor = 1.0 - (i / len(sentences)) * 0.3
+            score *= position_factor
+
+            # Penalize very short or very long sentences
+            length_factor = min(1.0, len(sentence.split()) / 20)
+            score *= length_factor
+
+            sentence_scores[sentence] = score
+
+        # Select top sentences
+        top_sentences = heapq.nlargest(
+            max_sentences, sentence_scores.items(), key=itemgetter(1)
+        )
+        summary_sentences = {sent[0] for sent in top_sentences}
+
+        # Maintain original order
+        ordered_summary = [
+            sentence for sentence in sentences if sentence in summary_sentences
+        ]
+
+        return " ".join(ordered_summary)
+
     @staticmethod
     def _generate_simple_summary(content: str, max_sentences: int = 3) -> str:
         """Generate a simple summary from content (fallback method)"""
-        sentences = re.split(r"[.!?]+", content)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+        # Strip each piece once and stop after the first few long sentences
+        sentences = (s.strip() for s in _SENTENCE_SPLIT_RE.split(content))
+        summary_sentences = list(
+            islice((s for s in sentences if len(s) > 20), max_sentences)
+        )
 
-        if not sentences:
+        if not summary_sentences:
             return ""
 
-        # Take first few sentences as summary
-        summary_sentences = sentences[:max_sentences]
         return ". ".join(summary_sentences) + "."
 
     @staticmethod
-    def _calculate_word_frequencies(doc) -> Dict[str, float]:
+    def _content_lemmas(doc) -> List[Optional[str]]:
+        """Lemma of each content token in a document, None for the rest"""
+        return [
+            (
+                token.lemma_
+                if not token.is_stop and not token.is_punct and len(token.lemma_) > 2
+                else None
+            )
+            for token in doc
+        ]
+
+    @staticmethod
+    def _calculate_word_frequencies(lemmas: List[Optional[str]]) -> Dict[str, float]:
         """Calculate word frequencies for AI summarization"""
-        word_freq = {}
-        for token in doc:
-            if not token.is_stop and not token.is_punct and len(token.lemma_) > 2:
-                word_freq[token.lemma_] = word_freq.get(token.lemma_, 0) + 1
+        word_freq = Counter(lemma for lemma in lemmas if lemma is not None)
 
         # Normalize frequencies
         max_freq = max(word_freq.values()) if word_freq else 1
-        for word in word_freq:
-            word_freq[word] = word_freq[word] / max_freq
-
-        return word_freq
+        return {word: count / max_freq for word, count in word_freq.items()}
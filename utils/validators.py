@@ -1,6 +1,27 @@
 import re
-from urllib.parse import urlparse
-from typing import List
+from functools import lru_cache
+from typing import FrozenSet, List, Tuple
+
+# Scheme and host (with any userinfo and port) of an absolute URL
+_URL_RE = re.compile(r"^([a-z][a-z0-9+.-]*)://([^/?#\s]+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=16)
+def _blocked_lookup(domains: Tuple[str, ...]) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """
+    Build the exact-match set and dot-prefixed suffixes for blocked domains
+
+    Suffixes carry the leading dot, so "m.facebook.com" is blocked but
+    "notfacebook.com" is not.
+
+    Args:
+        domains (Tuple[str, ...]): Blocked domain names
+
+    Returns:
+        Tuple[FrozenSet[str], Tuple[str, ...]]: Exact domains and suffixes
+    """
+    exact = frozenset(domain.lower() for domain in domains)
+    return exact, tuple(f".{domain}" for domain in exact)
 
 
 class URLValidator:
@@ -23,31 +44,22 @@ class URLValidator:
     @classmethod
     def is_valid(cls, url: str) -> bool:
         """Check if URL is valid for news extraction"""
-        try:
-            if not url or not isinstance(url, str):
-                return False
-
-            parsed = urlparse(url)
-
-            # Check scheme
-            if parsed.scheme not in cls.VALID_SCHEMES:
-                return False
-
-            # Check domain
-            if not parsed.netloc:
-                return False
-
-            # Check if domain is blocked
-            domain = parsed.netloc.lower()
-            for blocked in cls.BLOCKED_DOMAINS:
-                if blocked in domain:
-                    return False
-
-            return True
+        if not url or not isinstance(url, str):
+            return False
 
-        except Exception:
+        # Scheme and non-empty host in one match, without a full urlparse
+        match = _URL_RE.match(url)
+        if not match or match.group(1).lower() not in cls.VALID_SCHEMES:
             return False
 
+        # Drop any userinfo, port and fully-qualified trailing dot, then block
+        # the domain and its subdomains; the lookup is rebuilt only when
+        # BLOCKED_DOMAINS changes (subclasses, runtime edits)
+        host = match.group(2).rpartition("@")[2].partition(":")[0].lower()
+        host = host.rstrip(".")
+        exact, suffixes = _blocked_lookup(tuple(cls.BLOCKED_DOMAINS))
+        return not (host in exact or host.endswith(suffixes))
+
     def validate(self, url: str) -> bool:
         """Instance method for backwards compatibility"""
         return self.is_valid(url)